@@ -6,11 +6,12 @@
 Usage:
     python Examples/display_position.py --port COM5 --joints 1,2,3
     python Examples/display_position.py --port /dev/ttyUSB0 --joints 1,2,3,4,5,6
+    python Examples/display_position.py --port /dev/ttyUSB0 --joints 1,2,3 --hz 50
 """
 
 import argparse
 
-from pydynamixel import DynamixelBus, ServoChain
+from pydynamixel import DynamixelBus, ServoChain, registers
 
 
 def parse_args():
@@ -24,6 +25,7 @@ def parse_args():
         default="1,2,3,4,5,6,7",
         help="Comma-separated servo IDs to monitor (default: 1,2,3,4,5,6,7).",
     )
+    parser.add_argument("--hz", type=float, help="Stream positions continuously at this rate instead of on ENTER.")
     return parser.parse_args()
 
 
@@ -40,13 +42,27 @@ def display_position(servo_chain, joints):
         print(vector)
 
 
+def stream_position(servo_chain, joints, hz):
+    """Print joint positions at a fixed rate until interrupted."""
+    try:
+        for sample in servo_chain.stream(joints, hz=hz):
+            positions = [sample.values[joint][registers.PRESENT_POSITION] for joint in joints]
+            overrun = f" (missed {sample.missed})" if sample.overrun else ""
+            print(f"{sample.timestamp:.3f} {positions}{overrun}")
+    except KeyboardInterrupt:
+        pass
+
+
 def main():
     """Run interactive joint position display."""
     args = parse_args()
     joints = [int(item.strip()) for item in args.joints.split(",") if item.strip()]
     bus = DynamixelBus.from_url(args.port, baudrate=args.baudrate, timeout=args.timeout, verbose=False, attempts=3)
     servo_chain = ServoChain(bus)
-    display_position(servo_chain, joints)
+    if args.hz:
+        stream_position(servo_chain, joints, args.hz)
+    else:
+        display_position(servo_chain, joints)
 
 
 if __name__ == "__main__":
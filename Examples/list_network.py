@@ -47,14 +47,15 @@ def main():
     print("---+-------+----+---------------+--------")
 
     for servo_id in servo_ids:
-        servo = bus.servo(servo_id)
         try:
+            # One READ_DATA of the whole control table per servo.
+            snapshot = bus.servo(servo_id).snapshot(eeprom=True)
             print(
                 f"{servo_id:>2} | "
-                f"{servo.model_number:>5} | "
-                f"{servo.version:>2} | "
-                f"{servo.present_voltage:>13} | "
-                f"{servo.present_temperature:>6}"
+                f"{snapshot.model_number:>5} | "
+                f"{snapshot.version:>2} | "
+                f"{snapshot.present_voltage:>13} | "
+                f"{snapshot.present_temperature:>6}"
             )
         except Exception as exc:
             # Continue listing remaining devices if one read fails.
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Benchmark bus transaction latency and throughput.
+
+Runs against the in-process `BusSimulator` by default, or against real
+hardware with `--port`. Results are written as JSON (p50/p95/p99 latency and
+operations per second per case); `--baseline` compares against a previous
+run and exits non-zero when a case regressed.
+
+Usage:
+    python benchmarks/bus_throughput.py
+    python benchmarks/bus_throughput.py --wire-time --joints 18 --output bench.json
+    python benchmarks/bus_throughput.py --wire-time --metrics
+    python benchmarks/bus_throughput.py --baseline bench.json --max-regression 0.2
+    python benchmarks/bus_throughput.py --port /dev/ttyUSB0 --joints 1,2,3
+"""
+
+import argparse
+import io
+import json
+import platform
+import sys
+import time
+
+import pydynamixel
+from pydynamixel import BusMetrics, BusSimulator, DynamixelBus, ServoChain, dynamixel, packets, registers
+from pydynamixel.decoder import StatusDecoder
+
+
+def parse_args():
+    """Parse command-line arguments for the benchmark run."""
+    parser = argparse.ArgumentParser(description="Measure Dynamixel bus latency and throughput.")
+    parser.add_argument("--port", help="Serial port of a real bus (default: simulated bus).")
+    parser.add_argument("--baudrate", type=int, default=1_000_000, help="Bus baudrate (default: 1000000).")
+    parser.add_argument("--timeout", type=float, default=0.1, help="Read timeout in seconds (default: 0.1).")
+    parser.add_argument(
+        "--joints",
+        default="6",
+        help="Number of simulated joints, or comma-separated IDs for a real bus (default: 6).",
+    )
+    parser.add_argument("--iterations", type=int, default=1000, help="Iterations per case (default: 1000).")
+    parser.add_argument("--wire-time", action="store_true", help="Model wire time and return delay in the simulator.")
+    parser.add_argument("--metrics", action="store_true", help="Attach BusMetrics and include per-phase timings in the report.")
+    parser.add_argument("--output", help="Write JSON results to this file instead of stdout.")
+    parser.add_argument("--baseline", help="Previous JSON results to compare p50 latencies against.")
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=0.2,
+        help="Allowed relative p50 slowdown against the baseline (default: 0.2).",
+    )
+    return parser.parse_args()
+
+
+def percentile(sorted_samples, fraction):
+    """Return the nearest-rank percentile of already sorted samples."""
+    index = min(len(sorted_samples) - 1, max(0, int(round(fraction * len(sorted_samples) + 0.5)) - 1))
+    return sorted_samples[index]
+
+
+def measure(name, func, iterations, ops_per_call=1):
+    """Time `func` `iterations` times and summarize the latencies."""
+    func()  # Warm-up.
+    samples = []
+    clock = time.perf_counter
+    start = clock()
+    for _ in range(iterations):
+        t0 = clock()
+        func()
+        samples.append(clock() - t0)
+    total = clock() - start
+    samples.sort()
+    return {
+        "name": name,
+        "iterations": iterations,
+        "mean_us": total / iterations * 1e6,
+        "p50_us": percentile(samples, 0.50) * 1e6,
+        "p95_us": percentile(samples, 0.95) * 1e6,
+        "p99_us": percentile(samples, 0.99) * 1e6,
+        "ops_per_sec": iterations * ops_per_call / total if total else 0.0,
+    }
+
+
+def codec_cases(iterations, joints):
+    """Packet encode/decode cases that do not touch a port."""
+    vector = [(joint, 512, 100) for joint in joints]
+    status = packets.get_packet([1, 4, 0, 0x00, 0x02])
+    stream = io.BytesIO()
+
+    def get_response():
+        stream.seek(0)
+        stream.write(status)
+        stream.seek(0)
+        dynamixel.get_response(stream)
+
+    def sync_move():
+        # Same encode path as `dynamixel.sync_move`: cached template, words patched in.
+        template = packets.get_sync_write_template(registers.GOAL_POSITION, 4, [row[0] for row in vector])
+        template.encode_words([row[1:] for row in vector])
+
+    def decoder_feed():
+        StatusDecoder().feed(status)
+
+    return [
+        measure("encode.read_packet", lambda: packets.get_read_packet(5, registers.PRESENT_POSITION, 2), iterations),
+        measure("encode.write_packet_2b", lambda: packets.get_write_packet_2b(5, registers.GOAL_POSITION, 512), iterations),
+        measure(f"encode.sync_move[{len(joints)}]", sync_move, iterations),
+        measure("decode.decoder_feed", decoder_feed, iterations),
+        measure("decode.get_response", get_response, iterations),
+    ]
+
+
+def bus_cases(bus, joints, iterations):
+    """Cases that exchange packets over the bus."""
+    chain = ServoChain(bus)
+    first = joints[0]
+    vector = [(joint, 512, 100) for joint in joints]
+    scan_iterations = max(1, iterations // 100)
+    return [
+        measure("bus.ping", lambda: bus.ping(first), iterations),
+        measure("bus.read_word", lambda: bus.read_word(first, registers.PRESENT_POSITION), iterations),
+        measure("bus.write_word", lambda: bus.write_word(first, registers.MOVING_SPEED, 100), iterations),
+        measure(f"chain.read_position[{len(joints)}]", lambda: chain.read_position(joints), iterations, len(joints)),
+        measure(f"chain.move_to_vector[{len(joints)}]", lambda: chain.move_to_vector(vector), iterations),
+        measure(
+            f"chain.move_to_vector_reg_write[{len(joints)}]",
+            lambda: chain.move_to_vector(vector, sync_write=False),
+            max(1, iterations // 10),
+        ),
+        measure(f"bus.snapshot[{len(joints)}]", lambda: bus.snapshot(joints), max(1, iterations // 10), len(joints)),
+        measure("bus.scan", lambda: bus.scan(), scan_iterations),
+    ]
+
+
+def compare(results, baseline_path, max_regression):
+    """Print cases whose p50 latency regressed against a baseline; return True if any did."""
+    with open(baseline_path, "r", encoding="utf-8") as handle:
+        baseline = {case["name"]: case for case in json.load(handle)["results"]}
+    regressed = False
+    for case in results:
+        previous = baseline.get(case["name"])
+        if previous is None or previous["p50_us"] <= 0:
+            continue
+        change = case["p50_us"] / previous["p50_us"] - 1.0
+        if change > max_regression:
+            regressed = True
+            print(f"REGRESSION {case['name']}: p50 {previous['p50_us']:.1f} -> {case['p50_us']:.1f} us ({change:+.0%})", file=sys.stderr)
+    return regressed
+
+
+def main():
+    """Run all benchmark cases and emit JSON results."""
+    args = parse_args()
+
+    if args.port:
+        joints = [int(item.strip()) for item in args.joints.split(",") if item.strip()]
+        bus = DynamixelBus.from_url(args.port, baudrate=args.baudrate, timeout=args.timeout, verbose=False, attempts=3)
+    else:
+        joints = list(range(1, int(args.joints) + 1))
+        port = BusSimulator(ids=joints, baudrate=args.baudrate, timeout=args.timeout, wire_time=args.wire_time)
+        bus = DynamixelBus(port, verbose=False, attempts=3)
+    if args.metrics:
+        bus.observer = BusMetrics()
+
+    results = codec_cases(args.iterations, joints) + bus_cases(bus, joints, args.iterations)
+    report = {
+        "meta": {
+            "pydynamixel": pydynamixel.__version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "port": args.port or "simulator",
+            "wire_time": bool(args.wire_time and not args.port),
+            "baudrate": args.baudrate,
+            "joints": joints,
+            "timestamp": time.time(),
+        },
+        "results": results,
+    }
+    if args.metrics:
+        report["metrics"] = bus.observer.export()
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(text + "\n")
+    else:
+        print(text)
+
+    if args.baseline and compare(results, args.baseline, args.max_regression):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,11 +4,22 @@
 """PyDynamixel package."""
 
 from . import chain, dynamixel, packets, registers
+from .adaptive_timeout import TimeoutEstimator
+from .arbiter import PRIORITY
+from .async_bus import AsyncDynamixelBus
 from .ax12 import AX12
+from .bus_group import BusGroup
 from .dynamixel_bus import DynamixelBus
+from .instrumentation import BusMetrics, BusObserver
+from .link_optimizer import LinkOptimizer
+from .pose_library import PoseLibrary
+from .register_cache import RegisterCache
+from .retry import CircuitBreaker, RetryPolicy
 from .servo_chain import ServoChain
+from .simulator import BusSimulator
+from .trajectory import Trajectory
 
 __version__ = "1.2.0"
 
-__all__ = ["AX12", "DynamixelBus", "ServoChain", "chain", "dynamixel", "packets", "registers"]
+__all__ = ["AX12", "AsyncDynamixelBus", "BusGroup", "BusMetrics", "BusObserver", "BusSimulator", "CircuitBreaker", "DynamixelBus", "LinkOptimizer", "PRIORITY", "PoseLibrary", "RegisterCache", "RetryPolicy", "ServoChain", "TimeoutEstimator", "Trajectory", "chain", "dynamixel", "packets", "registers"]
 
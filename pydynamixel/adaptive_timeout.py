@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Per-servo response timeouts learned from measured round-trip times."""
+
+import math
+import threading
+from typing import Dict, Optional
+
+from . import registers, timing
+from .data import TransactionRecord
+from .instrumentation import BusObserver
+
+
+class TimeoutEstimator(BusObserver):
+    """Smoothed round-trip estimate per servo, turned into response timeouts.
+
+    Samples are the write-to-last-byte time of exchanges that succeeded on
+    their first attempt (retried exchanges are ambiguous and skipped). The
+    wire time of the request and status packet at the current baud rate and
+    the servo's RETURN_DELAY are subtracted from each sample, so what is
+    smoothed is the host/adapter overhead; timeouts add them back for the
+    exchange at hand. Smoothing follows the usual SRTT/RTTVAR scheme, and
+    each timeout on a servo doubles its next timeout until an exchange
+    succeeds. Servos without samples use `max_timeout`.
+    """
+
+    def __init__(
+        self,
+        max_timeout: Optional[float] = None,
+        min_timeout: float = 0.0005,
+        margin: float = 0.001,
+        k: float = 4.0,
+        alpha: float = 0.125,
+        beta: float = 0.25,
+        quantum: float = 0.0005,
+        shrink: float = 0.5,
+        shrink_after: int = 16,
+    ):
+        """Initialize an estimator without samples.
+
+        Args:
+            max_timeout: Upper bound and cold-start timeout in seconds; a bus
+                fills in its port's timeout when left as `None`.
+            min_timeout: Lower bound for any timeout, in seconds.
+            margin: Fixed slack added to every timeout, in seconds.
+            k: Weight of the round-trip deviation in the timeout.
+            alpha: Gain of the smoothed round-trip estimate.
+            beta: Gain of the round-trip deviation estimate.
+            quantum: Timeouts are rounded up to a multiple of this, so the port
+                is not reconfigured for every small change.
+            shrink: A bus raises its port timeout right away but lowers it only
+                after `shrink_after` consecutive exchanges needed less than
+                this fraction of it, so alternating servos and packet sizes
+                do not reconfigure the port on every exchange.
+            shrink_after: Exchanges in a row that must allow a lower timeout;
+                0 with `shrink=1` follows every change.
+        """
+        self.max_timeout = max_timeout
+        self.min_timeout = min_timeout
+        self.margin = margin
+        self.k = k
+        self.alpha = alpha
+        self.beta = beta
+        self.quantum = quantum
+        self.shrink = shrink
+        self.shrink_after = shrink_after
+        self.baudrate = registers.DEFAULT_BAUDRATE
+        self._lock = threading.Lock()
+        self._srtt: Dict[int, float] = {}
+        self._rttvar: Dict[int, float] = {}
+        self._samples: Dict[int, int] = {}
+        self._backoff: Dict[int, int] = {}
+        self._return_delays: Dict[int, int] = {}
+
+    def set_return_delay(self, servo_id: int, return_delay: int) -> None:
+        """Record the servo's RETURN_DELAY register value."""
+        self._return_delays[servo_id] = return_delay
+
+    def _fixed_time(self, servo_id, request_size, response_size):
+        return timing.packet_time(request_size + response_size, self.baudrate) + timing.return_delay_time(
+            self._return_delays.get(servo_id, registers.DEFAULT_VALUES[registers.RETURN_DELAY])
+        )
+
+    def timeout(
+        self,
+        servo_id: int,
+        request_size: int = timing.PING_PACKET_SIZE,
+        response_size: int = timing.STATUS_PACKET_SIZE,
+    ) -> float:
+        """Return the response timeout for the next exchange with `servo_id`, in seconds."""
+        ceiling = self.max_timeout if self.max_timeout is not None else registers.DEFAULT_TIMEOUT
+        with self._lock:
+            srtt = self._srtt.get(servo_id)
+            if srtt is None:
+                return ceiling
+            estimate = self._fixed_time(servo_id, request_size, response_size) + srtt + self.k * self._rttvar[servo_id]
+            estimate = (estimate + self.margin) * (2 ** self._backoff.get(servo_id, 0))
+        if self.quantum > 0:
+            estimate = math.ceil(estimate / self.quantum) * self.quantum
+        return min(ceiling, max(self.min_timeout, estimate))
+
+    def rtt(self, servo_id: int) -> Optional[float]:
+        """Return the smoothed round-trip time for a ping-sized exchange, or `None` without samples."""
+        srtt = self._srtt.get(servo_id)
+        if srtt is None:
+            return None
+        return srtt + self._fixed_time(servo_id, timing.PING_PACKET_SIZE, timing.STATUS_PACKET_SIZE)
+
+    def add_sample(self, servo_id: int, rtt: float, request_size: int, response_size: int) -> None:
+        """Fold one measured round trip (seconds) into the estimate for `servo_id`."""
+        excess = max(0.0, rtt - self._fixed_time(servo_id, request_size, response_size))
+        with self._lock:
+            srtt = self._srtt.get(servo_id)
+            if srtt is None:
+                self._srtt[servo_id] = excess
+                self._rttvar[servo_id] = excess / 2
+            else:
+                self._rttvar[servo_id] += self.beta * (abs(srtt - excess) - self._rttvar[servo_id])
+                self._srtt[servo_id] = srtt + self.alpha * (excess - srtt)
+            self._samples[servo_id] = self._samples.get(servo_id, 0) + 1
+            self._backoff.pop(servo_id, None)
+
+    def on_transaction(self, record: TransactionRecord) -> None:
+        servo_id = record.servo_id
+        if not record.expect_response or servo_id is None or servo_id == registers.BROADCAST_ID:
+            return
+        if record.timeouts and servo_id in self._srtt:
+            with self._lock:
+                self._backoff[servo_id] = min(6, self._backoff.get(servo_id, 0) + 1)
+        if record.ok and record.attempts == 1:
+            rtt = record.write + record.first_byte + record.read
+            self.add_sample(servo_id, rtt, record.bytes_sent, record.bytes_received)
+
+    def reset(self, servo_id: Optional[int] = None) -> None:
+        """Forget the estimate for one servo, or for all of them."""
+        with self._lock:
+            for table in (self._srtt, self._rttvar, self._samples, self._backoff):
+                if servo_id is None:
+                    table.clear()
+                else:
+                    table.pop(servo_id, None)
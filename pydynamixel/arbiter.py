@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Priority-ordered arbitration of a shared half-duplex bus."""
+
+import heapq
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
+from .data import WaitStats
+
+
+class PRIORITY:
+    """Request priority classes; lower values are served first."""
+
+    CONTROL = 0
+    NORMAL = 1
+    TELEMETRY = 2
+
+
+class BusArbiter:
+    """Reentrant lock that hands the bus to the highest-priority waiter.
+
+    Waiters of equal priority are served in arrival order. A thread that
+    already holds the arbiter can acquire it again, so composite operations
+    (e.g. staging several writes and an ACTION) can hold the bus across
+    exchanges made by nested calls.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition(threading.Lock())
+        self._owner = None
+        self._depth = 0
+        self._waiting = []
+        self._sequence = itertools.count()
+        self._stats: Dict[int, WaitStats] = {}
+
+    def acquire(self, priority: int = PRIORITY.NORMAL) -> None:
+        """Block until the calling thread owns the bus."""
+        me = threading.get_ident()
+        with self._condition:
+            if self._owner == me:
+                self._depth += 1
+                return
+            start = time.perf_counter()
+            ticket = (priority, next(self._sequence))
+            heapq.heappush(self._waiting, ticket)
+            try:
+                while self._owner is not None or self._waiting[0] != ticket:
+                    self._condition.wait()
+            except BaseException:
+                # Interrupted (e.g. KeyboardInterrupt): withdraw the ticket so
+                # it does not block the waiters queued behind it.
+                self._waiting.remove(ticket)
+                heapq.heapify(self._waiting)
+                self._condition.notify_all()
+                raise
+            heapq.heappop(self._waiting)
+            self._owner = me
+            self._depth = 1
+            self._stats.setdefault(priority, WaitStats()).add(time.perf_counter() - start)
+
+    def release(self) -> None:
+        """Release one level of ownership; the bus is freed at the outermost level."""
+        with self._condition:
+            if self._owner != threading.get_ident():
+                raise RuntimeError("Bus arbiter released by a thread that does not own it.")
+            self._depth -= 1
+            if self._depth == 0:
+                self._owner = None
+                self._condition.notify_all()
+
+    @contextmanager
+    def hold(self, priority: int = PRIORITY.NORMAL) -> Iterator[None]:
+        """Own the bus for the duration of a `with` block."""
+        self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def stats(self) -> Dict[int, WaitStats]:
+        """Return a copy of the wait statistics per priority class."""
+        with self._condition:
+            return {priority: WaitStats(s.count, s.total_wait, s.max_wait) for priority, s in self._stats.items()}
+
+    def reset_stats(self) -> None:
+        """Clear the wait statistics."""
+        with self._condition:
+            self._stats.clear()
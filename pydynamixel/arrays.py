@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""NumPy array mode: preallocated chain state and vectorized pose encoding.
+
+Requires NumPy (`pip install pydynamixel[numpy]`); it is imported lazily so the
+rest of the package works without it.
+"""
+
+from typing import Sequence
+
+from . import registers
+
+# One READ_DATA span per joint: PRESENT_POSITION, SPEED, LOAD, VOLTAGE, TEMPERATURE.
+STATE_REGISTER = registers.PRESENT_POSITION
+STATE_FIELDS = (("position", "<u2"), ("speed", "<u2"), ("load", "<u2"), ("voltage", "u1"), ("temperature", "u1"))
+STATE_SIZE = 8
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError as exc:
+        raise ImportError("Array mode requires NumPy; install it with `pip install pydynamixel[numpy]`.") from exc
+    return numpy
+
+
+class ChainState:
+    """Present-state registers of a fixed list of joints in preallocated arrays.
+
+    Rows follow `ids`. The arrays are views into one structured array whose
+    rows have the control-table layout from PRESENT_POSITION, so each status
+    packet payload is copied into its row as is. Values are raw register
+    units, matching `ServoSnapshot`; see `sign_magnitude` for speed and load.
+    """
+
+    __slots__ = ("ids", "table", "timestamp", "_rows")
+
+    def __init__(self, ids: Sequence[int]):
+        np = _numpy()
+        self.ids = tuple(ids)
+        self.table = np.zeros(len(self.ids), dtype=np.dtype(list(STATE_FIELDS)))
+        self.timestamp = 0.0
+        self._rows = memoryview(self.table.view(np.uint8))
+
+    def store(self, index: int, payload) -> None:
+        """Copy one joint's `STATE_SIZE`-byte register payload into row `index`."""
+        offset = index * STATE_SIZE
+        self._rows[offset:offset + STATE_SIZE] = payload
+
+    @property
+    def positions(self):
+        return self.table["position"]
+
+    @property
+    def speeds(self):
+        return self.table["speed"]
+
+    @property
+    def loads(self):
+        return self.table["load"]
+
+    @property
+    def voltages(self):
+        return self.table["voltage"]
+
+    @property
+    def temperatures(self):
+        return self.table["temperature"]
+
+
+def sign_magnitude(values, sign_bit: int = 10):
+    """Convert raw sign-magnitude register values (speed, load) to signed integers."""
+    np = _numpy()
+    values = np.asarray(values, dtype=np.int64)
+    magnitude = values & ((1 << sign_bit) - 1)
+    return np.where(values & (1 << sign_bit), -magnitude, magnitude)
+
+
+def require_range(name: str, values, minimum: int, maximum: int):
+    """Return `values` as an array, raising `ValueError` if any is outside [minimum, maximum].
+
+    Floating-point values are rounded to the nearest integer first; NaN and
+    infinity are rejected.
+    """
+    np = _numpy()
+    values = np.asarray(values)
+    if values.dtype.kind == "f":
+        finite = np.isfinite(values)
+        if not finite.all():
+            raise ValueError(f"{name} must be in range [{minimum}, {maximum}], got {values[~finite].flat[0]}.")
+        values = np.rint(values)
+    if values.size and (values.min() < minimum or values.max() > maximum):
+        bad = (values < minimum) | (values > maximum)
+        raise ValueError(f"{name} must be in range [{minimum}, {maximum}], got {values[bad.argmax()]}.")
+    return values
+
+
+def encode_sync_move(template, positions, speeds):
+    """Validate goal positions and speeds and patch them into a SYNC_WRITE `template`.
+
+    `template` is the `packets.SyncWriteTemplate` for GOAL_POSITION, 4 bytes
+    per servo; `positions` and `speeds` have one entry per template ID.
+    Nothing is written if any value is out of range. Returns the shared buffer.
+    """
+    count = len(template.ids)
+    positions = require_range("position", positions, registers.POSITION_MIN, registers.POSITION_MAX)
+    speeds = require_range("velocity", speeds, registers.SPEED_MIN, registers.SPEED_MAX)
+    if positions.shape != (count,) or speeds.shape != (count,):
+        raise ValueError(f"positions and speeds must have shape ({count},), got {positions.shape} and {speeds.shape}.")
+
+    words = template.words
+    if words is None:
+        np = _numpy()
+        # Rows after the 7-byte header: ID followed by data_length bytes.
+        words = template.words = np.ndarray(
+            (count, template.data_length // 2), dtype="<u2", buffer=template.buffer, offset=8, strides=(template.data_length + 1, 2)
+        )
+    words[:, 0] = positions
+    words[:, 1] = speeds
+    return template._finish()
@@ -0,0 +1,423 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""asyncio bus controller for Dynamixel Protocol 1.0."""
+
+import asyncio
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from . import discovery, dynamixel, packets, registers, timing
+from .data import Response, ServoSnapshot
+from .decoder import StatusDecoder
+from .dynamixel import is_stale_response, require_range
+from .exceptions import ChecksumError, DynamixelFatalError, MoveTimeoutError, ReplayMismatchError
+
+
+class AsyncDynamixelBus:
+    """Coroutine counterpart of `DynamixelBus`.
+
+    Every exchange is queued and executed by one worker task, so concurrent
+    coroutines never interleave packets on the half-duplex link. The serial
+    port is switched to non-blocking mode; while a response is outstanding
+    the worker waits on the port's file descriptor (or polls when the port
+    has none) instead of blocking the event loop.
+    """
+
+    def __init__(
+        self,
+        serial_port,
+        verbose: bool = True,
+        attempts: int = 10,
+        timeout: Optional[float] = None,
+        poll_interval: float = 0.0005,
+        track_status_return: bool = True,
+    ):
+        """Initialize an async bus wrapper.
+
+        Args:
+            serial_port: Open pyserial-compatible port object; its timeout is set to 0.
+            verbose: Print retry diagnostics when communication fails.
+            attempts: Number of retries for request/response exchanges.
+            timeout: Response timeout in seconds; defaults to the port's timeout.
+            poll_interval: Sleep between reads for ports without a file descriptor.
+            track_status_return: Read each servo's STATUS_RETURN_LEVEL once per port and
+                skip waiting for status packets the servo will not send.
+        """
+        self.serial = serial_port
+        self.verbose = verbose
+        self.attempts = attempts
+        self.timeout = timeout if timeout is not None else (serial_port.timeout or registers.DEFAULT_TIMEOUT)
+        self.poll_interval = poll_interval
+        self.track_status_return = track_status_return
+        self._status_return_levels: Dict[int, int] = dynamixel.status_return_levels(serial_port)
+        serial_port.timeout = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._resync: Optional[float] = None
+
+    @classmethod
+    def from_url(cls, url: str, baudrate: int = registers.DEFAULT_BAUDRATE, timeout: float = registers.DEFAULT_TIMEOUT, verbose: bool = True, attempts: int = 10):
+        """Create an async bus from a serial URL path."""
+        serial_port = dynamixel.get_serial_for_url(url, baudrate=baudrate, timeout=timeout)
+        return cls(serial_port, verbose=verbose, attempts=attempts, timeout=timeout)
+
+    @classmethod
+    def from_com(cls, com: str, baudrate: int = registers.DEFAULT_BAUDRATE, timeout: float = registers.DEFAULT_TIMEOUT, verbose: bool = True, attempts: int = 10):
+        """Create an async bus from a COM device path."""
+        serial_port = dynamixel.get_serial_for_com(com, baudrate=baudrate, timeout=timeout)
+        return cls(serial_port, verbose=verbose, attempts=attempts, timeout=timeout)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self) -> None:
+        """Stop the worker task; the exchange in progress and all queued exchanges are cancelled."""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            while not self._queue.empty():
+                future = self._queue.get_nowait()[-1]
+                if not future.done():
+                    future.cancel()
+            self._worker = None
+            self._queue = None
+
+    # Transaction queue.
+
+    async def _submit(self, packet, servo_id=None, expect_response=True, timeout=None, attempts=None):
+        if self._worker is None:
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.get_running_loop().create_task(self._run())
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((packet, servo_id, expect_response, timeout, attempts, future))
+        return await future
+
+    async def _run(self):
+        while True:
+            packet, servo_id, expect_response, timeout, attempts, future = await self._queue.get()
+            if future.cancelled():
+                continue
+            try:
+                result = await self._exchange(packet, servo_id, expect_response, timeout, attempts)
+            except asyncio.CancelledError:
+                if not future.done():
+                    future.cancel()
+                raise
+            except Exception as exc:
+                if not future.cancelled():
+                    future.set_exception(exc)
+            else:
+                if not future.cancelled():
+                    future.set_result(result)
+
+    async def _exchange(self, packet, servo_id, expect_response, timeout, attempts) -> Optional[Response]:
+        if not expect_response:
+            self.serial.write(packet)
+            return None
+
+        timeout = self.timeout if timeout is None else timeout
+        attempts = self.attempts if attempts is None else attempts
+        parameter_count = dynamixel.expected_parameter_count(packet)
+        if self._resync is not None:
+            await self._drain(self._resync)
+        failed = False
+        try:
+            for i in range(attempts):
+                try:
+                    self.serial.write(packet)
+                    response = await asyncio.wait_for(self._read_response(servo_id, parameter_count), timeout)
+
+                    if response.error > 0:
+                        raise dynamixel.get_exception(response.error)
+                    return response
+                except (DynamixelFatalError, ReplayMismatchError):
+                    raise
+                except Exception as exc:
+                    failed = True
+                    if self.verbose:
+                        print(f"Got exception when waiting for response from {servo_id} on attempt {i + 1}: {exc!r}")
+
+            raise Exception(f"Unable to read response for servo {servo_id}")
+        finally:
+            if failed:
+                # A late reply to a failed attempt may still be on its way.
+                self._resync = asyncio.get_running_loop().time() + self._drain_window()
+
+    def _drain_window(self) -> float:
+        return timing.drain_window(getattr(self.serial, "baudrate", None) or registers.DEFAULT_BAUDRATE)
+
+    async def _drain(self, deadline: float) -> None:
+        """Discard input arriving before the event-loop time `deadline` (see `dynamixel.drain_serial`)."""
+        loop = asyncio.get_running_loop()
+        window = self._drain_window()
+        dynamixel.flush_serial(self.serial)
+        while True:
+            now = loop.time()
+            if getattr(self.serial, "in_waiting", 0):
+                dynamixel.flush_serial(self.serial)
+                deadline = max(deadline, now + window)
+            elif now >= deadline:
+                break
+            else:
+                await asyncio.sleep(min(self.poll_interval, deadline - now))
+        self._resync = None
+
+    async def _read_response(self, servo_id=None, parameter_count=None) -> Response:
+        decoder = StatusDecoder(emit_corrupt=True)
+        while True:
+            data = self.serial.read(decoder.bytes_needed())
+            if not data:
+                await self._wait_readable()
+                continue
+            for response in decoder.feed(data):
+                if not response.checksum_match:
+                    raise ChecksumError(f"Checksum mismatch in status packet from servo {response.servo_id}.")
+                if is_stale_response(response, servo_id, parameter_count):
+                    continue
+                return response
+
+    async def _wait_readable(self) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            fd = self.serial.fileno()
+        except Exception:
+            fd = None
+        if fd is not None:
+            ready = loop.create_future()
+            try:
+                loop.add_reader(fd, lambda: ready.done() or ready.set_result(None))
+            except (NotImplementedError, ValueError):
+                pass
+            else:
+                try:
+                    await ready
+                finally:
+                    loop.remove_reader(fd)
+                return
+        await asyncio.sleep(self.poll_interval)
+
+    # Bus API.
+
+    async def ping(self, servo_id: int) -> bool:
+        """Ping a single servo ID."""
+        try:
+            await self._submit(packets.get_ping_packet(servo_id), servo_id)
+            return True
+        except Exception:
+            return False
+
+    async def scan(self, begin_id: int = 0, end_id: int = 253, expected_count: Optional[int] = None, timeout: Optional[float] = None) -> List[int]:
+        """Ping a range of IDs with short probe timeouts and return responsive IDs."""
+        if timeout is None:
+            timeout = discovery.probe_timeout(getattr(self.serial, "baudrate", registers.DEFAULT_BAUDRATE))
+        found = []
+        for servo_id in range(begin_id, end_id + 1):
+            try:
+                await self._submit(packets.get_ping_packet(servo_id), servo_id, timeout=timeout, attempts=1)
+            except Exception:
+                continue
+            found.append(servo_id)
+            if expected_count is not None and len(found) >= expected_count:
+                break
+        return found
+
+    async def read_response(self, servo_id: int, register: int, num_bytes: int) -> Response:
+        """Read a servo register region and return the `Response`, for decoding with its accessors."""
+        response = await self._submit(packets.get_read_packet(servo_id, register, num_bytes), servo_id)
+        if len(response.payload) != num_bytes:
+            raise Exception(f"Read length mismatch (expected {num_bytes}, got {len(response.payload)}).")
+        return response
+
+    async def read_data(self, servo_id: int, register: int, num_bytes: int) -> List[int]:
+        """Read raw bytes from a servo register region."""
+        return (await self.read_response(servo_id, register, num_bytes)).data
+
+    async def read_byte(self, servo_id: int, register: int) -> int:
+        """Read one byte from a servo register."""
+        return (await self.read_response(servo_id, register, 1)).u8()
+
+    async def read_word(self, servo_id: int, register: int) -> int:
+        """Read one word from a servo register."""
+        return (await self.read_response(servo_id, register, 2)).u16()
+
+    async def snapshot(self, ids: Iterable[int], eeprom: bool = False) -> List[ServoSnapshot]:
+        """Read a control-table snapshot per servo, one READ_DATA exchange each."""
+        start = registers.EEPROM_START if eeprom else registers.RAM_START
+        snapshots = []
+        for servo_id in ids:
+            response = await self.read_response(servo_id, start, registers.CONTROL_TABLE_SIZE - start)
+            snapshots.append(ServoSnapshot.from_control_table(servo_id, response.payload, start))
+        return snapshots
+
+    def _track_written(self, servo_id: int, register: int, values: Sequence[int], deferred: bool) -> None:
+        """Follow writes that change a servo's ID or status return level."""
+        levels = self._status_return_levels
+        if register <= registers.STATUS_RETURN_LEVEL < register + len(values):
+            if deferred:
+                # Takes effect on ACTION; read the level again on the next write.
+                levels.pop(servo_id, None)
+                return
+            level = values[registers.STATUS_RETURN_LEVEL - register]
+            if servo_id == registers.BROADCAST_ID:
+                for known in levels:
+                    levels[known] = level
+            else:
+                levels[servo_id] = level
+        if not deferred and register <= registers.ID < register + len(values) and servo_id in levels:
+            levels[values[registers.ID - register]] = levels.pop(servo_id)
+
+    async def _expects_reply(self, servo_id: int, register: int, values: Sequence[int]) -> bool:
+        """Return True if a write to `servo_id` will be answered by a status packet."""
+        if servo_id == registers.BROADCAST_ID:
+            return False
+        if not self.track_status_return:
+            return True
+        if register <= registers.STATUS_RETURN_LEVEL < register + len(values):
+            # The status packet for this write follows the level being written.
+            level = values[registers.STATUS_RETURN_LEVEL - register]
+        else:
+            try:
+                level = await self.get_status_return_level(servo_id)
+            except Exception:
+                # Unreadable (e.g. NO_STATUS_PACKET, or a transient failure); wait
+                # for a reply this time and read the level again on the next write.
+                level = registers.STATUS_RETURN.RETURN_FOR_ALL_PACKETS
+        return level >= registers.STATUS_RETURN.RETURN_FOR_ALL_PACKETS
+
+    async def get_status_return_level(self, servo_id: int) -> int:
+        """Return the servo's STATUS_RETURN_LEVEL, reading it from the servo only once."""
+        level = self._status_return_levels.get(servo_id)
+        if level is None:
+            level = await self.read_byte(servo_id, registers.STATUS_RETURN_LEVEL)
+            self._status_return_levels[servo_id] = level
+        return level
+
+    async def set_status_return_level(self, servo_id: int, level: int, write: bool = True) -> None:
+        """Set a servo's STATUS_RETURN_LEVEL; with `write=False` the level is only recorded."""
+        if write:
+            await self.write_byte(servo_id, registers.STATUS_RETURN_LEVEL, level)
+        else:
+            self._status_return_levels[servo_id] = level
+
+    async def write_byte(self, servo_id: int, register: int, value: int, deferred: bool = False) -> None:
+        """Write one byte to a servo register."""
+        require_range("byte value", value, 0, 0xFF)
+        if deferred:
+            packet = packets.get_reg_write_packet_1b(servo_id, register, value)
+        else:
+            packet = packets.get_write_packet_1b(servo_id, register, value)
+        values = [value]
+        await self._submit(packet, servo_id, expect_response=await self._expects_reply(servo_id, register, values))
+        self._track_written(servo_id, register, values, deferred)
+
+    async def write_word(self, servo_id: int, register: int, value: int, deferred: bool = False) -> None:
+        """Write one word to a servo register."""
+        require_range("word value", value, 0, 0xFFFF)
+        if deferred:
+            packet = packets.get_reg_write_packet_2b(servo_id, register, value)
+        else:
+            packet = packets.get_write_packet_2b(servo_id, register, value)
+        values = [value & 0xFF, (value >> 8) & 0xFF]
+        await self._submit(packet, servo_id, expect_response=await self._expects_reply(servo_id, register, values))
+        self._track_written(servo_id, register, values, deferred)
+
+    async def send_action(self) -> None:
+        """Send ACTION broadcast packet."""
+        await self._submit(packets.get_action_packet(), expect_response=False)
+
+    async def sync_write(self, register: int, data_length: int, data: Iterable[Tuple[int, Sequence[int]]]) -> None:
+        """Write `data_length` bytes per servo starting at `register` in one SYNC_WRITE packet."""
+        data = list(data)
+        await self._submit(packets.get_sync_write_packet(register, data_length, data), expect_response=False)
+        for servo_id, values in data:
+            self._track_written(servo_id, register, list(values), False)
+
+    async def sync_move(self, vector: Sequence[Tuple[int, int, int]]) -> None:
+        """Write goal position and moving speed for all joints in one SYNC_WRITE packet."""
+        for _servo_id, position, velocity in vector:
+            require_range("position", position, registers.POSITION_MIN, registers.POSITION_MAX)
+            require_range("velocity", velocity, registers.SPEED_MIN, registers.SPEED_MAX)
+        if vector:
+            await self._submit(packets.get_sync_move_packet(vector), expect_response=False)
+
+    async def move_to_vector(self, vector: Sequence[Tuple[int, int, int]]) -> None:
+        """Move all joints in `vector` at once (see `ServoChain.move_to_vector`)."""
+        await self.sync_move(vector)
+
+    async def set_led(self, servo_id: int, value: int) -> None:
+        """Set LED register."""
+        await self.write_byte(servo_id, registers.LED, value)
+
+    async def get_position(self, servo_id: int) -> int:
+        """Read present position."""
+        return await self.read_word(servo_id, registers.PRESENT_POSITION)
+
+    async def set_position(self, servo_id: int, position: int) -> None:
+        """Set goal position using deferred write."""
+        require_range("position", position, registers.POSITION_MIN, registers.POSITION_MAX)
+        await self.write_word(servo_id, registers.GOAL_POSITION, position, deferred=True)
+
+    async def set_velocity(self, servo_id: int, velocity: int) -> None:
+        """Set moving speed using deferred write."""
+        require_range("velocity", velocity, registers.SPEED_MIN, registers.SPEED_MAX)
+        await self.write_word(servo_id, registers.MOVING_SPEED, velocity, deferred=True)
+
+    async def get_is_moving(self, servo_id: int) -> bool:
+        """Read moving flag."""
+        return bool(await self.read_byte(servo_id, registers.MOVING))
+
+    async def get_torque(self, servo_id: int) -> int:
+        """Read present load/torque value."""
+        return await self.read_word(servo_id, registers.PRESENT_LOAD)
+
+    async def read_position(self, joints: Sequence[int]) -> List[int]:
+        """Read current positions for all joints in order."""
+        return [await self.get_position(joint) for joint in joints]
+
+    async def wait_for_move(
+        self,
+        joints: Sequence[int],
+        sleep_time: float = 0.1,
+        timeout: Optional[float] = None,
+        min_interval: float = 0.002,
+    ) -> None:
+        """Wait until all listed joints stop moving without blocking the event loop.
+
+        Polls every still-moving joint once per cycle and sleeps for half the
+        longest estimated remaining move time, bounded by `min_interval` and
+        `sleep_time` (see `ServoChain.wait_for_move`). Raises
+        `MoveTimeoutError` after `timeout` seconds.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        span = registers.MOVING + 1 - registers.GOAL_POSITION
+        pending = list(joints)
+        while pending:
+            remaining = 0.0
+            moving = []
+            for joint in pending:
+                data = await self.read_data(joint, registers.GOAL_POSITION, span)
+                if data[registers.MOVING - registers.GOAL_POSITION]:
+                    moving.append(joint)
+                    goal = data[0] | (data[1] << 8)
+                    speed = data[2] | (data[3] << 8)
+                    offset = registers.PRESENT_POSITION - registers.GOAL_POSITION
+                    present = data[offset] | (data[offset + 1] << 8)
+                    remaining = max(remaining, timing.move_time(goal - present, speed))
+            pending = moving
+            if not pending:
+                return
+
+            interval = min(sleep_time, max(min_interval, remaining / 2))
+            if deadline is not None:
+                left = deadline - loop.time()
+                if left <= 0:
+                    raise MoveTimeoutError(pending, timeout)
+                interval = min(interval, left)
+            await asyncio.sleep(interval)
@@ -9,9 +9,20 @@ from . import registers
 class AX12:
     """Object-oriented AX-12 register access over serial."""
 
-    def __init__(self, ser, servo_id):
+    def __init__(self, ser, servo_id, cache=None, bus=None):
+        """Initialize register access for one servo.
+
+        Args:
+            ser: Open pyserial-compatible port object.
+            servo_id: Servo ID on the bus.
+            cache: Optional `RegisterCache` for reads (ignored when `bus` is set).
+            bus: Optional `DynamixelBus`; when set all access goes through it
+                and uses its cache and retry settings.
+        """
         self.ser = ser
         self.servo_id = servo_id
+        self.cache = cache
+        self.bus = bus
 
     def _backend(self):
         # Local import avoids import cycles with pydynamixel.dynamixel.
@@ -19,17 +30,52 @@ class AX12:
 
         return dynamixel
 
+    def _read(self, addr, size, reader):
+        if self.cache is None:
+            return reader(self.ser, self.servo_id, addr)
+        value = self.cache.get(self.servo_id, addr, size)
+        if value is None:
+            value = reader(self.ser, self.servo_id, addr)
+            self.cache.put(self.servo_id, addr, size, value)
+        return value
+
+    def _write(self, addr, size, value, writer):
+        if self.cache is not None:
+            self.cache.invalidate(self.servo_id, addr, size)
+        writer(self.ser, self.servo_id, addr, value)
+        if self.cache is not None:
+            self.cache.on_write(self.servo_id, addr, size, value)
+
     def _rb(self, addr):
-        return self._backend().read_byte(self.ser, self.servo_id, addr)
+        if self.bus is not None:
+            return self.bus.read_byte(self.servo_id, addr)
+        return self._read(addr, 1, self._backend().read_byte)
 
     def _rw(self, addr):
-        return self._backend().read_word(self.ser, self.servo_id, addr)
+        if self.bus is not None:
+            return self.bus.read_word(self.servo_id, addr)
+        return self._read(addr, 2, self._backend().read_word)
 
     def _wb(self, addr, value):
-        self._backend().write_byte(self.ser, self.servo_id, addr, value)
+        if self.bus is not None:
+            self.bus.write_byte(self.servo_id, addr, value)
+        else:
+            self._write(addr, 1, value, self._backend().write_byte)
 
     def _ww(self, addr, value):
-        self._backend().write_word(self.ser, self.servo_id, addr, value)
+        if self.bus is not None:
+            self.bus.write_word(self.servo_id, addr, value)
+        else:
+            self._write(addr, 2, value, self._backend().write_word)
+
+    def snapshot(self, eeprom=False):
+        """Read all RAM registers (and EEPROM when `eeprom` is set) in one exchange."""
+        if self.bus is not None:
+            return self.bus.snapshot([self.servo_id], eeprom)[0]
+        snapshot = self._backend().read_snapshot(self.ser, self.servo_id, eeprom)
+        if self.cache is not None:
+            self.cache.put_snapshot(snapshot)
+        return snapshot
 
     @property
     def model_number(self):
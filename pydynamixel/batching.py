@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Coalescing of outgoing packets into single serial writes."""
+
+
+class BatchWriter:
+    """Serial port proxy that queues writes and sends them as one buffer.
+
+    Queued packets go out in one `write` call when `flush_batch` is called or
+    as soon as anything reads from the port, so a packet that needs a reply
+    is always sent after (and together with) the packets queued before it.
+    Other attributes are forwarded to the wrapped port.
+    """
+
+    __slots__ = ("serial", "buffer", "packets", "writes")
+
+    def __init__(self, serial_port):
+        object.__setattr__(self, "serial", serial_port)
+        object.__setattr__(self, "buffer", bytearray())
+        object.__setattr__(self, "packets", 0)
+        object.__setattr__(self, "writes", 0)
+
+    def __getattr__(self, name):
+        return getattr(self.serial, name)
+
+    def __setattr__(self, name, value):
+        if name in BatchWriter.__slots__:
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self.serial, name, value)
+
+    def write(self, data):
+        """Queue `data`; nothing is sent until the batch is flushed."""
+        self.buffer += data
+        self.packets += 1
+        return len(data)
+
+    def flush_batch(self):
+        """Send all queued packets in one write."""
+        if self.buffer:
+            self.serial.write(bytes(self.buffer))
+            self.buffer.clear()
+            self.writes += 1
+
+    def read(self, size=1):
+        self.flush_batch()
+        return self.serial.read(size)
+
+    @property
+    def in_waiting(self):
+        self.flush_batch()
+        return self.serial.in_waiting
+
+    def inWaiting(self):
+        return self.in_waiting
+
+    def reset_output_buffer(self):
+        # Queued packets are never discarded; the OS buffer is left alone too
+        # so packets flushed moments ago are not dropped before transmission.
+        pass
+
+    def flush(self):
+        self.flush_batch()
+        self.serial.flush()
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Parallel control of servos spread over several serial buses."""
+
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from . import registers
+from .data import ServoSnapshot
+from .dynamixel import require_range
+from .dynamixel_bus import DynamixelBus
+from .servo_chain import ServoChain
+
+
+class BusGroup:
+    """Route servo IDs to their `DynamixelBus` and drive the buses in parallel.
+
+    Each bus gets one worker thread, so per-bus work (reads, REG_WRITE staging,
+    move polling) runs concurrently across ports while exchanges on one port
+    stay serialized. Broadcast-style commands (SYNC_WRITE poses, ACTION) are
+    written to every port back to back from the calling thread while it owns
+    all buses, so motion starts as close together as the adapters allow.
+    """
+
+    def __init__(self, routes: Optional[Dict[int, DynamixelBus]] = None, sleep_time: float = 0.1):
+        """Initialize a bus group.
+
+        Args:
+            routes: Mapping of servo ID to the bus it is attached to.
+            sleep_time: Longest poll interval while waiting for movement completion.
+        """
+        self.sleep_time = sleep_time
+        self.buses: List[DynamixelBus] = []
+        self._routes: Dict[int, DynamixelBus] = {}
+        self._workers: Dict[DynamixelBus, ThreadPoolExecutor] = {}
+        for servo_id, bus in (routes or {}).items():
+            self.add_servo(servo_id, bus)
+
+    @classmethod
+    def from_scan(cls, buses: Sequence[DynamixelBus], begin_id: int = 0, end_id: int = 253, sleep_time: float = 0.1) -> "BusGroup":
+        """Scan all buses concurrently and route every servo found to its bus."""
+        group = cls(sleep_time=sleep_time)
+        for bus in buses:
+            group.add_bus(bus)
+        for bus, ids in group._fan_out({bus: () for bus in buses}, lambda bus, _: bus.scan(begin_id, end_id)).items():
+            group.add_bus(bus, ids)
+        return group
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self) -> None:
+        """Stop the worker threads; the buses themselves stay open."""
+        for worker in self._workers.values():
+            worker.shutdown(wait=True)
+        self._workers.clear()
+
+    # Routing.
+
+    def add_bus(self, bus: DynamixelBus, ids: Iterable[int] = ()) -> None:
+        """Add `bus` to the group and route `ids` to it."""
+        if bus not in self.buses:
+            self.buses.append(bus)
+        for servo_id in ids:
+            self._routes[servo_id] = bus
+
+    def add_servo(self, servo_id: int, bus: DynamixelBus) -> None:
+        """Route `servo_id` to `bus`, adding the bus to the group if needed."""
+        self.add_bus(bus, (servo_id,))
+
+    def bus_for(self, servo_id: int) -> DynamixelBus:
+        """Return the bus `servo_id` is attached to."""
+        try:
+            return self._routes[servo_id]
+        except KeyError:
+            raise KeyError(f"Servo {servo_id} is not routed to any bus in the group.") from None
+
+    @property
+    def ids(self) -> List[int]:
+        """All routed servo IDs in ascending order."""
+        return sorted(self._routes)
+
+    def split(self, ids: Iterable[int]) -> Dict[DynamixelBus, List[int]]:
+        """Group `ids` by bus, keeping their order within each bus."""
+        parts: Dict[DynamixelBus, List[int]] = {}
+        for servo_id in ids:
+            parts.setdefault(self.bus_for(servo_id), []).append(servo_id)
+        return parts
+
+    def split_vector(self, vector: Sequence[Tuple[int, int, int]]) -> Dict[DynamixelBus, List[Tuple[int, int, int]]]:
+        """Group `(servo_id, position, velocity)` entries by bus."""
+        parts: Dict[DynamixelBus, List[Tuple[int, int, int]]] = {}
+        for entry in vector:
+            parts.setdefault(self.bus_for(entry[0]), []).append(entry)
+        return parts
+
+    # Execution.
+
+    def _worker(self, bus: DynamixelBus) -> ThreadPoolExecutor:
+        worker = self._workers.get(bus)
+        if worker is None:
+            worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"dynamixel-bus-{self.buses.index(bus)}")
+            self._workers[bus] = worker
+        return worker
+
+    def _fan_out(self, parts: Dict[DynamixelBus, object], func: Callable) -> Dict[DynamixelBus, object]:
+        """Run `func(bus, part)` on every bus's worker and wait for all of them.
+
+        The first exception is re-raised once every bus has finished, so no
+        worker is still talking to its port when the caller sees the error.
+        """
+        if len(parts) == 1:
+            bus, part = next(iter(parts.items()))
+            return {bus: func(bus, part)}
+        futures = {bus: self._worker(bus).submit(func, bus, part) for bus, part in parts.items()}
+        results = {}
+        error = None
+        for bus, future in futures.items():
+            try:
+                results[bus] = future.result()
+            except Exception as exc:
+                if error is None:
+                    error = exc
+        if error is not None:
+            raise error
+        return results
+
+    @contextmanager
+    def exclusive(self, buses: Optional[Iterable[DynamixelBus]] = None) -> Iterator[None]:
+        """Own `buses` (all by default) at once; acquired in group order to avoid deadlocks."""
+        if buses is None:
+            wanted = self.buses
+        else:
+            selected = set(buses)
+            wanted = [bus for bus in self.buses if bus in selected]
+        with ExitStack() as stack:
+            for bus in wanted:
+                stack.enter_context(bus.exclusive())
+            yield
+
+    # Chain API.
+
+    def read_position(self, joints: Sequence[int]) -> List[int]:
+        """Read current positions for all joints, one worker per bus, in `joints` order."""
+        parts = self.split(joints)
+        results = self._fan_out(parts, lambda bus, ids: [bus.get_position(joint) for joint in ids])
+        positions = {}
+        for bus, ids in parts.items():
+            positions.update(zip(ids, results[bus]))
+        return [positions[joint] for joint in joints]
+
+    def snapshot(self, ids: Sequence[int], eeprom: bool = False) -> List[ServoSnapshot]:
+        """Read a control-table snapshot per servo, concurrently across buses, in `ids` order."""
+        parts = self.split(ids)
+        results = self._fan_out(parts, lambda bus, part: bus.snapshot(part, eeprom))
+        snapshots = {}
+        for bus in parts:
+            snapshots.update((snap.servo_id, snap) for snap in results[bus])
+        return [snapshots[servo_id] for servo_id in ids]
+
+    @staticmethod
+    def _validate_vector(vector: Sequence[Tuple[int, int, int]]) -> None:
+        for _servo_id, position, velocity in vector:
+            require_range("position", position, registers.POSITION_MIN, registers.POSITION_MAX)
+            require_range("velocity", velocity, registers.SPEED_MIN, registers.SPEED_MAX)
+
+    def sync_move(self, vector: Sequence[Tuple[int, int, int]]) -> None:
+        """Send one SYNC_WRITE pose per bus, written back to back while owning all buses.
+
+        The whole vector is validated first, so no bus moves if any entry is out of range.
+        """
+        self._validate_vector(vector)
+        parts = self.split_vector(vector)
+        with self.exclusive(parts):
+            for bus, part in parts.items():
+                bus.sync_move(part)
+
+    def send_action(self) -> None:
+        """Broadcast ACTION on every bus, back to back while owning all buses."""
+        with self.exclusive():
+            for bus in self.buses:
+                bus.send_action()
+
+    def move_to_vector(self, vector: Sequence[Tuple[int, int, int]], sync_write: bool = True) -> None:
+        """Move all joints in `vector` at the same time (see `ServoChain.move_to_vector`).
+
+        With `sync_write=False` each bus stages its joints with REG_WRITE on
+        its own worker, and one ACTION per bus is sent once all are staged.
+        Either way the whole vector is validated before anything is sent.
+        """
+        if sync_write:
+            self.sync_move(vector)
+            return
+        self._validate_vector(vector)
+
+        def stage(bus, part):
+            with bus.batch():
+                for servo_id, angle, velocity in part:
+                    bus.set_position(servo_id, angle)
+                    bus.set_velocity(servo_id, velocity)
+
+        parts = self.split_vector(vector)
+        self._fan_out(parts, stage)
+        with self.exclusive(parts):
+            for bus in parts:
+                bus.send_action()
+
+    def wait_for_move(self, joints: Sequence[int], timeout: Optional[float] = None) -> None:
+        """Block until all listed joints stop moving, polling each bus on its own worker.
+
+        See `ServoChain.wait_for_move`; `MoveTimeoutError` is raised if any bus
+        still has moving joints after `timeout` seconds.
+        """
+        self._fan_out(self.split(joints), lambda bus, ids: ServoChain(bus, self.sleep_time).wait_for_move(ids, timeout))
+
+    # Single-servo routing.
+
+    def servo(self, servo_id: int):
+        """Return an `AX12` object for `servo_id` bound to its bus."""
+        return self.bus_for(servo_id).servo(servo_id)
+
+    def get_position(self, servo_id: int) -> int:
+        """Read present position."""
+        return self.bus_for(servo_id).get_position(servo_id)
+
+    def get_is_moving(self, servo_id: int) -> bool:
+        """Read moving flag."""
+        return self.bus_for(servo_id).get_is_moving(servo_id)
+
+    def set_led(self, servo_id: int, value: int) -> None:
+        """Set LED register."""
+        self.bus_for(servo_id).set_led(servo_id, value)
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Binary capture of bus traffic and deterministic offline replay.
+
+A capture file starts with `HEADER` (magic and the wall-clock start time in
+nanoseconds) followed by records of `RECORD` (nanoseconds since the start,
+direction, length) and the bytes themselves. The file is preallocated and
+memory-mapped, and zero bytes after the last record mark its end, so a
+capture cut short by a crash stays readable.
+"""
+
+import mmap
+import os
+import struct
+import threading
+import time
+from typing import Iterable, Iterator, Union
+
+from . import registers
+from .data import CaptureFrame
+from .exceptions import ReplayMismatchError
+
+TX = 1
+RX = 2
+
+MAGIC = b"PDXCAP\x00\x01"
+HEADER = struct.Struct("<8sQ")
+RECORD = struct.Struct("<QBH")
+MAX_RECORD_DATA = 0xFFFF
+DEFAULT_SIZE = 1 << 20
+
+
+class CaptureLog:
+    """Append-only, memory-mapped capture file.
+
+    The file is grown by doubling when the preallocated space runs out and
+    truncated to the bytes used on `close`. Appending copies the data into
+    the mapping, so callers may reuse their buffers right away. Safe to share
+    between threads.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike], size: int = DEFAULT_SIZE):
+        """Create (or overwrite) a capture file.
+
+        Args:
+            path: File to write.
+            size: Bytes to preallocate.
+        """
+        self.path = path
+        self.frames = 0
+        self._lock = threading.Lock()
+        self._file = open(path, "w+b")
+        self._size = max(size, HEADER.size + RECORD.size)
+        self._file.truncate(self._size)
+        self._map = mmap.mmap(self._file.fileno(), self._size)
+        HEADER.pack_into(self._map, 0, MAGIC, time.time_ns())
+        self._offset = HEADER.size
+        self._start = time.perf_counter_ns()
+
+    @property
+    def closed(self) -> bool:
+        return self._map is None
+
+    def append(self, direction: int, data) -> None:
+        """Record `data` sent (`TX`) or received (`RX`) now."""
+        size = len(data)
+        if size > MAX_RECORD_DATA:
+            view = memoryview(data)
+            for start in range(0, size, MAX_RECORD_DATA):
+                self.append(direction, view[start:start + MAX_RECORD_DATA])
+            return
+        timestamp = time.perf_counter_ns() - self._start
+        with self._lock:
+            if self._map is None:
+                raise ValueError("Capture log is closed.")
+            offset = self._offset
+            end = offset + RECORD.size + size
+            if end > self._size:
+                self._grow(end)
+            RECORD.pack_into(self._map, offset, timestamp, direction, size)
+            self._map[offset + RECORD.size:end] = data
+            self._offset = end
+            self.frames += 1
+
+    def _grow(self, needed: int) -> None:
+        self._map.close()
+        self._size = max(needed, 2 * self._size)
+        self._file.truncate(self._size)
+        self._map = mmap.mmap(self._file.fileno(), self._size)
+
+    def flush(self) -> None:
+        """Write mapped pages back to the file."""
+        with self._lock:
+            if self._map is not None:
+                self._map.flush()
+
+    def close(self) -> None:
+        """Flush the log and truncate the file to the recorded data."""
+        with self._lock:
+            if self._map is None:
+                return
+            self._map.flush()
+            self._map.close()
+            self._map = None
+            self._file.truncate(self._offset)
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class CaptureSerial:
+    """Serial port proxy that logs every write and every non-empty read to a `CaptureLog`.
+
+    Other attributes are forwarded to the wrapped port, so it can be passed
+    to `DynamixelBus` in place of the port.
+    """
+
+    __slots__ = ("serial", "log")
+
+    def __init__(self, serial_port, log: CaptureLog):
+        object.__setattr__(self, "serial", serial_port)
+        object.__setattr__(self, "log", log)
+
+    def __getattr__(self, name):
+        return getattr(self.serial, name)
+
+    def __setattr__(self, name, value):
+        if name in CaptureSerial.__slots__:
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self.serial, name, value)
+
+    def write(self, data):
+        self.log.append(TX, data)
+        return self.serial.write(data)
+
+    def read(self, size=1):
+        data = self.serial.read(size)
+        if data:
+            self.log.append(RX, data)
+        return data
+
+
+def read_capture(path: Union[str, os.PathLike]) -> Iterator[CaptureFrame]:
+    """Yield the frames of a capture file in order."""
+    with open(path, "rb") as file:
+        data = file.read()
+    if len(data) < HEADER.size or HEADER.unpack_from(data, 0)[0] != MAGIC:
+        raise ValueError(f"{path} is not a pydynamixel capture file.")
+    offset = HEADER.size
+    while offset + RECORD.size <= len(data):
+        timestamp, direction, size = RECORD.unpack_from(data, offset)
+        if direction not in (TX, RX):
+            return
+        offset += RECORD.size
+        yield CaptureFrame(timestamp / 1e9, direction, data[offset:offset + size])
+        offset += size
+
+
+class ReplaySerial:
+    """pyserial-compatible transport that plays a capture back.
+
+    Each `write` is matched against the next TX frame (a mismatch raises
+    `ReplayMismatchError` when `strict`), and the RX frames recorded after
+    it become readable. Reads never wait: when the capture holds fewer bytes
+    than requested, the short read reproduces the original timeout. Together
+    with the unchanged decode path this replays a session byte for byte.
+    The first divergence is kept in `mismatch`, since helpers such as `ping`
+    report any failure as a missing servo.
+    """
+
+    def __init__(self, frames: Union[str, os.PathLike, Iterable[CaptureFrame]], strict: bool = True):
+        """Initialize a replay.
+
+        Args:
+            frames: Capture file path or frames from `read_capture`.
+            strict: Raise on writes that differ from the captured ones.
+        """
+        if isinstance(frames, (str, os.PathLike)):
+            frames = read_capture(frames)
+        self.frames = list(frames)
+        self.strict = strict
+        self.baudrate = registers.DEFAULT_BAUDRATE
+        self.timeout = registers.DEFAULT_TIMEOUT
+        self.write_timeout = None
+        self.port = "replay://"
+        self.is_open = True
+        self.bytes_written = 0
+        self.bytes_read = 0
+        self.mismatch = None
+        self._index = 0
+        self._rx = bytearray()
+        self._release()
+
+    @property
+    def finished(self) -> bool:
+        """True once every captured frame has been replayed."""
+        return self._index >= len(self.frames)
+
+    def _release(self) -> None:
+        frames = self.frames
+        index = self._index
+        while index < len(frames) and frames[index].direction == RX:
+            self._rx += frames[index].data
+            index += 1
+        self._index = index
+
+    # pyserial interface.
+
+    def open(self):
+        self.is_open = True
+
+    def close(self):
+        self.is_open = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def write(self, data):
+        data = bytes(data)
+        index = self._index
+        expected = self.frames[index].data if index < len(self.frames) else None
+        if self.strict and expected != data:
+            error = ReplayMismatchError(index, expected, data)
+            if self.mismatch is None:
+                self.mismatch = error
+            raise error
+        if expected is not None:
+            self._index = index + 1
+            self._release()
+        self.bytes_written += len(data)
+        return len(data)
+
+    def read(self, size=1):
+        data = bytes(self._rx[:size])
+        del self._rx[:size]
+        self.bytes_read += len(data)
+        return data
+
+    @property
+    def in_waiting(self):
+        return len(self._rx)
+
+    def inWaiting(self):
+        return self.in_waiting
+
+    def reset_input_buffer(self):
+        self._rx.clear()
+
+    def reset_output_buffer(self):
+        pass
+
+    def flush(self):
+        pass
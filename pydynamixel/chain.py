@@ -22,9 +22,9 @@ def wait_for_move(ser, joints, verbose=VERBOSE, num_error_attempts=NUM_ERROR_ATT
     _make_chain(ser, verbose, num_error_attempts).wait_for_move(joints)
 
 
-def move_to_vector(ser, vector, verbose=VERBOSE, num_error_attempts=NUM_ERROR_ATTEMPTS):
+def move_to_vector(ser, vector, verbose=VERBOSE, num_error_attempts=NUM_ERROR_ATTEMPTS, sync_write=True):
     """Move all joints described by vector tuples."""
-    _make_chain(ser, verbose, num_error_attempts).move_to_vector(vector)
+    _make_chain(ser, verbose, num_error_attempts).move_to_vector(vector, sync_write=sync_write)
 
 
 def read_position(ser, joints, verbose=VERBOSE, num_error_attempts=NUM_ERROR_ATTEMPTS):
@@ -3,6 +3,14 @@
 
 """Dataclasses for pydynamixel."""
 
+from .cache_stats import CacheStats
+from .capture_frame import CaptureFrame
+from .link_report import LinkReport
 from .response import Response
+from .servo_snapshot import ServoSnapshot
+from .telemetry_sample import TelemetrySample
+from .trajectory_report import TrajectoryReport
+from .transaction_record import TransactionRecord
+from .wait_stats import WaitStats
 
-__all__ = ["Response"]
+__all__ = ["CacheStats", "CaptureFrame", "LinkReport", "Response", "ServoSnapshot", "TelemetrySample", "TrajectoryReport", "TransactionRecord", "WaitStats"]
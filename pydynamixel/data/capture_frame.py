@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""One frame of a bus traffic capture."""
+
+from dataclasses import dataclass
+
+
+@dataclass
+class CaptureFrame:
+    """Bytes written to (TX) or read from (RX) the port in one call.
+
+    `timestamp` is in seconds since the capture started; `direction` is
+    `capture.TX` or `capture.RX`.
+    """
+
+    timestamp: float
+    direction: int
+    data: bytes
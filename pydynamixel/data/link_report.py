@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Outcome of a bus link migration."""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+
+@dataclass
+class LinkReport:
+    """Settings and throughput before and after `LinkOptimizer.optimize`.
+
+    Throughput is in register read exchanges per second. When `rolled_back`
+    is set, `failed` lists the servos that did not verify and the bus was
+    returned to its original settings.
+    """
+
+    ids: List[int] = field(default_factory=list)
+    baudrate_before: int = 0
+    baudrate_after: int = 0
+    return_delay_before: Dict[int, int] = field(default_factory=dict)
+    return_delay_after: Optional[int] = None
+    throughput_before: float = 0.0
+    throughput_after: float = 0.0
+    rolled_back: bool = False
+    failed: List[int] = field(default_factory=list)
+
+    @property
+    def speedup(self):
+        return self.throughput_after / self.throughput_before if self.throughput_before else 0.0
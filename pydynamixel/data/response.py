@@ -3,18 +3,89 @@
 
 """Response object for Dynamixel status packets."""
 
-from dataclasses import dataclass
-from typing import List
+import struct
+import warnings
+from typing import List, Tuple
+
+_U16 = struct.Struct("<H")
 
 
-@dataclass
 class Response:
-    """Decoded status packet."""
+    """Decoded status packet.
+
+    `payload` holds the parameter bytes as `bytes` (a `memoryview` is also
+    accepted). Registers are decoded straight from it with the typed
+    accessors, or several at once with `unpack`, without building a list;
+    `data` returns the parameters as a list of ints for older callers.
+    The `data=` constructor keyword of the former dataclass is still accepted
+    but deprecated in favour of `payload`.
+    """
+
+    __slots__ = ("servo_id", "error", "payload", "checksum_match")
+
+    def __init__(self, servo_id: int, error: int, payload=None, checksum_match: bool = True, *, data=None):
+        if data is not None:
+            if payload is not None:
+                raise TypeError("Response() got both 'payload' and its deprecated alias 'data'.")
+            warnings.warn("Response(data=...) is deprecated; use payload=...", DeprecationWarning, stacklevel=2)
+            payload = data
+        if payload is None:
+            raise TypeError("Response() missing required argument: 'payload'.")
+        self.servo_id = servo_id
+        self.error = error
+        self.payload = payload if isinstance(payload, (bytes, memoryview)) else bytes(payload)
+        self.checksum_match = checksum_match
+
+    @property
+    def data(self) -> List[int]:
+        return list(self.payload)
+
+    @data.setter
+    def data(self, values) -> None:
+        self.payload = bytes(values)
+
+    def __len__(self):
+        return len(self.payload)
+
+    def __eq__(self, other):
+        if not isinstance(other, Response):
+            return NotImplemented
+        return (self.servo_id, self.error, bytes(self.payload), self.checksum_match) == (
+            other.servo_id,
+            other.error,
+            bytes(other.payload),
+            other.checksum_match,
+        )
+
+    def __repr__(self):
+        return (
+            f"Response(servo_id={self.servo_id!r}, error={self.error!r}, "
+            f"payload={bytes(self.payload)!r}, checksum_match={self.checksum_match!r})"
+        )
+
+    def u8(self, offset: int = 0) -> int:
+        """Return the unsigned byte at `offset`."""
+        return self.payload[offset]
+
+    def u16(self, offset: int = 0) -> int:
+        """Return the unsigned little-endian word at `offset`."""
+        return _U16.unpack_from(self.payload, offset)[0]
+
+    def sign_magnitude(self, offset: int = 0, sign_bit: int = 10) -> int:
+        """Return the word at `offset` as a sign-magnitude value.
+
+        AX-12 speed and load registers keep the magnitude in the low bits and
+        the direction in bit 10; a set sign bit gives a negative result.
+        """
+        raw = _U16.unpack_from(self.payload, offset)[0]
+        magnitude = raw & ((1 << sign_bit) - 1)
+        return -magnitude if raw & (1 << sign_bit) else magnitude
 
-    servo_id: int
-    error: int
-    data: List[int]
-    checksum_match: bool
+    def unpack(self, fmt, offset: int = 0) -> Tuple:
+        """Decode several fields at once with a `struct` format (or `struct.Struct`)."""
+        if isinstance(fmt, struct.Struct):
+            return fmt.unpack_from(self.payload, offset)
+        return struct.unpack_from(fmt, self.payload, offset)
 
     def get_error(self):
         return self.error > 0 or not self.checksum_match
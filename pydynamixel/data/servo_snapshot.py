@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Decoded control-table snapshot for one servo."""
+
+from .. import registers
+
+# (attribute, address, size in bytes) in control-table order.
+EEPROM_FIELDS = (
+    ("model_number", registers.MODEL_NUMBER, 2),
+    ("version", registers.VERSION, 1),
+    ("id", registers.ID, 1),
+    ("baud_rate", registers.BAUD_RATE, 1),
+    ("return_delay", registers.RETURN_DELAY, 1),
+    ("cw_angle_limit", registers.CW_ANGLE_LIMIT, 2),
+    ("ccw_angle_limit", registers.CCW_ANGLE_LIMIT, 2),
+    ("temp_limit", registers.TEMP_LIMIT, 1),
+    ("min_voltage_limit", registers.MIN_VOLTAGE_LIMIT, 1),
+    ("max_voltage_limit", registers.MAX_VOLTAGE_LIMIT, 1),
+    ("max_torque", registers.MAX_TORQUE, 2),
+    ("status_return_level", registers.STATUS_RETURN_LEVEL, 1),
+    ("alarm_led", registers.ALARM_LED, 1),
+    ("alarm_shutdown", registers.ALARM_SHUTDOWN, 1),
+    ("down_calibration", registers.DOWN_CALIBRATION, 2),
+    ("up_calibration", registers.UP_CALIBRATION, 2),
+)
+
+RAM_FIELDS = (
+    ("torque_enable", registers.TORQUE_ENABLE, 1),
+    ("led", registers.LED, 1),
+    ("cw_compliance_margin", registers.CW_COMPLIANCE_MARGIN, 1),
+    ("ccw_compliance_margin", registers.CCW_COMPLIANCE_MARGIN, 1),
+    ("cw_compliance_slope", registers.CW_COMPLIANCE_SLOPE, 1),
+    ("ccw_compliance_slope", registers.CCW_COMPLIANCE_SLOPE, 1),
+    ("goal_position", registers.GOAL_POSITION, 2),
+    ("moving_speed", registers.MOVING_SPEED, 2),
+    ("torque_limit", registers.TORQUE_LIMIT, 2),
+    ("present_position", registers.PRESENT_POSITION, 2),
+    ("present_speed", registers.PRESENT_SPEED, 2),
+    ("present_load", registers.PRESENT_LOAD, 2),
+    ("present_voltage", registers.PRESENT_VOLTAGE, 1),
+    ("present_temperature", registers.PRESENT_TEMPERATURE, 1),
+    ("registered", registers.REGISTERED, 1),
+    ("moving", registers.MOVING, 1),
+    ("lock", registers.LOCK, 1),
+    ("punch", registers.PUNCH, 2),
+)
+
+FIELDS = EEPROM_FIELDS + RAM_FIELDS
+
+# Register address -> size in bytes.
+REGISTER_SIZES = {addr: size for _name, addr, size in FIELDS}
+
+
+class ServoSnapshot:
+    """Register values decoded from one READ_DATA of the control table.
+
+    Fields outside the block that was read are `None`. Values are raw register
+    units, matching the corresponding `AX12` properties.
+    """
+
+    __slots__ = ("servo_id",) + tuple(name for name, _addr, _size in FIELDS)
+
+    def __init__(self, servo_id, **values):
+        self.servo_id = servo_id
+        for name, _addr, _size in FIELDS:
+            setattr(self, name, values.get(name))
+
+    @classmethod
+    def from_control_table(cls, servo_id, data, start=registers.RAM_START):
+        """Decode a contiguous control-table block read from address `start`."""
+        snapshot = cls(servo_id)
+        end = start + len(data)
+        for name, addr, size in FIELDS:
+            if addr < start or addr + size > end:
+                continue
+            offset = addr - start
+            value = data[offset] if size == 1 else data[offset] | (data[offset + 1] << 8)
+            setattr(snapshot, name, value)
+        if snapshot.moving is not None:
+            snapshot.moving = bool(snapshot.moving)
+        return snapshot
+
+    def as_dict(self):
+        """Return all fields (including `servo_id`) as a dictionary."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __eq__(self, other):
+        if not isinstance(other, ServoSnapshot):
+            return NotImplemented
+        return self.as_dict() == other.as_dict()
+
+    def __repr__(self):
+        values = ", ".join(f"{name}={value!r}" for name, value in self.as_dict().items() if value is not None)
+        return f"ServoSnapshot({values})"
@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""One cycle of a fixed-rate telemetry stream."""
+
+from dataclasses import dataclass, field
+from typing import Dict
+
+
+@dataclass
+class TelemetrySample:
+    """Register values read in one `ServoChain.stream` cycle.
+
+    `values` maps servo ID to `{register: value}` for the registers read in
+    this cycle. `missed` counts cycles skipped because the previous cycle (or
+    the consumer) overran its slot.
+    """
+
+    cycle: int
+    timestamp: float
+    latency: float
+    values: Dict[int, Dict[int, int]] = field(default_factory=dict)
+    missed: int = 0
+
+    @property
+    def overrun(self):
+        return self.missed > 0
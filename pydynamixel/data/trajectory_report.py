@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Timing summary of one trajectory playback."""
+
+from dataclasses import dataclass
+
+
+@dataclass
+class TrajectoryReport:
+    """Ticks sent and deadlines missed while streaming a `Trajectory`.
+
+    Times are in seconds; `max_lateness` is the worst delay of a sent tick
+    behind its scheduled time.
+    """
+
+    ticks: int = 0
+    missed: int = 0
+    max_lateness: float = 0.0
+    elapsed: float = 0.0
+
+    @property
+    def miss_ratio(self):
+        total = self.ticks + self.missed
+        return self.missed / total if total else 0.0
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Timing and outcome of one bus transaction."""
+
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class TransactionRecord:
+    """What one packet exchange cost, reported to bus observers.
+
+    Phase times are in seconds and summed over all attempts: `encode` builds
+    the packet, `write` hands it to the port, `first_byte` waits for the
+    status header, `read` pulls the rest of the packet and `decode` parses it.
+    `total` runs from the start of encoding to the end of the exchange.
+    `stale_frames` counts late status packets discarded while waiting.
+    """
+
+    servo_id: Optional[int] = None
+    instruction: Optional[int] = None
+    expect_response: bool = True
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    attempts: int = 0
+    timeouts: int = 0
+    checksum_errors: int = 0
+    stale_frames: int = 0
+    errors: int = 0
+    ok: bool = False
+    encode: float = 0.0
+    write: float = 0.0
+    first_byte: float = 0.0
+    read: float = 0.0
+    decode: float = 0.0
+    total: float = 0.0
+
+    @property
+    def retries(self):
+        return max(0, self.attempts - 1)
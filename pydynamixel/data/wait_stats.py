@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Queue wait statistics for one bus priority class."""
+
+from dataclasses import dataclass
+
+
+@dataclass
+class WaitStats:
+    """Time requests of one priority spent waiting for the bus, in seconds."""
+
+    count: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+    @property
+    def mean_wait(self):
+        return self.total_wait / self.count if self.count else 0.0
+
+    def add(self, wait):
+        self.count += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
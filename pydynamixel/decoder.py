@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Incremental, I/O-free decoder for Protocol 1.0 status packets."""
+
+from typing import List, Optional
+
+from . import packets
+from .data import Response
+
+HEADER = b"\xff\xff"
+# Smallest complete status packet: FF FF ID LENGTH ERROR CHECKSUM.
+MIN_PACKET_SIZE = 6
+
+
+class StatusDecoder:
+    """Turn arbitrary byte chunks into decoded `Response` objects.
+
+    The decoder owns no serial port: callers feed it whatever bytes they
+    received (one byte, a partial packet, several packets plus line noise)
+    and get back every status packet completed so far. Garbage before a
+    header and frames that fail the checksum are skipped by resyncing on the
+    next `FF FF` header, so the same class works for request/response
+    exchanges, bus sniffers and asynchronous transports.
+    """
+
+    def __init__(self, emit_corrupt: bool = False):
+        """Initialize an empty decoder.
+
+        Args:
+            emit_corrupt: Also return frames whose checksum does not match, with
+                `checksum_match=False`, instead of only counting them.
+        """
+        self.emit_corrupt = emit_corrupt
+        self._buffer = bytearray()
+        self.packets = 0
+        self.checksum_errors = 0
+        self.discarded_bytes = 0
+
+    def reset(self) -> None:
+        """Drop any partially received data."""
+        self._buffer.clear()
+
+    @property
+    def buffered(self) -> int:
+        """Number of received bytes not yet consumed by a complete packet."""
+        return len(self._buffer)
+
+    def bytes_needed(self) -> int:
+        """Return the minimum number of bytes required to complete the next packet.
+
+        Reading exactly this many bytes never consumes data past the end of the
+        packet, so a blocking reader can pull a status packet with one read for
+        the header and one for the remainder.
+        """
+        self._sync()
+        buffer = self._buffer
+        if len(buffer) < 4:
+            return 4 - len(buffer)
+        return max(1, 4 + buffer[3] - len(buffer))
+
+    def feed(self, data) -> List[Response]:
+        """Append received bytes and return all packets completed by them."""
+        self._buffer += data
+        responses = []
+        while True:
+            response = self._next()
+            if response is None:
+                return responses
+            responses.append(response)
+
+    def _discard(self, count: int) -> None:
+        del self._buffer[:count]
+        self.discarded_bytes += count
+
+    def _sync(self) -> None:
+        """Drop bytes until the buffer starts with a plausible packet header."""
+        buffer = self._buffer
+        while True:
+            start = buffer.find(HEADER)
+            if start < 0:
+                # Keep a trailing 0xFF, it may be the first half of a header.
+                keep = 1 if buffer[-1:] == b"\xff" else 0
+                self._discard(len(buffer) - keep)
+                return
+            if start:
+                self._discard(start)
+            # 0xFF is not a valid ID; FF FF FF means the header starts one byte later.
+            if len(buffer) > 2 and buffer[2] == 0xFF:
+                self._discard(1)
+                continue
+            # LENGTH covers at least ERROR and CHECKSUM.
+            if len(buffer) > 3 and buffer[3] < 2:
+                self._discard(1)
+                continue
+            return
+
+    def _next(self) -> Optional[Response]:
+        buffer = self._buffer
+        while True:
+            self._sync()
+            if len(buffer) < 4:
+                return None
+            total = 4 + buffer[3]
+            if len(buffer) < total:
+                return None
+
+            calc = packets.checksum(buffer[2:total - 1])
+            checksum_match = buffer[total - 1] == calc
+            response = Response(buffer[2], buffer[4], bytes(buffer[5:total - 1]), checksum_match)
+            if checksum_match:
+                del buffer[:total]
+                self.packets += 1
+                return response
+
+            # Resync from the byte after this header; the "packet" may have been noise.
+            self.checksum_errors += 1
+            self._discard(1)
+            if self.emit_corrupt:
+                return response
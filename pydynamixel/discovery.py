@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Fast servo discovery for Protocol 1.0 buses."""
+
+from typing import Dict, Iterable, List, Optional
+
+from . import packets, registers, timing
+from .decoder import StatusDecoder
+
+# How long to keep listening for late replies after the last probe.
+SETTLE_TIME = 0.02
+
+
+def probe_timeout(baudrate, return_delay=registers.DEFAULT_VALUES[registers.RETURN_DELAY], margin=timing.DEFAULT_MARGIN):
+    """Return the per-ping wait derived from the wire time at `baudrate` and the return delay."""
+    return timing.response_timeout(baudrate, timing.PING_PACKET_SIZE, timing.STATUS_PACKET_SIZE, return_delay, margin)
+
+
+def _collect(ser, decoder, found, begin_id, end_id, wanted=None):
+    """Read until `wanted` answers or the port times out, recording every replying ID."""
+    while True:
+        data = ser.read(decoder.bytes_needed())
+        if not data:
+            return
+        for response in decoder.feed(data):
+            if begin_id <= response.servo_id <= end_id:
+                found.add(response.servo_id)
+            if response.servo_id == wanted:
+                return
+
+
+def scan(
+    ser,
+    begin_id=0,
+    end_id=253,
+    timeout=None,
+    expected_count=None,
+    return_delay=registers.DEFAULT_VALUES[registers.RETURN_DELAY],
+    verbose=False,
+):
+    """Ping a range of IDs with short probe timeouts and return responsive IDs.
+
+    The input buffer is not flushed between probes: a reply that arrives after
+    its probe timed out (slow USB adapter, long return delay) is still decoded
+    while the next IDs are probed and counted for the servo that sent it.
+
+    Args:
+        ser: Open pyserial-compatible port object.
+        begin_id: First ID to probe.
+        end_id: Last ID to probe.
+        timeout: Per-probe wait in seconds; derived from the baud rate and
+            `return_delay` when omitted.
+        expected_count: Stop as soon as this many servos have been found.
+        return_delay: RETURN_DELAY register value assumed for unknown servos.
+        verbose: Print each discovered ID.
+    """
+    if timeout is None:
+        timeout = probe_timeout(getattr(ser, "baudrate", registers.DEFAULT_BAUDRATE), return_delay)
+
+    found = set()
+    decoder = StatusDecoder()
+    previous_timeout = ser.timeout
+    ser.timeout = timeout
+    try:
+        if hasattr(ser, "reset_input_buffer"):
+            ser.reset_input_buffer()
+        for servo_id in range(begin_id, end_id + 1):
+            ser.write(packets.get_ping_packet(servo_id))
+            _collect(ser, decoder, found, begin_id, end_id, wanted=servo_id)
+            if expected_count is not None and len(found) >= expected_count:
+                break
+        else:
+            ser.timeout = max(timeout, SETTLE_TIME)
+            _collect(ser, decoder, found, begin_id, end_id)
+    finally:
+        ser.timeout = previous_timeout
+
+    if verbose:
+        for servo_id in sorted(found):
+            print(f"Found servo {servo_id}")
+    return sorted(found)
+
+
+def scan_baudrates(
+    ser,
+    baudrates: Optional[Iterable[int]] = None,
+    begin_id=0,
+    end_id=253,
+    expected_count=None,
+    return_delay=registers.DEFAULT_VALUES[registers.RETURN_DELAY],
+    verbose=False,
+) -> Dict[int, List[int]]:
+    """Scan every baud rate in `baudrates` (standard AX-12 rates by default).
+
+    Returns a mapping of baud rate to the IDs found there, containing only
+    rates with at least one servo. `expected_count` counts servos across all
+    rates. The port's original baud rate is restored afterwards.
+    """
+    if baudrates is None:
+        baudrates = sorted(registers.BAUD_RATES.values(), reverse=True)
+
+    result = {}
+    total = 0
+    previous_baudrate = ser.baudrate
+    try:
+        for baudrate in baudrates:
+            ser.baudrate = baudrate
+            remaining = None if expected_count is None else expected_count - total
+            ids = scan(ser, begin_id, end_id, None, remaining, return_delay, verbose)
+            if ids:
+                result[baudrate] = ids
+                total += len(ids)
+                if verbose:
+                    print(f"{len(ids)} servo(s) at {baudrate} bps")
+            if expected_count is not None and total >= expected_count:
+                break
+    finally:
+        ser.baudrate = previous_baudrate
+    return result
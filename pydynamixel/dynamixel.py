@@ -3,14 +3,17 @@
 
 """Pure-pyserial AX-12/AX-12A implementation (Dynamixel Protocol 1.0)."""
 
+import time
 from typing import Iterable
 
 import serial
 
-from . import packets, registers
+from . import arrays, discovery, packets, registers, timing
 from .ax12 import AX12
-from .data import Response
-from .exceptions import DynamixelFatalError
+from .data import ServoSnapshot, TransactionRecord
+from .decoder import StatusDecoder
+from .exceptions import ChecksumError, DynamixelFatalError, ReplayMismatchError
+from .retry import RetryPolicy
 
 # The number of retries used for noisy half-duplex buses.
 NUM_ERROR_ATTEMPTS = 10
@@ -43,12 +46,83 @@ def flush_serial(ser):
     if hasattr(ser, "reset_input_buffer"):
         ser.reset_input_buffer()
     else:
-        while ser.inWaiting() > 0:
-            ser.read(1)
+        waiting = ser.inWaiting()
+        while waiting > 0:
+            ser.read(waiting)
+            waiting = ser.inWaiting()
     if hasattr(ser, "reset_output_buffer"):
         ser.reset_output_buffer()
 
 
+# Port attribute set after a failed exchange; see `drain_serial`.
+_RESYNC_FLAG = "_pydynamixel_resync"
+
+
+def drain_serial(ser, deadline=None):
+    """Clear both buffers, then discard input that arrives before `deadline`.
+
+    A reply that missed its timeout can still arrive after a plain flush, and
+    Protocol 1.0 status packets cannot be told apart from the reply to the
+    next request of the same ID and length. `deadline` is a
+    `time.perf_counter()` value and defaults to one `timing.drain_window` from
+    now; input arriving meanwhile extends it. Ports without `in_waiting` are
+    only flushed.
+    """
+    flush_serial(ser)
+    if not hasattr(ser, "in_waiting"):
+        return
+    baudrate = getattr(ser, "baudrate", None) or registers.DEFAULT_BAUDRATE
+    window = timing.drain_window(baudrate)
+    poll = timing.packet_time(timing.STATUS_PACKET_SIZE, baudrate)
+    if deadline is None:
+        deadline = time.perf_counter() + window
+    while True:
+        now = time.perf_counter()
+        waiting = ser.in_waiting
+        if waiting:
+            ser.read(waiting)
+            deadline = max(deadline, now + window)
+        elif now >= deadline:
+            return
+        else:
+            time.sleep(min(poll, deadline - now))
+
+
+def _mark_resync(ser, pending):
+    # The flag holds the drain deadline, so time spent before the next
+    # exchange (backoff, caller work) counts towards the drain window.
+    deadline = None
+    if pending:
+        deadline = time.perf_counter() + timing.drain_window(getattr(ser, "baudrate", None) or registers.DEFAULT_BAUDRATE)
+    try:
+        setattr(ser, _RESYNC_FLAG, deadline)
+    except AttributeError:
+        # Ports that cannot carry the flag are drained right away instead.
+        if pending:
+            drain_serial(ser, deadline)
+
+
+# Port attribute holding the STATUS_RETURN_LEVELs learned on that port.
+_LEVELS_ATTRIBUTE = "_pydynamixel_status_return_levels"
+
+
+def status_return_levels(ser):
+    """Return the `{servo_id: STATUS_RETURN_LEVEL}` dict shared by every bus on port `ser`.
+
+    The levels describe the servos on the wire, so buses created per call
+    (such as the `chain` functions) reuse what earlier ones learned. Ports
+    that cannot carry the attribute get a fresh dict each time.
+    """
+    levels = getattr(ser, _LEVELS_ATTRIBUTE, None)
+    if levels is None:
+        levels = {}
+        try:
+            setattr(ser, _LEVELS_ATTRIBUTE, levels)
+        except AttributeError:
+            pass
+    return levels
+
+
 def get_error_string(error):
     """Convert a protocol error bitfield to a human-readable message."""
     errors = []
@@ -89,28 +163,104 @@ def _read_exact(ser, size):
     return data
 
 
-def get_response(ser):
-    """Read and decode one status packet."""
-    last = None
+def expected_parameter_count(packet):
+    """Return the number of parameters in the status packet answering `packet`.
+
+    Protocol 1.0 status packets do not echo the instruction: READ_DATA replies
+    carry the requested bytes and every other reply is empty.
+    """
+    if len(packet) > 6 and packet[4] == registers.INSTRUCTION.READ_DATA:
+        return packet[6]
+    return 0
+
+
+def is_stale_response(response, servo_id, parameter_count):
+    """Return True if `response` cannot be the reply to the current request."""
+    if servo_id is not None and servo_id != registers.BROADCAST_ID and response.servo_id != servo_id:
+        return True
+    # Error replies may come back without the requested data.
+    if parameter_count is not None and len(response.payload) != parameter_count:
+        return not (response.error and not response.payload)
+    return False
+
+
+def get_response(ser, record=None, servo_id=None, parameter_count=None):
+    """Read and decode one status packet.
+
+    The packet is pulled with one read for the header and one for the rest;
+    leading garbage is skipped by the decoder. Complete frames from another
+    servo (`servo_id`) or with another parameter count (`parameter_count`)
+    are late replies to earlier requests; they are discarded and reading
+    continues. When a `TransactionRecord` is given, bytes received, stale
+    frames and the first-byte/read/decode phases are added to it.
+    """
+    decoder = StatusDecoder(emit_corrupt=True)
+    clock = time.perf_counter
+    mark = clock()
+    first = True
     while True:
-        b = _read_exact(ser, 1)[0]
-        if b == 0xFF and last == 0xFF:
-            break
-        last = b
+        data = _read_exact(ser, decoder.bytes_needed())
+        if record is not None:
+            now = clock()
+            if first:
+                record.first_byte += now - mark
+                first = False
+            else:
+                record.read += now - mark
+            record.bytes_received += len(data)
+            mark = now
+        responses = decoder.feed(data)
+        if record is not None:
+            now = clock()
+            record.decode += now - mark
+            mark = now
+        for response in responses:
+            if not response.checksum_match:
+                raise ChecksumError(f"Checksum mismatch in status packet from servo {response.servo_id}.")
+            if is_stale_response(response, servo_id, parameter_count):
+                if record is not None:
+                    record.stale_frames += 1
+                continue
+            return response
+
+
+def _begin_record(packet, started, expect_response):
+    """Start a `TransactionRecord` for `packet`, whose encoding began at `started`."""
+    now = time.perf_counter()
+    if started is None:
+        started = now
+    record = TransactionRecord(expect_response=expect_response, encode=now - started, total=started)
+    if len(packet) > 4:
+        record.servo_id = packet[2]
+        record.instruction = packet[4]
+    return record
+
 
-    servo_id = _read_exact(ser, 1)[0]
-    length = _read_exact(ser, 1)[0]
-    error = _read_exact(ser, 1)[0]
+def _finish_record(observer, record):
+    record.total = time.perf_counter() - record.total
+    observer.on_transaction(record)
 
-    param_len = length - 2
-    params = list(_read_exact(ser, param_len)) if param_len > 0 else []
-    checksum = _read_exact(ser, 1)[0]
 
-    calc = packets.checksum([servo_id, length, error] + params)
-    if checksum != calc:
-        raise Exception(f"Checksum mismatch ({checksum} vs {calc}).")
+def _write(ser, packet, record):
+    if record is None:
+        ser.write(packet)
+        return
+    mark = time.perf_counter()
+    ser.write(packet)
+    record.write += time.perf_counter() - mark
+    record.bytes_sent += len(packet)
+    record.attempts += 1
 
-    return Response(servo_id, error, params, True)
+
+def send_packet(ser, packet, observer=None, started=None):
+    """Write a packet that gets no status packet back (ACTION, SYNC_WRITE, broadcasts)."""
+    if observer is None:
+        ser.write(packet)
+        return
+    record = _begin_record(packet, started, False)
+    _write(ser, packet, record)
+    record.ok = True
+    _finish_record(observer, record)
 
 
 def write_and_get_response_multiple(
@@ -119,56 +269,115 @@ def write_and_get_response_multiple(
     servo_id=None,
     verbose=VERBOSE,
     attempts=NUM_ERROR_ATTEMPTS,
+    expect_response=True,
+    observer=None,
+    started=None,
 ):
-    """Write packet and retry until a valid response is received."""
+    """Write packet and retry until a valid response is received.
+
+    With `expect_response=False` the packet is written once and `None` is
+    returned, for servos whose status return level suppresses the reply.
+    `attempts` is either an attempt count or a `RetryPolicy` adding backoff,
+    a retry budget and an optional per-servo circuit breaker.
+    The port is not flushed before the exchange: late status packets are
+    recognized by servo ID and length and skipped (see `get_response`).
+    Retries resend the same request, so a late reply to an earlier attempt is
+    a valid answer and the port is not drained between them; an exchange that
+    had a failed attempt marks the port for a short drain (see `drain_serial`)
+    before the next exchange.
+    When an `observer` is given, a `TransactionRecord` of the exchange is
+    passed to its `on_transaction` method; `started` is the `perf_counter`
+    time at which the caller began encoding the packet.
+    """
     if isinstance(packet, list):
         packet = bytes(packet)
+    if not expect_response:
+        send_packet(ser, packet, observer, started)
+        return None
 
-    for i in range(attempts):
-        try:
-            flush_serial(ser)
-            ser.write(packet)
-            response = get_response(ser)
-
-            if servo_id is not None and response.servo_id != servo_id:
-                raise Exception(f"Got packet from {response.servo_id}, expected {servo_id}.")
-            if not response.checksum_match:
-                raise Exception("Checksum mismatch.")
-            if response.error > 0:
-                raise get_exception(response.error)
-            return response
-        except DynamixelFatalError:
-            raise
-        except Exception as exc:
-            if verbose:
-                print(f"Got exception when waiting for response from {servo_id} on attempt {i + 1}: {exc}")
-
-    raise Exception(f"Unable to read response for servo {servo_id}")
-
-
-def _require_range(name, value, minimum, maximum):
+    policy = attempts if isinstance(attempts, RetryPolicy) else None
+    if policy is not None:
+        attempts = policy.attempts
+    record = None if observer is None else _begin_record(packet, started, True)
+    parameter_count = expected_parameter_count(packet)
+    failed = False
+    try:
+        if policy is not None:
+            policy.before_exchange(servo_id)
+        resync = getattr(ser, _RESYNC_FLAG, None)
+        if resync is not None:
+            drain_serial(ser, resync)
+            _mark_resync(ser, False)
+        for i in range(attempts):
+            if i and policy is not None and not policy.before_retry(i):
+                break
+            try:
+                _write(ser, packet, record)
+                response = get_response(ser, record, servo_id, parameter_count)
+
+                if response.error > 0:
+                    raise get_exception(response.error)
+                if record is not None:
+                    record.ok = True
+                if policy is not None:
+                    policy.on_success(servo_id)
+                return response
+            except DynamixelFatalError:
+                if record is not None:
+                    record.errors += 1
+                if policy is not None:
+                    policy.on_success(servo_id)
+                raise
+            except ReplayMismatchError:
+                # Retrying cannot bring a diverged replay back in step.
+                raise
+            except Exception as exc:
+                failed = True
+                if record is not None:
+                    if isinstance(exc, TimeoutError):
+                        record.timeouts += 1
+                    elif isinstance(exc, ChecksumError):
+                        record.checksum_errors += 1
+                    else:
+                        record.errors += 1
+                if verbose:
+                    print(f"Got exception when waiting for response from {servo_id} on attempt {i + 1}: {exc}")
+
+        if policy is not None:
+            policy.on_failure(servo_id)
+        raise Exception(f"Unable to read response for servo {servo_id}")
+    finally:
+        if failed:
+            # A late reply to a failed attempt may still be on its way.
+            _mark_resync(ser, True)
+        if record is not None:
+            _finish_record(observer, record)
+
+
+def require_range(name, value, minimum, maximum):
     """Validate an integer range for register write safety."""
     if not minimum <= value <= maximum:
         raise ValueError(f"{name} must be in range [{minimum}, {maximum}], got {value}.")
 
 
-def ping(ser, servo_id, verbose=VERBOSE, num_error_attempts=NUM_ERROR_ATTEMPTS):
+def ping(ser, servo_id, verbose=VERBOSE, num_error_attempts=NUM_ERROR_ATTEMPTS, observer=None):
     """Return True if a servo responds to ping."""
+    started = time.perf_counter()
     packet = packets.get_ping_packet(servo_id)
     try:
-        write_and_get_response_multiple(ser, packet, servo_id, verbose, num_error_attempts)
+        write_and_get_response_multiple(ser, packet, servo_id, verbose, num_error_attempts, True, observer, started)
         return True
     except Exception:
         return False
 
 
-def scan(ser, begin_id=0, end_id=253, verbose=False):
-    """Scan a servo ID range and return discovered IDs."""
-    found = []
-    for sid in range(begin_id, end_id + 1):
-        if ping(ser, sid, verbose=verbose, num_error_attempts=1):
-            found.append(sid)
-    return found
+def scan(ser, begin_id=0, end_id=253, verbose=False, timeout=None, expected_count=None):
+    """Scan a servo ID range and return discovered IDs.
+
+    Probes use a short timeout derived from the baud rate (see
+    `discovery.scan`) instead of the port timeout.
+    """
+    return discovery.scan(ser, begin_id, end_id, timeout=timeout, expected_count=expected_count, verbose=verbose)
 
 
 def get_read_packet(servo_id, register, num_bytes=2):
@@ -176,49 +385,136 @@ def get_read_packet(servo_id, register, num_bytes=2):
     return packets.get_read_packet(servo_id, register, num_bytes)
 
 
-def read_data(ser, servo_id, register, num_bytes, verbose=VERBOSE, num_error_attempts=NUM_ERROR_ATTEMPTS):
-    """Read raw bytes from a servo register region."""
+def read_response(ser, servo_id, register, num_bytes, verbose=VERBOSE, num_error_attempts=NUM_ERROR_ATTEMPTS, observer=None):
+    """Read a servo register region and return the `Response`, for decoding with its accessors."""
+    started = time.perf_counter()
     packet = packets.get_read_packet(servo_id, register, num_bytes)
-    resp = write_and_get_response_multiple(ser, packet, servo_id, verbose, num_error_attempts)
-    if len(resp.data) != num_bytes:
-        raise Exception(f"Read length mismatch (expected {num_bytes}, got {len(resp.data)}).")
-    return resp.data
+    resp = write_and_get_response_multiple(ser, packet, servo_id, verbose, num_error_attempts, True, observer, started)
+    if len(resp.payload) != num_bytes:
+        raise Exception(f"Read length mismatch (expected {num_bytes}, got {len(resp.payload)}).")
+    return resp
 
 
-def read_byte(ser, servo_id, register, verbose=VERBOSE, num_error_attempts=NUM_ERROR_ATTEMPTS):
+def read_data(ser, servo_id, register, num_bytes, verbose=VERBOSE, num_error_attempts=NUM_ERROR_ATTEMPTS, observer=None):
+    """Read raw bytes from a servo register region."""
+    return read_response(ser, servo_id, register, num_bytes, verbose, num_error_attempts, observer).data
+
+
+def read_byte(ser, servo_id, register, verbose=VERBOSE, num_error_attempts=NUM_ERROR_ATTEMPTS, observer=None):
     """Read one byte from a register."""
-    return read_data(ser, servo_id, register, 1, verbose, num_error_attempts)[0]
+    return read_response(ser, servo_id, register, 1, verbose, num_error_attempts, observer).u8()
 
 
-def read_word(ser, servo_id, register, verbose=VERBOSE, num_error_attempts=NUM_ERROR_ATTEMPTS):
+def read_word(ser, servo_id, register, verbose=VERBOSE, num_error_attempts=NUM_ERROR_ATTEMPTS, observer=None):
     """Read one 16-bit little-endian word from a register."""
-    data = read_data(ser, servo_id, register, 2, verbose, num_error_attempts)
-    return (data[1] << 8) | data[0]
+    return read_response(ser, servo_id, register, 2, verbose, num_error_attempts, observer).u16()
+
+
+def read_snapshot(ser, servo_id, eeprom=False, verbose=VERBOSE, num_error_attempts=NUM_ERROR_ATTEMPTS, observer=None):
+    """Read the RAM block (or the whole EEPROM+RAM table) in one READ_DATA exchange."""
+    start = registers.EEPROM_START if eeprom else registers.RAM_START
+    resp = read_response(ser, servo_id, start, registers.CONTROL_TABLE_SIZE - start, verbose, num_error_attempts, observer)
+    return ServoSnapshot.from_control_table(servo_id, resp.payload, start)
 
 
-def write_byte(ser, servo_id, register, value, deferred=False, verbose=VERBOSE, num_error_attempts=NUM_ERROR_ATTEMPTS):
+def write_byte(
+    ser,
+    servo_id,
+    register,
+    value,
+    deferred=False,
+    verbose=VERBOSE,
+    num_error_attempts=NUM_ERROR_ATTEMPTS,
+    expect_response=True,
+    observer=None,
+):
     """Write one byte to a register."""
-    _require_range("byte value", value, 0, 0xFF)
-    if deferred:
-        packet = packets.get_reg_write_packet_1b(servo_id, register, value)
-    else:
-        packet = packets.get_write_packet_1b(servo_id, register, value)
-    write_and_get_response_multiple(ser, packet, servo_id, verbose, num_error_attempts)
+    require_range("byte value", value, 0, 0xFF)
+    started = time.perf_counter()
+    instruction = registers.INSTRUCTION.REG_WRITE if deferred else registers.INSTRUCTION.WRITE_DATA
+    packet = packets.get_write_template(servo_id, instruction, register, 1).encode(value)
+    write_and_get_response_multiple(ser, packet, servo_id, verbose, num_error_attempts, expect_response, observer, started)
 
 
-def write_word(ser, servo_id, register, value, deferred=False, verbose=VERBOSE, num_error_attempts=NUM_ERROR_ATTEMPTS):
+def write_word(
+    ser,
+    servo_id,
+    register,
+    value,
+    deferred=False,
+    verbose=VERBOSE,
+    num_error_attempts=NUM_ERROR_ATTEMPTS,
+    expect_response=True,
+    observer=None,
+):
     """Write one 16-bit word to a register."""
-    _require_range("word value", value, 0, 0xFFFF)
-    if deferred:
-        packet = packets.get_reg_write_packet_2b(servo_id, register, value)
-    else:
-        packet = packets.get_write_packet_2b(servo_id, register, value)
-    write_and_get_response_multiple(ser, packet, servo_id, verbose, num_error_attempts)
+    require_range("word value", value, 0, 0xFFFF)
+    started = time.perf_counter()
+    instruction = registers.INSTRUCTION.REG_WRITE if deferred else registers.INSTRUCTION.WRITE_DATA
+    packet = packets.get_write_template(servo_id, instruction, register, 2).encode(value)
+    write_and_get_response_multiple(ser, packet, servo_id, verbose, num_error_attempts, expect_response, observer, started)
 
 
-def send_action_packet(ser):
+def send_action_packet(ser, observer=None):
     """Send broadcast ACTION packet."""
-    ser.write(packets.get_action_packet())
+    send_packet(ser, packets.get_action_packet(), observer)
+
+
+def sync_write(ser, register, data_length, data, observer=None):
+    """Send a broadcast SYNC_WRITE packet; servos do not return a status packet."""
+    started = time.perf_counter()
+    send_packet(ser, packets.get_sync_write_packet(register, data_length, data), observer, started)
+
+
+def sync_write_words(ser, register, rows, observer=None):
+    """SYNC_WRITE consecutive words from `(servo_id, word, ...)` rows."""
+    for row in rows:
+        for value in row[1:]:
+            require_range("word value", value, 0, 0xFFFF)
+    started = time.perf_counter()
+    send_packet(ser, packets.get_sync_write_words_packet(register, rows), observer, started)
+
+
+def sync_move(ser, vector, observer=None):
+    """Write goal position and moving speed for all `(id, angle, velocity)` tuples in one packet.
+
+    Values are validated before anything is sent and take effect immediately
+    (no ACTION packet is required).
+    """
+    vector = list(vector)
+    for _servo_id, position, velocity in vector:
+        require_range("position", position, registers.POSITION_MIN, registers.POSITION_MAX)
+        require_range("velocity", velocity, registers.SPEED_MIN, registers.SPEED_MAX)
+    if vector:
+        started = time.perf_counter()
+        template = packets.get_sync_write_template(registers.GOAL_POSITION, 4, [row[0] for row in vector])
+        send_packet(ser, template.encode_words([row[1:] for row in vector]), observer, started)
+
+
+def sync_move_array(ser, ids, positions, speeds, observer=None):
+    """Write goal positions and moving speeds given as arrays, one entry per ID, in one packet.
+
+    Values are range-checked in one vectorized pass and encoded directly into
+    the SYNC_WRITE template buffer. Requires NumPy.
+    """
+    ids = tuple(ids)
+    if ids:
+        started = time.perf_counter()
+        template = packets.get_sync_write_template(registers.GOAL_POSITION, 4, ids)
+        send_packet(ser, arrays.encode_sync_move(template, positions, speeds), observer, started)
+
+
+def sync_move_rows(ser, ids, rows, observer=None):
+    """Write goal position and moving speed from raw rows in one SYNC_WRITE packet.
+
+    `rows` is a bytes-like object with four bytes per ID (position, then
+    speed, little-endian), e.g. `PoseLibrary` rows; it is not range-checked.
+    """
+    ids = tuple(ids)
+    if ids:
+        started = time.perf_counter()
+        template = packets.get_sync_write_template(registers.GOAL_POSITION, 4, ids)
+        send_packet(ser, template.encode_rows(rows), observer, started)
 
 
 def set_led(ser, servo_id, value, verbose=VERBOSE, num_error_attempts=NUM_ERROR_ATTEMPTS):
@@ -231,21 +527,21 @@ def get_torque(ser, servo_id, verbose=VERBOSE, num_error_attempts=NUM_ERROR_ATTE
     return read_word(ser, servo_id, registers.PRESENT_LOAD, verbose, num_error_attempts)
 
 
-def get_position(ser, servo_id, verbose=VERBOSE, num_error_attempts=NUM_ERROR_ATTEMPTS):
+def get_position(ser, servo_id, verbose=VERBOSE, num_error_attempts=NUM_ERROR_ATTEMPTS, observer=None):
     """Read present position register."""
-    return read_word(ser, servo_id, registers.PRESENT_POSITION, verbose, num_error_attempts)
+    return read_word(ser, servo_id, registers.PRESENT_POSITION, verbose, num_error_attempts, observer)
 
 
-def set_position(ser, servo_id, position, verbose=VERBOSE, num_error_attempts=NUM_ERROR_ATTEMPTS):
+def set_position(ser, servo_id, position, verbose=VERBOSE, num_error_attempts=NUM_ERROR_ATTEMPTS, expect_response=True, observer=None):
     """Stage goal position write with value validation."""
-    _require_range("position", position, registers.POSITION_MIN, registers.POSITION_MAX)
-    write_word(ser, servo_id, registers.GOAL_POSITION, position, True, verbose, num_error_attempts)
+    require_range("position", position, registers.POSITION_MIN, registers.POSITION_MAX)
+    write_word(ser, servo_id, registers.GOAL_POSITION, position, True, verbose, num_error_attempts, expect_response, observer)
 
 
-def set_velocity(ser, servo_id, velocity, verbose=VERBOSE, num_error_attempts=NUM_ERROR_ATTEMPTS):
+def set_velocity(ser, servo_id, velocity, verbose=VERBOSE, num_error_attempts=NUM_ERROR_ATTEMPTS, expect_response=True, observer=None):
     """Stage moving-speed write with value validation."""
-    _require_range("velocity", velocity, registers.SPEED_MIN, registers.SPEED_MAX)
-    write_word(ser, servo_id, registers.MOVING_SPEED, velocity, True, verbose, num_error_attempts)
+    require_range("velocity", velocity, registers.SPEED_MIN, registers.SPEED_MAX)
+    write_word(ser, servo_id, registers.MOVING_SPEED, velocity, True, verbose, num_error_attempts, expect_response, observer)
 
 
 def set_torque_enable(ser, servo_id, enabled, verbose=VERBOSE, num_error_attempts=NUM_ERROR_ATTEMPTS):
@@ -258,11 +554,11 @@ def get_is_moving(ser, servo_id, verbose=VERBOSE, num_error_attempts=NUM_ERROR_A
     return bool(read_byte(ser, servo_id, registers.MOVING, verbose, num_error_attempts))
 
 
-def init(ser, servo_id, verbose=VERBOSE, num_error_attempts=NUM_ERROR_ATTEMPTS):
+def init(ser, servo_id, verbose=VERBOSE, num_error_attempts=NUM_ERROR_ATTEMPTS, observer=None):
     """Initialize servo by writing current position as first goal position."""
-    position = get_position(ser, servo_id, verbose, num_error_attempts)
-    set_position(ser, servo_id, position, verbose, num_error_attempts)
-    send_action_packet(ser)
+    position = get_position(ser, servo_id, verbose, num_error_attempts, observer)
+    set_position(ser, servo_id, position, verbose, num_error_attempts, observer=observer)
+    send_action_packet(ser, observer)
 
 
 def get_ax12(ser, servo_id):
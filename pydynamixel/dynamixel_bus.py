@@ -3,120 +3,528 @@
 
 """Object-oriented bus controller for Dynamixel Protocol 1.0."""
 
-from typing import Iterable, List
+import functools
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
-from . import registers
+from . import discovery, packets, registers, timing
+from .adaptive_timeout import TimeoutEstimator
+from .arbiter import PRIORITY, BusArbiter
 from .ax12 import AX12
+from .batching import BatchWriter
+from .data import Response, ServoSnapshot, WaitStats
+from .instrumentation import BusObserver, ObserverGroup
+from .exceptions import DynamixelFatalError
+from .register_cache import RegisterCache
+from .retry import RetryPolicy
 from . import dynamixel
 
 
+def _exclusive(method):
+    """Run a bus method while owning the bus arbiter."""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.exclusive():
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
 class DynamixelBus:
-    """High-level object wrapper around a configured serial Dynamixel bus."""
+    """High-level object wrapper around a configured serial Dynamixel bus.
 
-    def __init__(self, serial_port, verbose: bool = True, attempts: int = 10):
+    All methods are thread-safe: every request/response exchange owns the bus
+    through a `BusArbiter`, and waiting callers are served by priority (see
+    `priority()`).
+    """
+
+    def __init__(
+        self,
+        serial_port,
+        verbose: bool = True,
+        attempts: Union[int, RetryPolicy] = 10,
+        cache: Optional[RegisterCache] = None,
+        track_status_return: bool = True,
+        observer: Optional[BusObserver] = None,
+        timeouts: Optional[TimeoutEstimator] = None,
+    ):
         """Initialize a bus wrapper.
 
         Args:
             serial_port: Open pyserial-compatible port object.
             verbose: Print retry diagnostics when communication fails.
-            attempts: Number of retries for request/response exchanges.
+            attempts: Number of retries for request/response exchanges, or a
+                `RetryPolicy`. A policy's `CircuitBreaker` without a probe gets
+                one that pings open servos from a background thread at
+                TELEMETRY priority.
+            cache: Optional register cache consulted by register reads.
+            track_status_return: Read each servo's STATUS_RETURN_LEVEL once per port and
+                skip waiting for status packets the servo will not send.
+            observer: Optional `BusObserver` (e.g. `BusMetrics`) given a
+                `TransactionRecord` for every exchange.
+            timeouts: Optional `TimeoutEstimator`; when set, the bus learns
+                each servo's round-trip time and sets the port timeout per
+                exchange instead of always waiting the full port timeout.
         """
         self.serial = serial_port
         self.verbose = verbose
         self.attempts = attempts
+        self.cache = cache
+        self.track_status_return = track_status_return
+        self.timeouts = timeouts
+        if timeouts is not None and timeouts.max_timeout is None:
+            timeouts.max_timeout = serial_port.timeout or registers.DEFAULT_TIMEOUT
+        self.observer = observer
+        self._status_return_levels: Dict[int, int] = dynamixel.status_return_levels(serial_port)
+        self._shrink_streak = 0
+        self.arbiter = BusArbiter()
+        self._local = threading.local()
+        self._batch: Optional[BatchWriter] = None
+        if isinstance(attempts, RetryPolicy) and attempts.breaker is not None and attempts.breaker.probe is None:
+            attempts.breaker.probe = self._probe
 
     @classmethod
-    def from_url(cls, url: str, baudrate: int = registers.DEFAULT_BAUDRATE, timeout: float = registers.DEFAULT_TIMEOUT, verbose: bool = True, attempts: int = 10):
-        """Create a bus from a serial URL path."""
+    def from_url(cls, url: str, baudrate: int = registers.DEFAULT_BAUDRATE, timeout: float = registers.DEFAULT_TIMEOUT, verbose: bool = True, attempts: int = 10, **options):
+        """Create a bus from a serial URL path; `options` go to the constructor."""
         serial_port = dynamixel.get_serial_for_url(url, baudrate=baudrate, timeout=timeout)
-        return cls(serial_port, verbose=verbose, attempts=attempts)
+        return cls(serial_port, verbose=verbose, attempts=attempts, **options)
 
     @classmethod
-    def from_com(cls, com: str, baudrate: int = registers.DEFAULT_BAUDRATE, timeout: float = registers.DEFAULT_TIMEOUT, verbose: bool = True, attempts: int = 10):
-        """Create a bus from a COM device path."""
+    def from_com(cls, com: str, baudrate: int = registers.DEFAULT_BAUDRATE, timeout: float = registers.DEFAULT_TIMEOUT, verbose: bool = True, attempts: int = 10, **options):
+        """Create a bus from a COM device path; `options` go to the constructor."""
         serial_port = dynamixel.get_serial_for_com(com, baudrate=baudrate, timeout=timeout)
-        return cls(serial_port, verbose=verbose, attempts=attempts)
+        return cls(serial_port, verbose=verbose, attempts=attempts, **options)
+
+    @contextmanager
+    def priority(self, level: int) -> Iterator[None]:
+        """Tag bus requests made by the current thread inside the block with `level`.
+
+        Lower levels are served first, e.g. `PRIORITY.CONTROL` writes jump
+        ahead of queued `PRIORITY.TELEMETRY` reads.
+        """
+        previous = getattr(self._local, "priority", PRIORITY.NORMAL)
+        self._local.priority = level
+        try:
+            yield
+        finally:
+            self._local.priority = previous
+
+    def exclusive(self):
+        """Own the bus for a block of exchanges that must not be interleaved."""
+        return self.arbiter.hold(getattr(self._local, "priority", PRIORITY.NORMAL))
+
+    @property
+    def observer(self) -> Optional[BusObserver]:
+        """Observer given a `TransactionRecord` for every exchange."""
+        return self._user_observer
+
+    @observer.setter
+    def observer(self, observer: Optional[BusObserver]) -> None:
+        self._user_observer = observer
+        if observer is not None and self.timeouts is not None:
+            self._observer = ObserverGroup(observer, self.timeouts)
+        else:
+            self._observer = observer if observer is not None else self.timeouts
+
+    def _arm_timeout(self, servo_id: int, request_size: int, response_size: int = timing.STATUS_PACKET_SIZE) -> None:
+        """Set the port timeout for the next exchange from the servo's round-trip estimate.
+
+        Changing a pyserial timeout reconfigures the port with system calls, so
+        the timeout is raised right away but lowered only after a run of
+        exchanges that all allow a much lower one (see `TimeoutEstimator.shrink`).
+        """
+        timeouts = self.timeouts
+        if timeouts is None:
+            return
+        timeouts.baudrate = getattr(self.serial, "baudrate", registers.DEFAULT_BAUDRATE)
+        timeout = timeouts.timeout(servo_id, request_size, response_size)
+        current = self.serial.timeout
+        if current is not None and timeout <= current:
+            if timeout >= current * timeouts.shrink:
+                self._shrink_streak = 0
+                return
+            self._shrink_streak += 1
+            if self._shrink_streak < timeouts.shrink_after:
+                return
+        self._shrink_streak = 0
+        self.serial.timeout = timeout
+
+    @property
+    def port(self):
+        """Port used for I/O: the serial port, or the batch writer inside `batch()`."""
+        return self._batch if self._batch is not None else self.serial
 
+    @contextmanager
+    def batch(self) -> Iterator[BatchWriter]:
+        """Coalesce packets that expect no reply into one serial write.
+
+        Inside the block, ACTION, SYNC_WRITE and writes to servos that will not
+        answer are queued and sent together when the block exits or
+        `flush_batch()` is called. Any exchange that needs a reply sends the
+        queued packets first, in the same write as its request. The bus is
+        owned by the calling thread for the duration of the block.
+        """
+        with self.exclusive():
+            if self._batch is not None:
+                yield self._batch
+                return
+            self._batch = BatchWriter(self.serial)
+            try:
+                yield self._batch
+            finally:
+                try:
+                    self._batch.flush_batch()
+                finally:
+                    self._batch = None
+
+    def flush_batch(self) -> None:
+        """Send packets queued by `batch()` now."""
+        if self._batch is not None:
+            self._batch.flush_batch()
+
+    def wait_stats(self) -> Dict[int, WaitStats]:
+        """Return time spent waiting for the bus, per priority class."""
+        return self.arbiter.stats()
+
+    @_exclusive
     def flush(self) -> None:
         """Flush serial buffers."""
-        dynamixel.flush_serial(self.serial)
+        dynamixel.flush_serial(self.port)
+
+    def _probe(self, servo_id: int) -> bool:
+        """Ping `servo_id` once, bypassing the retry policy; used by circuit breakers."""
+        with self.priority(PRIORITY.TELEMETRY), self.exclusive():
+            self._arm_timeout(servo_id, timing.PING_PACKET_SIZE)
+            try:
+                dynamixel.write_and_get_response_multiple(self.port, packets.get_ping_packet(servo_id), servo_id, False, 1)
+            except DynamixelFatalError:
+                return True
+            except Exception:
+                return False
+            return True
 
+    @_exclusive
     def ping(self, servo_id: int) -> bool:
         """Ping a single servo ID."""
-        return dynamixel.ping(self.serial, servo_id, verbose=self.verbose, num_error_attempts=self.attempts)
+        self._arm_timeout(servo_id, timing.PING_PACKET_SIZE)
+        return dynamixel.ping(self.port, servo_id, verbose=self.verbose, num_error_attempts=self.attempts, observer=self._observer)
+
+    @_exclusive
+    def scan(
+        self,
+        begin_id: int = 0,
+        end_id: int = 253,
+        expected_count: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> List[int]:
+        """Scan a range of IDs and return responsive IDs.
+
+        Args:
+            begin_id: First ID to probe.
+            end_id: Last ID to probe.
+            expected_count: Stop once this many servos have answered.
+            timeout: Per-probe wait; derived from the baud rate when omitted.
+        """
+        return dynamixel.scan(
+            self.port,
+            begin_id=begin_id,
+            end_id=end_id,
+            verbose=self.verbose,
+            timeout=timeout,
+            expected_count=expected_count,
+        )
+
+    @_exclusive
+    def scan_baudrates(
+        self,
+        baudrates: Optional[Iterable[int]] = None,
+        begin_id: int = 0,
+        end_id: int = 253,
+        expected_count: Optional[int] = None,
+    ) -> Dict[int, List[int]]:
+        """Scan several baud rates (standard AX-12 rates by default) and map each to the IDs found."""
+        return discovery.scan_baudrates(
+            self.port,
+            baudrates,
+            begin_id=begin_id,
+            end_id=end_id,
+            expected_count=expected_count,
+            verbose=self.verbose,
+        )
 
-    def scan(self, begin_id: int = 0, end_id: int = 253) -> List[int]:
-        """Scan a range of IDs and return responsive IDs."""
-        return dynamixel.scan(self.serial, begin_id=begin_id, end_id=end_id, verbose=self.verbose)
+    def _cached_read(self, servo_id: int, register: int, size: int, reader) -> int:
+        if self.cache is None:
+            self._arm_timeout(servo_id, timing.READ_PACKET_SIZE, timing.STATUS_PACKET_SIZE + size)
+            return reader(self.port, servo_id, register, verbose=self.verbose, num_error_attempts=self.attempts, observer=self._observer)
+        value = self.cache.get(servo_id, register, size)
+        if value is None:
+            self._arm_timeout(servo_id, timing.READ_PACKET_SIZE, timing.STATUS_PACKET_SIZE + size)
+            value = reader(self.port, servo_id, register, verbose=self.verbose, num_error_attempts=self.attempts, observer=self._observer)
+            self.cache.put(servo_id, register, size, value)
+        return value
 
+    def _invalidate(self, servo_id: int, register: int, size: int) -> None:
+        if self.cache is not None:
+            self.cache.invalidate(servo_id, register, size)
+
+    def _written(self, servo_id: int, register: int, size: int, value: int, deferred: bool) -> None:
+        # Deferred writes only take effect on ACTION, which invalidates RAM.
+        if self.cache is not None and not deferred:
+            self.cache.on_write(servo_id, register, size, value)
+        if deferred:
+            if register <= registers.STATUS_RETURN_LEVEL < register + size:
+                self._status_return_levels.pop(servo_id, None)
+        else:
+            self._track_written(servo_id, register, [(value >> (8 * i)) & 0xFF for i in range(size)])
+
+    def _track_written(self, servo_id: int, register: int, values: Sequence[int]) -> None:
+        """Follow writes that change a servo's ID, status return level or return delay."""
+        levels = self._status_return_levels
+        if register <= registers.STATUS_RETURN_LEVEL < register + len(values):
+            level = values[registers.STATUS_RETURN_LEVEL - register]
+            if servo_id == registers.BROADCAST_ID:
+                for known in levels:
+                    levels[known] = level
+            else:
+                levels[servo_id] = level
+        if self.timeouts is not None and register <= registers.RETURN_DELAY < register + len(values):
+            return_delay = values[registers.RETURN_DELAY - register]
+            for target in list(levels) if servo_id == registers.BROADCAST_ID else [servo_id]:
+                self.timeouts.set_return_delay(target, return_delay)
+        if register <= registers.ID < register + len(values) and servo_id in levels:
+            levels[values[registers.ID - register]] = levels.pop(servo_id)
+
+    def _expects_reply(self, servo_id: int, register: int, values: Sequence[int]) -> bool:
+        """Return True if a write to `servo_id` will be answered by a status packet."""
+        if servo_id == registers.BROADCAST_ID:
+            return False
+        if not self.track_status_return:
+            return True
+        if register <= registers.STATUS_RETURN_LEVEL < register + len(values):
+            # The status packet for this write follows the level being written.
+            level = values[registers.STATUS_RETURN_LEVEL - register]
+        else:
+            try:
+                level = self.get_status_return_level(servo_id)
+            except Exception:
+                # Unreadable (e.g. NO_STATUS_PACKET, or a transient failure); wait
+                # for a reply this time and read the level again on the next write.
+                level = registers.STATUS_RETURN.RETURN_FOR_ALL_PACKETS
+        return level >= registers.STATUS_RETURN.RETURN_FOR_ALL_PACKETS
+
+    @_exclusive
+    def get_status_return_level(self, servo_id: int) -> int:
+        """Return the servo's STATUS_RETURN_LEVEL, reading it from the servo only once."""
+        level = self._status_return_levels.get(servo_id)
+        if level is None:
+            level = self.read_byte(servo_id, registers.STATUS_RETURN_LEVEL)
+            self._status_return_levels[servo_id] = level
+        return level
+
+    @_exclusive
+    def set_status_return_level(self, servo_id: int, level: int, write: bool = True) -> None:
+        """Set a servo's STATUS_RETURN_LEVEL.
+
+        STATUS_RETURN_LEVEL lives in EEPROM, so change it per session rather
+        than per command. With `write=False` the level is only recorded, e.g.
+        for servos set to NO_STATUS_PACKET whose level cannot be read back.
+        """
+        if write:
+            self.write_byte(servo_id, registers.STATUS_RETURN_LEVEL, level)
+        else:
+            self._status_return_levels[servo_id] = level
+
+    @_exclusive
+    def read_data(self, servo_id: int, register: int, num_bytes: int) -> List[int]:
+        """Read raw bytes from a servo register region, bypassing the cache."""
+        return self.read_response(servo_id, register, num_bytes).data
+
+    @_exclusive
+    def read_response(self, servo_id: int, register: int, num_bytes: int) -> Response:
+        """Read a servo register region, bypassing the cache, and return the `Response`.
+
+        Decode fields with `Response.u8`/`u16`/`sign_magnitude`/`unpack`.
+        """
+        self._arm_timeout(servo_id, timing.READ_PACKET_SIZE, timing.STATUS_PACKET_SIZE + num_bytes)
+        return dynamixel.read_response(self.port, servo_id, register, num_bytes, verbose=self.verbose, num_error_attempts=self.attempts, observer=self._observer)
+
+    @_exclusive
     def read_byte(self, servo_id: int, register: int) -> int:
         """Read one byte from a servo register."""
-        return dynamixel.read_byte(self.serial, servo_id, register, verbose=self.verbose, num_error_attempts=self.attempts)
+        return self._cached_read(servo_id, register, 1, dynamixel.read_byte)
 
+    @_exclusive
     def read_word(self, servo_id: int, register: int) -> int:
         """Read one word from a servo register."""
-        return dynamixel.read_word(self.serial, servo_id, register, verbose=self.verbose, num_error_attempts=self.attempts)
+        return self._cached_read(servo_id, register, 2, dynamixel.read_word)
 
+    def snapshot(self, ids: Iterable[int], eeprom: bool = False) -> List[ServoSnapshot]:
+        """Read a control-table snapshot per servo, one READ_DATA exchange each.
+
+        Args:
+            ids: Servo IDs to read.
+            eeprom: Read EEPROM and RAM (0x00-0x31) instead of only RAM (0x18-0x31).
+        """
+        snapshots = []
+        for servo_id in ids:
+            # Hold the bus per servo so higher-priority requests can cut in.
+            with self.exclusive():
+                start = registers.EEPROM_START if eeprom else registers.RAM_START
+                self._arm_timeout(servo_id, timing.READ_PACKET_SIZE, timing.STATUS_PACKET_SIZE + registers.CONTROL_TABLE_SIZE - start)
+                snapshot = dynamixel.read_snapshot(
+                    self.port, servo_id, eeprom, verbose=self.verbose, num_error_attempts=self.attempts, observer=self._observer
+                )
+                if self.cache is not None:
+                    self.cache.put_snapshot(snapshot)
+                if snapshot.status_return_level is not None:
+                    self._status_return_levels[snapshot.servo_id] = snapshot.status_return_level
+                if snapshot.return_delay is not None and self.timeouts is not None:
+                    self.timeouts.set_return_delay(snapshot.servo_id, snapshot.return_delay)
+            snapshots.append(snapshot)
+        return snapshots
+
+    @_exclusive
     def write_byte(self, servo_id: int, register: int, value: int, deferred: bool = False) -> None:
         """Write one byte to a servo register."""
+        self._invalidate(servo_id, register, 1)
+        expect_response = self._expects_reply(servo_id, register, [value & 0xFF])
+        self._arm_timeout(servo_id, timing.PACKET_OVERHEAD + 1 + 1)
         dynamixel.write_byte(
-            self.serial,
+            self.port,
             servo_id,
             register,
             value,
             deferred=deferred,
             verbose=self.verbose,
             num_error_attempts=self.attempts,
+            observer=self._observer,
+            expect_response=expect_response,
         )
+        self._written(servo_id, register, 1, value, deferred)
 
+    @_exclusive
     def write_word(self, servo_id: int, register: int, value: int, deferred: bool = False) -> None:
         """Write one word to a servo register."""
+        self._invalidate(servo_id, register, 2)
+        expect_response = self._expects_reply(servo_id, register, [value & 0xFF, (value >> 8) & 0xFF])
+        self._arm_timeout(servo_id, timing.PACKET_OVERHEAD + 1 + 2)
         dynamixel.write_word(
-            self.serial,
+            self.port,
             servo_id,
             register,
             value,
             deferred=deferred,
             verbose=self.verbose,
             num_error_attempts=self.attempts,
+            observer=self._observer,
+            expect_response=expect_response,
         )
+        self._written(servo_id, register, 2, value, deferred)
 
+    @_exclusive
     def send_action(self) -> None:
         """Send ACTION broadcast packet."""
-        dynamixel.send_action_packet(self.serial)
+        dynamixel.send_action_packet(self.port, self._observer)
+        if self.cache is not None:
+            self.cache.invalidate_ram()
+
+    @_exclusive
+    def sync_write(self, register: int, data_length: int, data: Iterable[Tuple[int, Sequence[int]]]) -> None:
+        """Write `data_length` bytes per servo starting at `register` in one SYNC_WRITE packet."""
+        data = list(data)
+        dynamixel.sync_write(self.port, register, data_length, data, self._observer)
+        for servo_id, values in data:
+            self._invalidate(servo_id, register, data_length)
+            self._track_written(servo_id, register, list(values))
+
+    @_exclusive
+    def sync_write_words(self, register: int, rows: Sequence[Sequence[int]]) -> None:
+        """Write consecutive words per servo from `(servo_id, word, ...)` rows in one SYNC_WRITE packet."""
+        dynamixel.sync_write_words(self.port, register, rows, self._observer)
+        for row in rows:
+            self._invalidate(row[0], register, 2 * (len(row) - 1))
+
+    @_exclusive
+    def sync_move(self, vector: Sequence[Tuple[int, int, int]]) -> None:
+        """Write goal position and moving speed for all joints in one SYNC_WRITE packet."""
+        dynamixel.sync_move(self.port, vector, self._observer)
+        for servo_id, _angle, _velocity in vector:
+            self._invalidate(servo_id, registers.GOAL_POSITION, 4)
+
+    @_exclusive
+    def sync_move_array(self, ids: Sequence[int], positions, speeds) -> None:
+        """Write goal positions and moving speeds from NumPy arrays (one entry per ID) in one SYNC_WRITE packet."""
+        dynamixel.sync_move_array(self.port, ids, positions, speeds, self._observer)
+        for servo_id in ids:
+            self._invalidate(servo_id, registers.GOAL_POSITION, 4)
+
+    @_exclusive
+    def sync_move_rows(self, ids: Sequence[int], rows) -> None:
+        """Write goal positions and moving speeds from raw rows (see `dynamixel.sync_move_rows`) in one SYNC_WRITE packet."""
+        dynamixel.sync_move_rows(self.port, ids, rows, self._observer)
+        for servo_id in ids:
+            self._invalidate(servo_id, registers.GOAL_POSITION, 4)
 
     def set_led(self, servo_id: int, value: int) -> None:
         """Set LED register."""
-        dynamixel.set_led(self.serial, servo_id, value, verbose=self.verbose, num_error_attempts=self.attempts)
+        self.write_byte(servo_id, registers.LED, value)
 
     def get_position(self, servo_id: int) -> int:
         """Read present position."""
-        return dynamixel.get_position(self.serial, servo_id, verbose=self.verbose, num_error_attempts=self.attempts)
+        return self.read_word(servo_id, registers.PRESENT_POSITION)
 
+    @_exclusive
     def set_position(self, servo_id: int, position: int) -> None:
         """Set goal position using deferred write."""
-        dynamixel.set_position(self.serial, servo_id, position, verbose=self.verbose, num_error_attempts=self.attempts)
+        expect_response = self._expects_reply(servo_id, registers.GOAL_POSITION, [0, 0])
+        self._arm_timeout(servo_id, timing.PACKET_OVERHEAD + 3)
+        dynamixel.set_position(
+            self.port,
+            servo_id,
+            position,
+            verbose=self.verbose,
+            num_error_attempts=self.attempts,
+            observer=self._observer,
+            expect_response=expect_response,
+        )
 
+    @_exclusive
     def set_velocity(self, servo_id: int, velocity: int) -> None:
         """Set moving speed using deferred write."""
-        dynamixel.set_velocity(self.serial, servo_id, velocity, verbose=self.verbose, num_error_attempts=self.attempts)
+        expect_response = self._expects_reply(servo_id, registers.MOVING_SPEED, [0, 0])
+        self._arm_timeout(servo_id, timing.PACKET_OVERHEAD + 3)
+        dynamixel.set_velocity(
+            self.port,
+            servo_id,
+            velocity,
+            verbose=self.verbose,
+            num_error_attempts=self.attempts,
+            observer=self._observer,
+            expect_response=expect_response,
+        )
 
     def get_is_moving(self, servo_id: int) -> bool:
         """Read moving flag."""
-        return dynamixel.get_is_moving(self.serial, servo_id, verbose=self.verbose, num_error_attempts=self.attempts)
+        return bool(self.read_byte(servo_id, registers.MOVING))
 
     def get_torque(self, servo_id: int) -> int:
         """Read present load/torque value."""
-        return dynamixel.get_torque(self.serial, servo_id, verbose=self.verbose, num_error_attempts=self.attempts)
+        return self.read_word(servo_id, registers.PRESENT_LOAD)
 
+    @_exclusive
     def init_servo(self, servo_id: int) -> None:
         """Initialize a servo to current position to avoid startup jerk."""
-        dynamixel.init(self.serial, servo_id, verbose=self.verbose, num_error_attempts=self.attempts)
+        self._arm_timeout(servo_id, timing.READ_PACKET_SIZE, timing.STATUS_PACKET_SIZE + 2)
+        dynamixel.init(self.port, servo_id, verbose=self.verbose, num_error_attempts=self.attempts, observer=self._observer)
+        if self.cache is not None:
+            self.cache.invalidate_ram()
 
     def servo(self, servo_id: int) -> AX12:
-        """Create an AX12 object bound to this bus."""
-        return AX12(self.serial, servo_id)
+        """Create an AX12 object bound to this bus (sharing its cache and settings)."""
+        return AX12(self.serial, servo_id, bus=self)
 
     def servos(self, ids: Iterable[int]) -> List[AX12]:
         """Create AX12 objects for a list of IDs."""
-        return [AX12(self.serial, servo_id) for servo_id in ids]
+        return [self.servo(servo_id) for servo_id in ids]
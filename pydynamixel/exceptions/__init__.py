@@ -3,6 +3,11 @@
 
 """Exception types for pydynamixel."""
 
+from .checksum_error import ChecksumError
 from .dynamixel_fatal_error import DynamixelFatalError
+from .move_timeout_error import MoveTimeoutError
+from .no_servos_found_error import NoServosFoundError
+from .replay_mismatch_error import ReplayMismatchError
+from .servo_unavailable_error import ServoUnavailableError
 
-__all__ = ["DynamixelFatalError"]
+__all__ = ["ChecksumError", "DynamixelFatalError", "MoveTimeoutError", "NoServosFoundError", "ReplayMismatchError", "ServoUnavailableError"]
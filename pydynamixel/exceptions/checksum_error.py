@@ -0,0 +1,8 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Status packet checksum exception type."""
+
+
+class ChecksumError(Exception):
+    """Raised when a received status packet fails its checksum."""
@@ -0,0 +1,13 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Move completion timeout exception type."""
+
+
+class MoveTimeoutError(TimeoutError):
+    """Raised when joints are still moving after a wait's timeout."""
+
+    def __init__(self, joints, timeout):
+        super().__init__(f"Joints {list(joints)} still moving after {timeout} s.")
+        self.joints = list(joints)
+        self.timeout = timeout
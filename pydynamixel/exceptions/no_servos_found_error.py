@@ -0,0 +1,11 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Empty bus exception type."""
+
+
+class NoServosFoundError(Exception):
+    """Raised when an operation that needs servos finds none on the bus."""
+
+    def __init__(self):
+        super().__init__("No servos found on the bus.")
@@ -0,0 +1,14 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Replay divergence exception type."""
+
+
+class ReplayMismatchError(Exception):
+    """Raised when a replayed session writes something other than the capture recorded."""
+
+    def __init__(self, index, expected, got):
+        super().__init__(f"Replay diverged at frame {index}: expected {bytes(expected or b'').hex()}, got {bytes(got).hex()}.")
+        self.index = index
+        self.expected = expected
+        self.got = got
@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Open circuit exception type."""
+
+
+class ServoUnavailableError(Exception):
+    """Raised without bus traffic when a servo's circuit breaker is open."""
+
+    def __init__(self, servo_id):
+        super().__init__(f"Servo {servo_id} is not responding; circuit open.")
+        self.servo_id = servo_id
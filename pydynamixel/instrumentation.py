@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Per-transaction bus instrumentation: observers, counters and histograms."""
+
+from bisect import bisect_left
+from typing import Dict, Optional
+
+from .data import TransactionRecord
+
+# Phases of a `TransactionRecord`, in exchange order.
+PHASES = ("encode", "write", "first_byte", "read", "decode", "total")
+
+# Histogram bucket upper bounds in seconds: 1 us to ~1 s in powers of two.
+BUCKET_BOUNDS = tuple(2**i * 1e-6 for i in range(21))
+
+
+class BusObserver:
+    """Base class for objects notified of every bus transaction.
+
+    `on_transaction` runs in the thread that made the exchange, right after
+    the exchange finished, so it should be cheap. Any object with an
+    `on_transaction(record)` method can be used as an observer.
+    """
+
+    def on_transaction(self, record: TransactionRecord) -> None:
+        """Handle one finished exchange."""
+
+
+class ObserverGroup(BusObserver):
+    """Forward every transaction to several observers in order."""
+
+    def __init__(self, *observers):
+        self.observers = [observer for observer in observers if observer is not None]
+
+    def on_transaction(self, record: TransactionRecord) -> None:
+        for observer in self.observers:
+            observer.on_transaction(record)
+
+
+class Histogram:
+    """Fixed-bucket latency histogram (see `BUCKET_BOUNDS`)."""
+
+    __slots__ = ("counts", "count", "sum", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKET_BOUNDS) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def add(self, value: float) -> None:
+        """Record one sample, in seconds."""
+        self.counts[bisect_left(BUCKET_BOUNDS, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+    def percentile(self, fraction: float) -> float:
+        """Return the upper bound of the bucket holding the `fraction` quantile."""
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                return BUCKET_BOUNDS[index] if index < len(BUCKET_BOUNDS) else self.max
+        return self.max
+
+    def export(self) -> Dict[str, object]:
+        """Return the histogram as plain data (times in seconds)."""
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "max": self.max,
+            "p50": self.percentile(0.50),
+            "p95": self.percentile(0.95),
+            "p99": self.percentile(0.99),
+            "buckets": {bound: count for bound, count in zip(BUCKET_BOUNDS + (float("inf"),), self.counts) if count},
+        }
+
+
+class BusMetrics(BusObserver):
+    """Counters and per-phase latency histograms for one bus.
+
+    The bus calls observers while it owns its arbiter, so updates from one
+    bus never race and no lock is taken. Use one instance per bus.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear all counters and histograms."""
+        self.transactions = 0
+        self.failures = 0
+        self.retries = 0
+        self.timeouts = 0
+        self.checksum_errors = 0
+        self.stale_frames = 0
+        self.errors = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.by_instruction: Dict[int, int] = {}
+        self.by_servo: Dict[Optional[int], int] = {}
+        self.phases = {phase: Histogram() for phase in PHASES}
+
+    def on_transaction(self, record: TransactionRecord) -> None:
+        self.transactions += 1
+        if not record.ok:
+            self.failures += 1
+        self.retries += record.retries
+        self.timeouts += record.timeouts
+        self.checksum_errors += record.checksum_errors
+        self.stale_frames += record.stale_frames
+        self.errors += record.errors
+        self.bytes_sent += record.bytes_sent
+        self.bytes_received += record.bytes_received
+        self.by_instruction[record.instruction] = self.by_instruction.get(record.instruction, 0) + 1
+        self.by_servo[record.servo_id] = self.by_servo.get(record.servo_id, 0) + 1
+        phases = self.phases
+        phases["encode"].add(record.encode)
+        phases["write"].add(record.write)
+        if record.expect_response:
+            phases["first_byte"].add(record.first_byte)
+            phases["read"].add(record.read)
+            phases["decode"].add(record.decode)
+        phases["total"].add(record.total)
+
+    def export(self) -> Dict[str, object]:
+        """Return all counters and histograms as plain data, e.g. for JSON."""
+        return {
+            "transactions": self.transactions,
+            "failures": self.failures,
+            "retries": self.retries,
+            "timeouts": self.timeouts,
+            "checksum_errors": self.checksum_errors,
+            "stale_frames": self.stale_frames,
+            "errors": self.errors,
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "by_instruction": dict(self.by_instruction),
+            "by_servo": dict(self.by_servo),
+            "phases": {phase: histogram.export() for phase, histogram in self.phases.items()},
+        }
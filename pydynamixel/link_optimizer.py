@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Move a whole bus to a faster baud rate and shorter return delay, safely."""
+
+import time
+from typing import Dict, List, Optional, Sequence
+
+from . import dynamixel, registers
+from .data import LinkReport
+from .dynamixel import require_range
+from .exceptions import NoServosFoundError
+
+# How long to wait after switching the host baud rate before talking again.
+SETTLE_TIME = 0.05
+
+
+def baud_rate_register(baudrate: int) -> int:
+    """Return the BAUD_RATE register value selecting `baudrate` bps."""
+    for value, bps in registers.BAUD_RATES.items():
+        if bps == baudrate:
+            return value
+    value = round(registers.BAUD_CLOCK / baudrate) - 1
+    if not 0 <= value <= 0xFE or abs(registers.BAUD_CLOCK / (value + 1) - baudrate) > registers.BAUD_TOLERANCE * baudrate:
+        raise ValueError(f"No BAUD_RATE register value selects {baudrate} bps.")
+    return value
+
+
+class LinkOptimizer:
+    """Migrate every servo on a bus to new link settings, verifying and rolling back.
+
+    `optimize` holds the bus for the whole migration: it records each servo's
+    BAUD_RATE and RETURN_DELAY, writes the new values to all servos in one
+    SYNC_WRITE each, switches (and by default reopens) the host port, and
+    reads the registers back from every servo. If any servo fails to verify,
+    all servos and the port are returned to their original settings.
+    A short read-throughput check runs before and after.
+    """
+
+    def __init__(
+        self,
+        bus,
+        ids: Optional[Sequence[int]] = None,
+        samples: int = 100,
+        reopen: bool = True,
+        settle_time: float = SETTLE_TIME,
+    ):
+        """Initialize an optimizer.
+
+        Args:
+            bus: `DynamixelBus` to migrate.
+            ids: Servo IDs on the bus; scanned when omitted.
+            samples: Register reads per throughput check.
+            reopen: Close and reopen the port around baud rate changes, for
+                adapters that do not switch rates on an open port.
+            settle_time: Pause after switching the host baud rate, in seconds.
+        """
+        self.bus = bus
+        self.ids = list(ids) if ids is not None else None
+        self.samples = samples
+        self.reopen = reopen
+        self.settle_time = settle_time
+
+    def measure(self, ids: Sequence[int]) -> float:
+        """Return PRESENT_POSITION reads per second, cycling through `ids`."""
+        read_data = self.bus.read_data
+        start = time.perf_counter()
+        for i in range(self.samples):
+            read_data(ids[i % len(ids)], registers.PRESENT_POSITION, 2)
+        elapsed = time.perf_counter() - start
+        return self.samples / elapsed if elapsed else 0.0
+
+    def _read_all(self, ids: Sequence[int], register: int) -> Dict[int, int]:
+        return {servo_id: self.bus.read_data(servo_id, register, 1)[0] for servo_id in ids}
+
+    def _verify(self, ids: Sequence[int], register: int, expected: int) -> List[int]:
+        """Return the IDs that do not answer with `expected` in `register`."""
+        failed = []
+        for servo_id in ids:
+            try:
+                if self.bus.read_data(servo_id, register, 1)[0] != expected:
+                    failed.append(servo_id)
+            except Exception:
+                failed.append(servo_id)
+        return failed
+
+    def _set_host_baudrate(self, baudrate: int) -> None:
+        port = self.bus.serial
+        if self.reopen and getattr(port, "is_open", False) and hasattr(port, "close"):
+            port.close()
+            port.baudrate = baudrate
+            port.open()
+        else:
+            port.baudrate = baudrate
+        time.sleep(self.settle_time)
+        dynamixel.flush_serial(port)
+
+    def _rollback(self, ids: Sequence[int], bauds: Dict[int, int], delays: Dict[int, int], baudrate: int) -> None:
+        # Every step runs even if an earlier one raises, so the host port is
+        # always back at `baudrate` before the return delays are restored.
+        try:
+            if self.bus.serial.baudrate != baudrate:
+                try:
+                    # Servos that switched listen at the new rate; send them back first.
+                    self.bus.sync_write(registers.BAUD_RATE, 1, [(servo_id, [bauds[servo_id]]) for servo_id in ids])
+                    time.sleep(self.settle_time)
+                finally:
+                    self._set_host_baudrate(baudrate)
+        finally:
+            self.bus.sync_write(registers.RETURN_DELAY, 1, [(servo_id, [delays[servo_id]]) for servo_id in ids])
+
+    def optimize(self, baudrate: Optional[int] = None, return_delay: Optional[int] = 0) -> LinkReport:
+        """Move all servos to `baudrate` bps and `return_delay`; `None` keeps a setting.
+
+        Returns a `LinkReport`; check `rolled_back` and `failed` for the outcome.
+        """
+        if return_delay is not None:
+            require_range("return delay", return_delay, 0, 0xFE)
+        value = None if baudrate is None else baud_rate_register(baudrate)
+
+        bus = self.bus
+        with bus.exclusive():
+            ids = self.ids if self.ids is not None else bus.scan()
+            if not ids:
+                raise NoServosFoundError()
+            original_baudrate = bus.serial.baudrate
+            report = LinkReport(ids=list(ids), baudrate_before=original_baudrate, baudrate_after=original_baudrate)
+            report.throughput_before = self.measure(ids)
+            bauds = self._read_all(ids, registers.BAUD_RATE)
+            delays = self._read_all(ids, registers.RETURN_DELAY)
+            report.return_delay_before = delays
+
+            try:
+                failed = []
+                if return_delay is not None:
+                    bus.sync_write(registers.RETURN_DELAY, 1, [(servo_id, [return_delay]) for servo_id in ids])
+                    failed = self._verify(ids, registers.RETURN_DELAY, return_delay)
+                if not failed and value is not None and baudrate != original_baudrate:
+                    bus.sync_write(registers.BAUD_RATE, 1, [(servo_id, [value]) for servo_id in ids])
+                    time.sleep(self.settle_time)
+                    self._set_host_baudrate(baudrate)
+                    failed = self._verify(ids, registers.BAUD_RATE, value)
+            except Exception:
+                failed = list(ids)
+
+            if failed:
+                report.failed = failed
+                report.rolled_back = True
+                self._rollback(ids, bauds, delays, original_baudrate)
+            else:
+                report.baudrate_after = bus.serial.baudrate
+                report.return_delay_after = return_delay
+            report.throughput_after = self.measure(ids)
+        return report
@@ -3,8 +3,17 @@
 
 """Packet utilities for Dynamixel Protocol 1.0 (AX-12 family)."""
 
+import collections
+import functools
+import threading
+
 from . import registers
 
+# Per-thread caches of mutable packet templates (see `get_write_template`).
+_templates = threading.local()
+# SYNC_WRITE templates kept per thread; the least recently used is dropped.
+SYNC_TEMPLATE_CACHE_SIZE = 64
+
 
 def checksum(data_bytes):
     """Return protocol-1 checksum for bytes starting at ID field."""
@@ -21,63 +30,93 @@ def instruction_packet(servo_id, instruction, params=()):
     """Build a generic instruction packet."""
     params = list(params)
     length = len(params) + 2
+    if length > 0xFF:
+        raise ValueError(f"Packet parameters too long ({len(params)} bytes, max {0xFF - 2}).")
     return get_packet([servo_id & 0xFF, length, instruction & 0xFF] + params)
 
 
+@functools.lru_cache(maxsize=4096)
+def constant_packet(servo_id, instruction, params=()):
+    """Return a cached packet for requests whose bytes never change (ping, read, action).
+
+    `params` must be a tuple; the returned `bytes` object is shared.
+    """
+    return instruction_packet(servo_id, instruction, params)
+
+
+class WriteTemplate:
+    """Preallocated WRITE_DATA/REG_WRITE packet patched in place for each value."""
+
+    __slots__ = ("buffer", "size", "_base")
+
+    def __init__(self, servo_id, instruction, register, size):
+        self.size = size
+        self.buffer = bytearray(instruction_packet(servo_id, instruction, [register & 0xFF] + [0] * size))
+        # Sum of ID, LENGTH, INSTRUCTION and register address.
+        self._base = sum(self.buffer[2:6])
+
+    def encode(self, value):
+        """Patch `value` (little-endian) and the checksum in; return the shared buffer."""
+        buffer = self.buffer
+        lsb = value & 0xFF
+        if self.size == 1:
+            buffer[6] = lsb
+            total = self._base + lsb
+        else:
+            msb = (value >> 8) & 0xFF
+            buffer[6] = lsb
+            buffer[7] = msb
+            total = self._base + lsb + msb
+        buffer[-1] = ~total & 0xFF
+        return buffer
+
+
+def get_write_template(servo_id, instruction, register, size):
+    """Return this thread's `WriteTemplate` for `(servo_id, instruction, register, size)`.
+
+    The buffer returned by `encode` is reused by the next call on the same
+    thread, so write it out (or copy it) before encoding another value.
+    """
+    cache = getattr(_templates, "write", None)
+    if cache is None:
+        cache = _templates.write = {}
+    key = (servo_id, instruction, register, size)
+    template = cache.get(key)
+    if template is None:
+        template = cache[key] = WriteTemplate(servo_id, instruction, register, size)
+    return template
+
+
 def get_ping_packet(servo_id):
-    return instruction_packet(servo_id, registers.INSTRUCTION.PING)
+    return constant_packet(servo_id, registers.INSTRUCTION.PING)
 
 
 def get_action_packet():
-    return instruction_packet(registers.BROADCAST_ID, registers.INSTRUCTION.ACTION)
+    return constant_packet(registers.BROADCAST_ID, registers.INSTRUCTION.ACTION)
 
 
 def get_reset_packet(servo_id):
-    return instruction_packet(servo_id, registers.INSTRUCTION.RESET)
+    return constant_packet(servo_id, registers.INSTRUCTION.RESET)
 
 
 def get_write_packet_1b(servo_id, register, data):
-    return instruction_packet(
-        servo_id,
-        registers.INSTRUCTION.WRITE_DATA,
-        [register & 0xFF, data & 0xFF],
-    )
+    return bytes(get_write_template(servo_id, registers.INSTRUCTION.WRITE_DATA, register, 1).encode(data))
 
 
 def get_write_packet_2b(servo_id, register, data):
-    lsb = data & 0xFF
-    msb = (data >> 8) & 0xFF
-    return instruction_packet(
-        servo_id,
-        registers.INSTRUCTION.WRITE_DATA,
-        [register & 0xFF, lsb, msb],
-    )
+    return bytes(get_write_template(servo_id, registers.INSTRUCTION.WRITE_DATA, register, 2).encode(data))
 
 
 def get_reg_write_packet_1b(servo_id, register, data):
-    return instruction_packet(
-        servo_id,
-        registers.INSTRUCTION.REG_WRITE,
-        [register & 0xFF, data & 0xFF],
-    )
+    return bytes(get_write_template(servo_id, registers.INSTRUCTION.REG_WRITE, register, 1).encode(data))
 
 
 def get_reg_write_packet_2b(servo_id, register, data):
-    lsb = data & 0xFF
-    msb = (data >> 8) & 0xFF
-    return instruction_packet(
-        servo_id,
-        registers.INSTRUCTION.REG_WRITE,
-        [register & 0xFF, lsb, msb],
-    )
+    return bytes(get_write_template(servo_id, registers.INSTRUCTION.REG_WRITE, register, 2).encode(data))
 
 
 def get_read_packet(servo_id, register, num_bytes=2):
-    return instruction_packet(
-        servo_id,
-        registers.INSTRUCTION.READ_DATA,
-        [register & 0xFF, num_bytes & 0xFF],
-    )
+    return constant_packet(servo_id, registers.INSTRUCTION.READ_DATA, (register & 0xFF, num_bytes & 0xFF))
 
 
 def get_write_position_packet(servo_id, position):
@@ -103,3 +142,133 @@ def get_read_torque_packet(servo_id):
 def get_read_is_moving_packet(servo_id):
     return get_read_packet(servo_id, registers.MOVING, 1)
 
+
+def get_sync_write_packet(register, data_length, data):
+    """Build a broadcast SYNC_WRITE packet.
+
+    `data` is an iterable of `(servo_id, values)` pairs where `values` holds
+    exactly `data_length` bytes to write starting at `register`.
+    """
+    params = [register & 0xFF, data_length & 0xFF]
+    for servo_id, values in data:
+        values = list(values)
+        if len(values) != data_length:
+            raise ValueError(f"SYNC_WRITE data for servo {servo_id} must be {data_length} bytes, got {len(values)}.")
+        params.append(servo_id & 0xFF)
+        params.extend(value & 0xFF for value in values)
+    return instruction_packet(registers.BROADCAST_ID, registers.INSTRUCTION.SYNC_WRITE, params)
+
+
+def get_sync_write_words_packet(register, rows):
+    """Build a SYNC_WRITE packet from `(servo_id, word, ...)` rows.
+
+    Each row writes consecutive 16-bit little-endian words starting at `register`.
+    """
+    rows = list(rows)
+    data_length = 2 * (len(rows[0]) - 1) if rows else 0
+    data = []
+    for servo_id, *words in rows:
+        values = []
+        for word in words:
+            values.append(word & 0xFF)
+            values.append((word >> 8) & 0xFF)
+        data.append((servo_id, values))
+    return get_sync_write_packet(register, data_length, data)
+
+
+def get_sync_move_packet(vector):
+    """Build a SYNC_WRITE of goal position and moving speed from `(id, angle, velocity)` tuples."""
+    return get_sync_write_words_packet(registers.GOAL_POSITION, vector)
+
+
+class SyncWriteTemplate:
+    """Preallocated SYNC_WRITE packet for a fixed list of servo IDs.
+
+    `words` is a NumPy view of the data bytes as 16-bit words, one row per
+    servo, created by array mode (`arrays.encode_sync_move`) on first use.
+    """
+
+    __slots__ = ("buffer", "ids", "data_length", "words", "_view")
+
+    def __init__(self, register, data_length, ids):
+        self.ids = tuple(ids)
+        self.data_length = data_length
+        self.buffer = bytearray(get_sync_write_packet(register, data_length, [(i, [0] * data_length) for i in self.ids]))
+        self.words = None
+        self._view = memoryview(self.buffer)
+
+    def _check_count(self, count):
+        if count != len(self.ids):
+            raise ValueError(f"SYNC_WRITE template for {len(self.ids)} servos got data for {count}.")
+
+    def _finish(self):
+        buffer = self.buffer
+        buffer[-1] = ~sum(self._view[2:-1]) & 0xFF
+        return buffer
+
+    def encode(self, data):
+        """Patch one `data_length`-byte sequence per servo (in `ids` order); return the shared buffer."""
+        buffer = self.buffer
+        length = self.data_length
+        offset = 8
+        count = 0
+        for values in data:
+            if len(values) != length:
+                raise ValueError(f"SYNC_WRITE data must be {length} bytes per servo, got {len(values)}.")
+            buffer[offset:offset + length] = values
+            offset += length + 1
+            count += 1
+        self._check_count(count)
+        return self._finish()
+
+    def encode_rows(self, data):
+        """Patch `data_length` bytes per servo from one contiguous buffer (in `ids` order); return the shared buffer."""
+        length = self.data_length
+        if len(data) != length * len(self.ids):
+            raise ValueError(f"SYNC_WRITE template for {len(self.ids)} servos needs {length * len(self.ids)} bytes, got {len(data)}.")
+        buffer = self.buffer
+        offset = 8
+        for source in range(0, len(data), length):
+            buffer[offset:offset + length] = data[source:source + length]
+            offset += length + 1
+        return self._finish()
+
+    def encode_words(self, rows):
+        """Patch one sequence of 16-bit words per servo (in `ids` order); return the shared buffer."""
+        buffer = self.buffer
+        length = self.data_length
+        stride = length + 1
+        offset = 8
+        count = 0
+        for words in rows:
+            if len(words) * 2 != length:
+                raise ValueError(f"SYNC_WRITE data must be {length} bytes per servo, got {len(words) * 2}.")
+            position = offset
+            for word in words:
+                buffer[position] = word & 0xFF
+                buffer[position + 1] = (word >> 8) & 0xFF
+                position += 2
+            offset += stride
+            count += 1
+        self._check_count(count)
+        return self._finish()
+
+
+def get_sync_write_template(register, data_length, ids):
+    """Return this thread's `SyncWriteTemplate` for `register`, `data_length` and the ID tuple.
+
+    Each thread keeps the `SYNC_TEMPLATE_CACHE_SIZE` most recently used
+    templates, so callers cycling through many ID subsets do not grow it.
+    """
+    cache = getattr(_templates, "sync", None)
+    if cache is None:
+        cache = _templates.sync = collections.OrderedDict()
+    key = (register, data_length, tuple(ids))
+    template = cache.get(key)
+    if template is None:
+        template = cache[key] = SyncWriteTemplate(register, data_length, key[2])
+        if len(cache) > SYNC_TEMPLATE_CACHE_SIZE:
+            cache.popitem(last=False)
+    else:
+        cache.move_to_end(key)
+    return template
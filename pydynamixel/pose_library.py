@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Named keyframes for a fixed joint list in a memory-mapped binary table.
+
+File layout, all little-endian: `HEADER` (magic, joint count, name width,
+pose count), one ID byte per joint, one NUL-padded UTF-8 name per pose, then
+one row per pose holding goal position and moving speed as 16-bit words for
+each joint. A row is the SYNC_WRITE GOAL_POSITION payload without the IDs, so
+poses are sent by copying bytes from the mapping into the packet template.
+"""
+
+import mmap
+import os
+import struct
+from typing import Dict, Iterable, Iterator, List, Mapping, Sequence, Tuple, Union
+
+from . import registers
+from .dynamixel import require_range
+
+MAGIC = b"PDXPOSE\x01"
+HEADER = struct.Struct("<8sHHI")
+JOINT_SIZE = 4
+NAME_SIZE = 32
+_WORDS = struct.Struct("<HH")
+
+
+class Pose:
+    """One keyframe of a `PoseLibrary`; pass it to `ServoChain.move_to_vector`.
+
+    Iterating yields `(id, angle, velocity)` tuples like a vector from
+    `ServoChain.make_vector`; SYNC_WRITE playback uses `row` instead.
+    """
+
+    __slots__ = ("library", "index", "name")
+
+    def __init__(self, library: "PoseLibrary", index: int, name: str):
+        self.library = library
+        self.index = index
+        self.name = name
+
+    @property
+    def joints(self) -> Tuple[int, ...]:
+        return self.library.joints
+
+    @property
+    def row(self) -> memoryview:
+        """The pose's bytes in the mapped file, `JOINT_SIZE` per joint."""
+        return self.library._row(self.index)
+
+    def __len__(self):
+        return len(self.library.joints)
+
+    def __iter__(self) -> Iterator[Tuple[int, int, int]]:
+        for joint, (position, speed) in zip(self.library.joints, _WORDS.iter_unpack(self.row)):
+            yield joint, position, speed
+
+    def __repr__(self):
+        return f"Pose({self.name!r})"
+
+
+class PoseLibrary:
+    """Read-only, memory-mapped keyframe table.
+
+    Opening maps the file and range-checks all poses once; nothing else is
+    loaded. Close the library only after releasing any `Pose.row` views.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike], validate: bool = True):
+        """Open a pose library file.
+
+        Args:
+            path: File written by `PoseLibrary.create`.
+            validate: Range-check every position and speed on open.
+        """
+        self.path = path
+        with open(path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = None
+        try:
+            magic, joint_count, name_size, pose_count = HEADER.unpack_from(self._map, 0)
+            if magic != MAGIC:
+                raise ValueError(f"{path} is not a pydynamixel pose library.")
+            names_start = HEADER.size + joint_count
+            self._table_start = names_start + pose_count * name_size
+            self._stride = joint_count * JOINT_SIZE
+            if len(self._map) != self._table_start + pose_count * self._stride:
+                raise ValueError(f"{path} is truncated or has trailing data.")
+
+            self._view = memoryview(self._map)
+            self.joints = tuple(self._view[HEADER.size:names_start])
+            self._index: Dict[str, int] = {}
+            for index in range(pose_count):
+                start = names_start + index * name_size
+                name = bytes(self._view[start:start + name_size]).rstrip(b"\x00").decode("utf-8")
+                self._index[name] = index
+            self.names: List[str] = list(self._index)
+            if validate:
+                self._validate()
+        except Exception:
+            # Nothing may still export the mapping, or closing it fails.
+            if self._view is not None:
+                self._view.release()
+            self._map.close()
+            self._map = None
+            raise
+
+    def _validate(self) -> None:
+        with self._view[self._table_start:] as table:
+            for index, (position, speed) in enumerate(_WORDS.iter_unpack(table)):
+                if position > registers.POSITION_MAX or speed > registers.SPEED_MAX:
+                    name = self.names[index // len(self.joints)]
+                    raise ValueError(f"Pose {name!r} has out-of-range values (position {position}, velocity {speed}).")
+
+    def _row(self, index: int) -> memoryview:
+        start = self._table_start + index * self._stride
+        return self._view[start:start + self._stride]
+
+    @classmethod
+    def create(
+        cls,
+        path: Union[str, os.PathLike],
+        joints: Sequence[int],
+        poses: Union[Mapping[str, Iterable[Tuple[int, int, int]]], Iterable[Tuple[str, Iterable[Tuple[int, int, int]]]]],
+        name_size: int = NAME_SIZE,
+    ) -> "PoseLibrary":
+        """Write a pose library and open it.
+
+        Args:
+            path: File to write.
+            joints: Servo IDs, in the order rows are stored and sent.
+            poses: Name to vector of `(id, angle, velocity)` tuples, as a mapping
+                or `(name, vector)` pairs; every vector covers exactly `joints`.
+            name_size: Bytes reserved per UTF-8 pose name.
+        """
+        joints = tuple(joints)
+        if len(set(joints)) != len(joints):
+            raise ValueError("Joint IDs must be unique.")
+        for joint in joints:
+            require_range("joint ID", joint, 0, registers.BROADCAST_ID - 1)
+        items = list(poses.items() if isinstance(poses, Mapping) else poses)
+
+        names = bytearray()
+        table = bytearray()
+        seen = set()
+        for name, vector in items:
+            encoded = name.encode("utf-8")
+            if not encoded or len(encoded) > name_size or b"\x00" in encoded:
+                raise ValueError(f"Pose name {name!r} must be 1 to {name_size} UTF-8 bytes without NUL.")
+            if name in seen:
+                raise ValueError(f"Duplicate pose name {name!r}.")
+            seen.add(name)
+            values = {}
+            for joint, position, velocity in vector:
+                require_range("position", position, registers.POSITION_MIN, registers.POSITION_MAX)
+                require_range("velocity", velocity, registers.SPEED_MIN, registers.SPEED_MAX)
+                values[joint] = (position, velocity)
+            if set(values) != set(joints):
+                raise ValueError(f"Pose {name!r} must cover joints {list(joints)}, got {sorted(values)}.")
+            names += encoded.ljust(name_size, b"\x00")
+            for joint in joints:
+                table += _WORDS.pack(*values[joint])
+
+        with open(path, "wb") as file:
+            file.write(HEADER.pack(MAGIC, len(joints), name_size, len(items)))
+            file.write(bytes(joints))
+            file.write(names)
+            file.write(table)
+        return cls(path)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        return name in self._index
+
+    def __iter__(self) -> Iterator[Pose]:
+        for index, name in enumerate(self.names):
+            yield Pose(self, index, name)
+
+    def __getitem__(self, key: Union[str, int]) -> Pose:
+        """Return a pose by name or by position in the file."""
+        if isinstance(key, int):
+            return Pose(self, range(len(self.names))[key], self.names[key])
+        return Pose(self, self._index[key], key)
+
+    def close(self) -> None:
+        """Unmap the file."""
+        if self._map is not None:
+            self._view.release()
+            self._map.close()
+            self._map = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
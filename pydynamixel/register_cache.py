@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Opt-in cache of servo register values."""
+
+import time
+from typing import Dict, Optional, Tuple
+
+from . import registers
+from .data import CacheStats
+from .data.servo_snapshot import FIELDS
+
+
+class RegisterCache:
+    """Cache register reads per servo.
+
+    EEPROM registers (below `registers.RAM_START`) stay cached until they are
+    written through the library. RAM registers are cached for `ram_ttl`
+    seconds, or not at all when `ram_ttl` is `None`. Writes replace the cached
+    value; deferred writes and anything that may have changed the table in a
+    way the cache cannot follow invalidate it instead.
+    """
+
+    def __init__(self, ram_ttl: Optional[float] = None, clock=time.monotonic):
+        """Initialize an empty cache.
+
+        Args:
+            ram_ttl: Seconds a RAM register value stays valid, `None` to never cache RAM.
+            clock: Monotonic time source, in seconds.
+        """
+        self.ram_ttl = ram_ttl
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        # servo_id -> {(register, size): (value, stored_at)}
+        self._entries: Dict[int, Dict[Tuple[int, int], Tuple[int, float]]] = {}
+
+    def _cacheable(self, register: int) -> bool:
+        return register < registers.RAM_START or self.ram_ttl is not None
+
+    def _valid(self, register: int, stored_at: float) -> bool:
+        if register < registers.RAM_START:
+            return True
+        return self.ram_ttl is not None and self.clock() - stored_at < self.ram_ttl
+
+    def get(self, servo_id: int, register: int, size: int) -> Optional[int]:
+        """Return a cached value, or `None` (counted as a miss) when it must be read."""
+        entry = self._entries.get(servo_id, {}).get((register, size))
+        if entry is not None and self._valid(register, entry[1]):
+            self.hits += 1
+            return entry[0]
+        self.misses += 1
+        return None
+
+    def put(self, servo_id: int, register: int, size: int, value: int) -> None:
+        """Store a value read from (or written to) a servo."""
+        if self._cacheable(register):
+            self._entries.setdefault(servo_id, {})[(register, size)] = (value, self.clock())
+
+    def put_snapshot(self, snapshot) -> None:
+        """Store every field decoded in a `ServoSnapshot`."""
+        for name, register, size in FIELDS:
+            value = getattr(snapshot, name)
+            if value is not None:
+                self.put(snapshot.servo_id, register, size, int(value))
+
+    def invalidate(self, servo_id: Optional[int] = None, register: Optional[int] = None, size: int = 1) -> None:
+        """Forget cached values.
+
+        With no arguments everything is dropped; with only `servo_id` the whole
+        servo is dropped; otherwise every entry overlapping `size` bytes at
+        `register` is dropped.
+        """
+        if servo_id is None or servo_id == registers.BROADCAST_ID:
+            if register is None:
+                self._entries.clear()
+            else:
+                for sid in list(self._entries):
+                    self.invalidate(sid, register, size)
+            return
+        if register is None:
+            self._entries.pop(servo_id, None)
+            return
+        entries = self._entries.get(servo_id)
+        if not entries:
+            return
+        end = register + size
+        for key in [key for key in entries if key[0] < end and register < key[0] + key[1]]:
+            del entries[key]
+
+    def invalidate_ram(self) -> None:
+        """Forget all RAM register values, e.g. after an ACTION broadcast."""
+        for entries in self._entries.values():
+            for key in [key for key in entries if key[0] >= registers.RAM_START]:
+                del entries[key]
+
+    def on_write(self, servo_id: int, register: int, size: int, value: int) -> None:
+        """Update the cache after a successful immediate write."""
+        if register == registers.ID or servo_id == registers.BROADCAST_ID:
+            # The servo answers under a new ID (or every servo changed); start over.
+            self.invalidate(servo_id)
+            if register == registers.ID:
+                self.invalidate(value)
+            return
+        self.invalidate(servo_id, register, size)
+        self.put(servo_id, register, size, value)
+
+    def stats(self) -> CacheStats:
+        """Return hit/miss counters and the number of cached entries."""
+        entries = sum(len(values) for values in self._entries.values())
+        return CacheStats(self.hits, self.misses, entries)
+
+    def reset_stats(self) -> None:
+        """Zero the hit/miss counters."""
+        self.hits = 0
+        self.misses = 0
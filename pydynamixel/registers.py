@@ -46,6 +46,11 @@ MOVING = 0x2E
 LOCK = 0x2F
 PUNCH = 0x30
 
+# Control table layout.
+EEPROM_START = 0x00
+RAM_START = TORQUE_ENABLE
+CONTROL_TABLE_SIZE = 0x32
+
 
 BROADCAST_ID = 0xFE
 
@@ -53,6 +58,26 @@ BROADCAST_ID = 0xFE
 DEFAULT_BAUDRATE = 1_000_000
 DEFAULT_TIMEOUT = 0.1
 
+# Standard BAUD_RATE register values and the host baud rate to open for each.
+BAUD_RATES = {
+    1: 1_000_000,
+    3: 500_000,
+    4: 400_000,
+    7: 250_000,
+    9: 200_000,
+    16: 115_200,
+    34: 57_600,
+    103: 19_200,
+    207: 9_600,
+}
+# Other BAUD_RATE values select BAUD_CLOCK / (value + 1) bps; servos accept a
+# host baud rate within BAUD_TOLERANCE relative error.
+BAUD_CLOCK = 2_000_000
+BAUD_TOLERANCE = 0.03
+
+# RETURN_DELAY register unit, in seconds.
+RETURN_DELAY_UNIT = 2e-6
+
 POSITION_MIN = 0
 POSITION_MAX = 1023
 SPEED_MIN = 0
@@ -84,3 +109,6 @@ DEFAULT_VALUES = {
     LOCK: 0x00,
     PUNCH: 0x0020,
 }
+
+# Position ticks per second for one MOVING_SPEED unit (0.111 rpm, 300 deg over 1023 ticks).
+TICKS_PER_SPEED_UNIT = 0.111 * 360.0 / 60.0 * 1023 / 300.0
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Retry policies and per-servo circuit breaking for request/response exchanges."""
+
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, List, Optional
+
+from . import registers
+from .exceptions import ServoUnavailableError
+
+
+class CircuitBreaker:
+    """Fail fast for servos that stopped answering.
+
+    After `failure_threshold` consecutive failed exchanges a servo's circuit
+    opens and requests to it raise `ServoUnavailableError` without touching
+    the bus. Every `reset_timeout` seconds the servo is probed again: by the
+    `probe` callable on a background thread when one is set (a bus created
+    with this breaker installs a one-shot ping), otherwise by letting the next
+    request through. A successful exchange closes the circuit.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        reset_timeout: float = 1.0,
+        probe: Optional[Callable[[int], bool]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize a breaker with all circuits closed.
+
+        Args:
+            failure_threshold: Consecutive failures that open a servo's circuit.
+            reset_timeout: Seconds between probes of an open circuit.
+            probe: Callable pinging one servo once and returning True if it answered.
+            clock: Monotonic time source, in seconds.
+        """
+        if failure_threshold < 1:
+            raise ValueError(f"failure_threshold must be at least 1, got {failure_threshold}.")
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.probe = probe
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._failures: Dict[int, int] = {}
+        # servo_id -> time the circuit may next be probed.
+        self._open: Dict[int, float] = {}
+        self._prober: Optional[threading.Thread] = None
+
+    def is_open(self, servo_id: int) -> bool:
+        """Return True if requests to `servo_id` currently fail fast."""
+        return servo_id in self._open
+
+    def open_circuits(self) -> List[int]:
+        """Return the IDs of servos whose circuit is open."""
+        return sorted(self._open)
+
+    def allow(self, servo_id: int) -> bool:
+        """Return True if a request to `servo_id` may go on the bus."""
+        with self._lock:
+            retry_at = self._open.get(servo_id)
+            if retry_at is None:
+                return True
+            if self.probe is not None or self.clock() < retry_at:
+                return False
+            # Half-open: let this request through as the probe.
+            self._open[servo_id] = self.clock() + self.reset_timeout
+            return True
+
+    def record_success(self, servo_id: int) -> None:
+        """Close the servo's circuit and clear its failure count."""
+        with self._lock:
+            self._failures.pop(servo_id, None)
+            self._open.pop(servo_id, None)
+
+    def record_failure(self, servo_id: int) -> None:
+        """Count a failed exchange, opening the circuit at the threshold."""
+        with self._lock:
+            failures = self._failures.get(servo_id, 0) + 1
+            self._failures[servo_id] = failures
+            if failures < self.failure_threshold or servo_id in self._open:
+                return
+            self._open[servo_id] = self.clock() + self.reset_timeout
+            if self.probe is not None and (self._prober is None or not self._prober.is_alive()):
+                self._prober = threading.Thread(target=self._probe_loop, name="dynamixel-breaker-probe", daemon=True)
+                self._prober.start()
+
+    def reset(self, servo_id: Optional[int] = None) -> None:
+        """Close one servo's circuit, or all circuits."""
+        with self._lock:
+            if servo_id is None:
+                self._failures.clear()
+                self._open.clear()
+            else:
+                self._failures.pop(servo_id, None)
+                self._open.pop(servo_id, None)
+
+    def _probe_loop(self) -> None:
+        while True:
+            with self._lock:
+                if not self._open:
+                    self._prober = None
+                    return
+                now = self.clock()
+                due = [servo_id for servo_id, retry_at in self._open.items() if retry_at <= now]
+                wake = min(self._open.values())
+            for servo_id in due:
+                try:
+                    answered = self.probe(servo_id)
+                except Exception:
+                    answered = False
+                if answered:
+                    self.record_success(servo_id)
+                else:
+                    with self._lock:
+                        if servo_id in self._open:
+                            self._open[servo_id] = self.clock() + self.reset_timeout
+            if not due:
+                time.sleep(max(0.0, min(wake - self.clock(), self.reset_timeout)))
+
+
+class RetryPolicy:
+    """How often and how fast a failed exchange is retried.
+
+    Pass a policy wherever an attempt count is accepted (e.g.
+    `DynamixelBus(attempts=RetryPolicy(...))`).
+    """
+
+    def __init__(
+        self,
+        attempts: int = 3,
+        backoff: float = 0.0,
+        backoff_factor: float = 2.0,
+        max_backoff: float = 0.05,
+        budget: Optional[int] = None,
+        window: float = 1.0,
+        breaker: Optional[CircuitBreaker] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """Initialize a retry policy.
+
+        Args:
+            attempts: Maximum attempts per exchange, including the first one.
+            backoff: Pause before the first retry, in seconds.
+            backoff_factor: Multiplier applied to the pause for each further retry.
+            max_backoff: Longest pause between attempts, in seconds.
+            budget: Retries allowed per `window` across all exchanges using this
+                policy; once spent, failed exchanges are not retried.
+            window: Length of the retry budget window, in seconds.
+            breaker: Optional `CircuitBreaker` consulted before each exchange.
+            clock: Monotonic time source, in seconds.
+            sleep: Sleep function used for backoff.
+        """
+        if attempts < 1:
+            raise ValueError(f"attempts must be at least 1, got {attempts}.")
+        self.attempts = attempts
+        self.backoff = backoff
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.budget = budget
+        self.window = window
+        self.breaker = breaker
+        self.clock = clock
+        self.sleep = sleep
+        self._lock = threading.Lock()
+        self._retries = deque()
+
+    def before_exchange(self, servo_id: Optional[int]) -> None:
+        """Raise `ServoUnavailableError` if the breaker has `servo_id` open."""
+        if self.breaker is not None and _tracked(servo_id) and not self.breaker.allow(servo_id):
+            raise ServoUnavailableError(servo_id)
+
+    def before_retry(self, attempt: int) -> bool:
+        """Return False if retry number `attempt` (1-based) is not allowed; otherwise back off."""
+        if self.budget is not None:
+            with self._lock:
+                now = self.clock()
+                while self._retries and self._retries[0] <= now - self.window:
+                    self._retries.popleft()
+                if len(self._retries) >= self.budget:
+                    return False
+                self._retries.append(now)
+        if self.backoff > 0:
+            self.sleep(min(self.max_backoff, self.backoff * self.backoff_factor ** (attempt - 1)))
+        return True
+
+    def on_success(self, servo_id: Optional[int]) -> None:
+        """Record that `servo_id` answered."""
+        if self.breaker is not None and _tracked(servo_id):
+            self.breaker.record_success(servo_id)
+
+    def on_failure(self, servo_id: Optional[int]) -> None:
+        """Record that an exchange with `servo_id` failed after all attempts."""
+        if self.breaker is not None and _tracked(servo_id):
+            self.breaker.record_failure(servo_id)
+
+
+def _tracked(servo_id):
+    return servo_id is not None and servo_id != registers.BROADCAST_ID
@@ -4,43 +4,225 @@
 """Object-oriented helpers for synchronized multi-servo motion."""
 
 import time
-from typing import List, Sequence, Tuple
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
 
+from . import registers, timing
+from .arbiter import PRIORITY
+from .arrays import STATE_REGISTER, STATE_SIZE, ChainState
+from .data import TelemetrySample, TrajectoryReport
+from .data.servo_snapshot import REGISTER_SIZES
 from .dynamixel_bus import DynamixelBus
+from .exceptions import MoveTimeoutError
+from .pose_library import Pose
+from .trajectory import Trajectory
 
 Vector = List[Tuple[int, int, int]]
 
+# Registers read per joint while waiting for a move (one READ_DATA span).
+_MOTION_REGISTERS = (registers.GOAL_POSITION, registers.MOVING_SPEED, registers.PRESENT_POSITION, registers.MOVING)
+
 
 class ServoChain:
     """Coordinate multi-servo motions over a shared bus."""
 
-    def __init__(self, bus: DynamixelBus, sleep_time: float = 0.1):
+    def __init__(self, bus: DynamixelBus, sleep_time: float = 0.1, sync_write: bool = True):
         """Initialize chain helper.
 
         Args:
             bus: DynamixelBus instance used for communication.
-            sleep_time: Poll interval while waiting for movement completion.
+            sleep_time: Longest poll interval while waiting for movement completion.
+            sync_write: Send whole poses as one SYNC_WRITE packet instead of
+                per-joint REG_WRITE exchanges followed by ACTION.
         """
         self.bus = bus
         self.sleep_time = sleep_time
+        self.sync_write = sync_write
+
+    def wait_for_move(self, joints: Sequence[int], timeout: Optional[float] = None, min_interval: float = 0.002) -> None:
+        """Block until all listed joints stop moving.
+
+        Every still-moving joint is polled once per cycle (one READ_DATA for
+        goal, speed, position and the moving flag) and dropped once it stops.
+        The next poll is scheduled after half the longest remaining move time,
+        estimated from distance to goal and commanded speed, bounded by
+        `min_interval` and the chain's `sleep_time`.
+
+        Args:
+            joints: Servo IDs to wait for.
+            timeout: Give up after this many seconds and raise `MoveTimeoutError`.
+            min_interval: Shortest pause between poll cycles, in seconds.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        pending = list(joints)
+        while pending:
+            remaining = 0.0
+            moving = []
+            for joint in pending:
+                values = self._read_registers(joint, _MOTION_REGISTERS)
+                if values[registers.MOVING]:
+                    moving.append(joint)
+                    distance = values[registers.GOAL_POSITION] - values[registers.PRESENT_POSITION]
+                    remaining = max(remaining, timing.move_time(distance, values[registers.MOVING_SPEED]))
+            pending = moving
+            if not pending:
+                return
+
+            interval = min(self.sleep_time, max(min_interval, remaining / 2))
+            if deadline is not None:
+                left = deadline - time.monotonic()
+                if left <= 0:
+                    raise MoveTimeoutError(pending, timeout)
+                interval = min(interval, left)
+            time.sleep(interval)
+
+    def move_to_vector(self, vector: Sequence[Tuple[int, int, int]], sync_write: Optional[bool] = None) -> None:
+        """Move all joints to the positions/speeds in `vector` at the same time.
+
+        By default the pose goes out as one SYNC_WRITE broadcast. With
+        `sync_write=False` (or a chain created with `sync_write=False`) each
+        joint is staged with REG_WRITE and executed by one ACTION packet;
+        REG_WRITEs that expect no reply are sent in the same write as the ACTION.
+        A `Pose` from a `PoseLibrary` is sent straight from its mapped row.
+        """
+        if self.sync_write if sync_write is None else sync_write:
+            if isinstance(vector, Pose):
+                self.bus.sync_move_rows(vector.joints, vector.row)
+            else:
+                self.bus.sync_move(vector)
+            return
+        with self.bus.batch():
+            for servo_id, angle, velocity in vector:
+                self.bus.set_position(servo_id, angle)
+                self.bus.set_velocity(servo_id, velocity)
+            self.bus.send_action()
+
+    def move_to_arrays(self, joints: Sequence[int], positions, speeds) -> None:
+        """Move `joints` to NumPy arrays of goal positions and speeds with one SYNC_WRITE.
+
+        All values are range-checked in one vectorized pass before anything is sent.
+        """
+        self.bus.sync_move_array(joints, positions, speeds)
+
+    def read_state(self, joints: Sequence[int], out: Optional[ChainState] = None) -> ChainState:
+        """Read position, speed, load, voltage and temperature of `joints` into arrays.
 
-    def wait_for_move(self, joints: Sequence[int]) -> None:
-        """Block until all listed joints stop moving."""
-        for joint in joints:
-            while self.bus.get_is_moving(joint):
-                time.sleep(self.sleep_time)
+        Each joint costs one READ_DATA whose payload is copied into its row of
+        `out` (allocated when omitted; pass it back in to reuse the arrays).
+        """
+        if out is None:
+            out = ChainState(joints)
+        elif len(out.ids) != len(joints):
+            raise ValueError(f"State holds {len(out.ids)} joints, got {len(joints)}.")
+        for index, joint in enumerate(joints):
+            out.store(index, self.bus.read_response(joint, STATE_REGISTER, STATE_SIZE).payload)
+        out.timestamp = time.monotonic()
+        return out
 
-    def move_to_vector(self, vector: Sequence[Tuple[int, int, int]]) -> None:
-        """Stage position/speed writes for all joints and execute one action."""
-        for servo_id, angle, velocity in vector:
-            self.bus.set_position(servo_id, angle)
-            self.bus.set_velocity(servo_id, velocity)
-        self.bus.send_action()
+    def follow(self, trajectory: Trajectory, hz: float = 50.0) -> TrajectoryReport:
+        """Stream `trajectory` to the bus at `hz`, one SYNC_WRITE pose per tick (see `Trajectory.play`)."""
+        return trajectory.play(self.bus, hz)
 
     def read_position(self, joints: Sequence[int]) -> List[int]:
         """Read current positions for all joints in order."""
         return [self.bus.get_position(joint) for joint in joints]
 
+    def _read_registers(self, joint: int, fields: Sequence[int]) -> Dict[int, int]:
+        """Read `fields` of one joint with a single READ_DATA spanning all of them."""
+        start = min(fields)
+        end = max(field + REGISTER_SIZES.get(field, 1) for field in fields)
+        response = self.bus.read_response(joint, start, end - start)
+        values = {}
+        for field in fields:
+            offset = field - start
+            values[field] = response.u8(offset) if REGISTER_SIZES.get(field, 1) == 1 else response.u16(offset)
+        return values
+
+    def stream(
+        self,
+        joints: Sequence[int],
+        fields: Sequence[int] = (registers.PRESENT_POSITION,),
+        hz: float = 50.0,
+        round_robin: Sequence[int] = (),
+        count: Optional[int] = None,
+        priority: int = PRIORITY.TELEMETRY,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> Iterator[TelemetrySample]:
+        """Yield timestamped register samples of `joints` at a fixed rate.
+
+        Cycles are scheduled on a fixed grid (`start + n / hz`), so time spent
+        reading or in the consumer does not accumulate as drift. When a cycle
+        starts more than one period late, the missed slots are skipped and
+        reported in `TelemetrySample.missed`. Each joint is read with one
+        READ_DATA spanning its registers for the cycle.
+
+        Args:
+            joints: Servo IDs to sample.
+            fields: Register addresses read every cycle.
+            hz: Sampling rate in cycles per second.
+            round_robin: Low-priority register addresses; one of them is added
+                to each cycle in turn.
+            count: Stop after this many samples (default: run until closed).
+            priority: Bus priority of the reads, so control writes can cut in.
+            clock: Monotonic time source.
+            sleep: Sleep function used between cycles.
+        """
+        if hz <= 0:
+            raise ValueError(f"hz must be positive, got {hz}.")
+        if not fields and not round_robin:
+            raise ValueError("At least one register must be streamed.")
+
+        period = 1.0 / hz
+        deadline = clock()
+        cycle = 0
+        samples = 0
+        while count is None or samples < count:
+            missed = 0
+            now = clock()
+            if now < deadline:
+                sleep(deadline - now)
+            elif now - deadline >= period:
+                missed = int((now - deadline) // period)
+                deadline += missed * period
+                cycle += missed
+
+            cycle_fields = list(fields)
+            if round_robin:
+                extra = round_robin[cycle % len(round_robin)]
+                if extra not in cycle_fields:
+                    cycle_fields.append(extra)
+
+            started = clock()
+            with self.bus.priority(priority):
+                values = {joint: self._read_registers(joint, cycle_fields) for joint in joints}
+            yield TelemetrySample(cycle, started, clock() - started, values, missed)
+
+            samples += 1
+            cycle += 1
+            deadline += period
+
+    @contextmanager
+    def status_return_level(
+        self,
+        joints: Sequence[int],
+        level: int = registers.STATUS_RETURN.RETURN_ONLY_FOR_READ,
+    ) -> Iterator["ServoChain"]:
+        """Temporarily switch joints to another STATUS_RETURN_LEVEL.
+
+        The default (RETURN_ONLY_FOR_READ) makes writes fire-and-forget, so
+        write-heavy control loops stop waiting for a status packet per command.
+        Previous levels are restored on exit. Both switches go out as one
+        SYNC_WRITE each; the register lives in EEPROM, so wrap whole sessions
+        rather than individual commands.
+        """
+        previous = {joint: self.bus.get_status_return_level(joint) for joint in joints}
+        self.bus.sync_write(registers.STATUS_RETURN_LEVEL, 1, [(joint, [level]) for joint in joints])
+        try:
+            yield self
+        finally:
+            self.bus.sync_write(registers.STATUS_RETURN_LEVEL, 1, [(joint, [prev]) for joint, prev in previous.items()])
+
     @staticmethod
     def make_vector_constant_velocity(position: Sequence[int], joints: Sequence[int], velocity: int) -> Vector:
         """Build vector tuples from positions and one shared velocity."""
@@ -0,0 +1,434 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""In-process AX-12 bus simulator with a pyserial-compatible interface."""
+
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from . import packets, registers, timing
+from .data.servo_snapshot import FIELDS
+from .decoder import StatusDecoder
+
+# Register sizes from the control-table layout.
+REGISTER_SIZES = {addr: size for _name, addr, size in FIELDS}
+
+READ_ONLY = {
+    registers.MODEL_NUMBER,
+    registers.MODEL_NUMBER + 1,
+    registers.VERSION,
+    registers.PRESENT_POSITION,
+    registers.PRESENT_POSITION + 1,
+    registers.PRESENT_SPEED,
+    registers.PRESENT_SPEED + 1,
+    registers.PRESENT_LOAD,
+    registers.PRESENT_LOAD + 1,
+    registers.PRESENT_VOLTAGE,
+    registers.PRESENT_TEMPERATURE,
+    registers.REGISTERED,
+    registers.MOVING,
+}
+
+MAX_VALUES = {
+    registers.ID: 0xFD,
+    registers.RETURN_DELAY: 0xFE,
+    registers.CW_ANGLE_LIMIT: 0x3FF,
+    registers.CCW_ANGLE_LIMIT: 0x3FF,
+    registers.MAX_TORQUE: 0x3FF,
+    registers.STATUS_RETURN_LEVEL: registers.STATUS_RETURN.RETURN_FOR_ALL_PACKETS,
+    registers.TORQUE_ENABLE: 1,
+    registers.LED: 1,
+    registers.GOAL_POSITION: registers.POSITION_MAX,
+    registers.MOVING_SPEED: registers.SPEED_MAX,
+    registers.TORQUE_LIMIT: registers.TORQUE_MAX,
+    registers.LOCK: 1,
+    registers.PUNCH: 0x3FF,
+}
+
+
+def baudrate_for_register(value):
+    """Return the bus speed in bps selected by a BAUD_RATE register value."""
+    return registers.BAUD_RATES.get(value, registers.BAUD_CLOCK / (value + 1))
+
+
+class SimulatedServo:
+    """One emulated AX-12 control table with a simple motion model."""
+
+    def __init__(self, servo_id=1, position=512, version=0x18, voltage=120, temperature=32, clock=time.monotonic):
+        """Initialize a servo at factory defaults.
+
+        Args:
+            servo_id: Servo ID.
+            position: Initial present (and goal) position.
+            version: Firmware version reported at VERSION.
+            voltage: PRESENT_VOLTAGE in 0.1 V.
+            temperature: PRESENT_TEMPERATURE in degrees Celsius.
+            clock: Monotonic time source used by the motion model.
+        """
+        self.clock = clock
+        self.table = bytearray(registers.CONTROL_TABLE_SIZE)
+        self.pending: List[Tuple[int, bytes]] = []
+        # Alarm bits reported in every status packet (INPUT_VOLTAGE, OVERHEATING, ...).
+        self.alarm = 0
+        self._position = float(position)
+        self._updated = clock()
+        self.reset()
+        self._set(registers.ID, servo_id)
+        self._set(registers.VERSION, version)
+        self._set(registers.PRESENT_VOLTAGE, voltage)
+        self._set(registers.PRESENT_TEMPERATURE, temperature)
+        self._set(registers.GOAL_POSITION, position)
+        self._set(registers.PRESENT_POSITION, position)
+
+    def reset(self):
+        """Restore factory defaults (including ID 1), as the RESET instruction does."""
+        self.table[:registers.RAM_START] = bytes(registers.RAM_START)
+        for addr, value in registers.DEFAULT_VALUES.items():
+            self._set(addr, value)
+        self._set(registers.CW_COMPLIANCE_SLOPE, 0x20)
+        self._set(registers.CCW_COMPLIANCE_SLOPE, 0x20)
+        self._set(registers.TORQUE_LIMIT, self.get(registers.MAX_TORQUE))
+        self.pending = []
+
+    def _set(self, addr, value):
+        if REGISTER_SIZES.get(addr, 1) == 2:
+            self.table[addr] = value & 0xFF
+            self.table[addr + 1] = (value >> 8) & 0xFF
+        else:
+            self.table[addr] = value & 0xFF
+
+    def get(self, addr):
+        """Return the current value of the register at `addr`."""
+        self.update()
+        if REGISTER_SIZES.get(addr, 1) == 2:
+            return self.table[addr] | (self.table[addr + 1] << 8)
+        return self.table[addr]
+
+    @property
+    def servo_id(self):
+        return self.table[registers.ID]
+
+    @property
+    def return_delay(self):
+        return timing.return_delay_time(self.table[registers.RETURN_DELAY])
+
+    @property
+    def baudrate(self):
+        return baudrate_for_register(self.table[registers.BAUD_RATE])
+
+    @property
+    def status_return_level(self):
+        return self.table[registers.STATUS_RETURN_LEVEL]
+
+    def update(self):
+        """Advance the motion model to the current time."""
+        now = self.clock()
+        elapsed = now - self._updated
+        self._updated = now
+        table = self.table
+        goal = table[registers.GOAL_POSITION] | (table[registers.GOAL_POSITION + 1] << 8)
+        if not table[registers.TORQUE_ENABLE] or round(self._position) == goal:
+            self._position = float(round(self._position))
+            table[registers.MOVING] = 0
+            self._set(registers.PRESENT_SPEED, 0)
+            return
+        speed = table[registers.MOVING_SPEED] | (table[registers.MOVING_SPEED + 1] << 8)
+        speed = speed or registers.SPEED_MAX
+        step = speed * registers.TICKS_PER_SPEED_UNIT * elapsed
+        if abs(goal - self._position) <= step:
+            self._position = float(goal)
+        elif goal > self._position:
+            self._position += step
+        else:
+            self._position -= step
+        position = round(self._position)
+        moving = position != goal
+        table[registers.MOVING] = int(moving)
+        self._set(registers.PRESENT_POSITION, position)
+        # Bit 10 of PRESENT_SPEED marks clockwise (decreasing position) motion.
+        direction = 0x400 if goal < position else 0
+        self._set(registers.PRESENT_SPEED, (speed | direction) if moving else 0)
+
+    def _check_write(self, addr, data):
+        """Return the error bits a write of `data` at `addr` would raise."""
+        end = addr + len(data)
+        if not data or end > registers.CONTROL_TABLE_SIZE:
+            return registers.ERROR_BIT_MASKS.RANGE
+        if any(a in READ_ONLY for a in range(addr, end)):
+            return registers.ERROR_BIT_MASKS.RANGE
+        if self.table[registers.LOCK] and addr < registers.RAM_START:
+            return registers.ERROR_BIT_MASKS.RANGE
+        for reg, maximum in MAX_VALUES.items():
+            size = REGISTER_SIZES.get(reg, 1)
+            if addr <= reg and reg + size <= end:
+                offset = reg - addr
+                value = data[offset] if size == 1 else data[offset] | (data[offset + 1] << 8)
+                if value > maximum:
+                    return registers.ERROR_BIT_MASKS.RANGE
+        return 0
+
+    def _apply(self, addr, data):
+        self.update()
+        self.table[addr:addr + len(data)] = data
+        if addr <= registers.GOAL_POSITION < addr + len(data):
+            # Writing a goal position enables torque on the AX-12.
+            self.table[registers.TORQUE_ENABLE] = 1
+
+    def write(self, addr, data):
+        """Write `data` at `addr`; returns the resulting error bits."""
+        error = self._check_write(addr, data)
+        if not error:
+            self._apply(addr, bytes(data))
+        return error
+
+    def reg_write(self, addr, data):
+        """Stage a write until ACTION; returns the resulting error bits."""
+        error = self._check_write(addr, data)
+        if not error:
+            self.pending.append((addr, bytes(data)))
+            self.table[registers.REGISTERED] = 1
+        return error
+
+    def action(self):
+        """Apply staged writes; returns INSTRUCTION error bits when nothing was staged."""
+        if not self.pending:
+            return registers.ERROR_BIT_MASKS.INSTRUCTION
+        for addr, data in self.pending:
+            self._apply(addr, data)
+        self.pending = []
+        self.table[registers.REGISTERED] = 0
+        return 0
+
+    def read(self, addr, length):
+        """Return `(error, data)` for a READ_DATA request."""
+        if length == 0 or addr + length > registers.CONTROL_TABLE_SIZE:
+            return registers.ERROR_BIT_MASKS.RANGE, b""
+        self.update()
+        return 0, bytes(self.table[addr:addr + length])
+
+    def replies_to(self, instruction):
+        """Return True if the current status return level answers `instruction`."""
+        level = self.status_return_level
+        if instruction == registers.INSTRUCTION.PING:
+            return True
+        if instruction == registers.INSTRUCTION.READ_DATA:
+            return level >= registers.STATUS_RETURN.RETURN_ONLY_FOR_READ
+        return level >= registers.STATUS_RETURN.RETURN_FOR_ALL_PACKETS
+
+
+class BusSimulator:
+    """pyserial-compatible port connected to emulated AX-12 servos.
+
+    Pass an instance anywhere a serial port is expected (e.g.
+    `DynamixelBus(BusSimulator(ids=range(1, 19)))`). Instruction packets
+    written to it are executed against each servo's control table: PING,
+    READ_DATA, WRITE_DATA, REG_WRITE/ACTION, RESET and SYNC_WRITE, with
+    status return levels, range/instruction/checksum error bits and baud
+    rate matching. With `wire_time` enabled, replies only become readable
+    after the request and response have crossed the wire at the port's baud
+    rate plus the servo's RETURN_DELAY, and reads that time out block for the
+    full timeout, so latency measurements resemble real hardware.
+    """
+
+    def __init__(
+        self,
+        ids: Iterable[int] = (1,),
+        baudrate: int = registers.DEFAULT_BAUDRATE,
+        timeout: Optional[float] = registers.DEFAULT_TIMEOUT,
+        wire_time: bool = False,
+        latency: float = 0.0,
+        clock=time.monotonic,
+        sleep=time.sleep,
+    ):
+        """Initialize a simulated port.
+
+        Args:
+            ids: IDs of the servos to create at factory defaults.
+            baudrate: Host-side baud rate.
+            timeout: Read timeout in seconds (`None` blocks, 0 is non-blocking).
+            wire_time: Model transmission time, return delay and read timeouts.
+            latency: Extra host-side delay added to every reply (e.g. USB latency).
+            clock: Monotonic time source.
+            sleep: Sleep function used while waiting for replies.
+        """
+        self.baudrate = baudrate
+        self.timeout = timeout
+        self.write_timeout = None
+        self.wire_time = wire_time
+        self.latency = latency
+        self.clock = clock
+        self.sleep = sleep
+        self.port = "sim://"
+        self.is_open = True
+        self.servos: Dict[int, SimulatedServo] = {}
+        self.packets_received = 0
+        self.bytes_written = 0
+        self.bytes_read = 0
+        self._lock = threading.RLock()
+        # Instruction packets share the status packet framing (INSTRUCTION sits where ERROR does).
+        self._decoder = StatusDecoder(emit_corrupt=True)
+        self._rx = bytearray()
+        self._pending: List[Tuple[float, bytes]] = []
+        self._bus_free_at = 0.0
+        for servo_id in ids:
+            self.add_servo(servo_id)
+
+    def add_servo(self, servo_id: int, **kwargs) -> SimulatedServo:
+        """Attach a servo at factory defaults; keyword arguments go to `SimulatedServo`."""
+        servo = SimulatedServo(servo_id, clock=self.clock, **kwargs)
+        self.servos[servo_id] = servo
+        return servo
+
+    def remove_servo(self, servo_id: int) -> None:
+        """Detach a servo, e.g. to simulate an unplugged joint."""
+        self.servos.pop(servo_id, None)
+
+    # pyserial interface.
+
+    def open(self):
+        self.is_open = True
+
+    def close(self):
+        self.is_open = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def flush(self):
+        pass
+
+    def reset_output_buffer(self):
+        pass
+
+    def reset_input_buffer(self):
+        with self._lock:
+            self._deliver(self.clock())
+            self._rx.clear()
+
+    @property
+    def in_waiting(self):
+        with self._lock:
+            self._deliver(self.clock())
+            return len(self._rx)
+
+    def inWaiting(self):
+        return self.in_waiting
+
+    def write(self, data):
+        data = bytes(data)
+        with self._lock:
+            now = self.clock()
+            start = max(now, self._bus_free_at) if self.wire_time else now
+            end = start + self._wire(len(data))
+            self._bus_free_at = end
+            self.bytes_written += len(data)
+            for frame in self._decoder.feed(data):
+                self.packets_received += 1
+                self._execute(frame, end)
+        return len(data)
+
+    def read(self, size=1):
+        with self._lock:
+            now = self.clock()
+            deadline = None if self.timeout is None else now + self.timeout
+            while True:
+                self._deliver(now)
+                if len(self._rx) >= size:
+                    break
+                wake = self._pending[0][0] if self._pending else None
+                if not self.wire_time:
+                    if wake is None:
+                        break
+                    now = wake
+                    continue
+                if deadline is not None:
+                    if now >= deadline:
+                        break
+                    wake = deadline if wake is None else min(wake, deadline)
+                elif wake is None:
+                    break
+                self.sleep(max(0.0, wake - now))
+                now = self.clock()
+            data = bytes(self._rx[:size])
+            del self._rx[:size]
+            self.bytes_read += len(data)
+            return data
+
+    # Protocol emulation.
+
+    def _wire(self, num_bytes):
+        return timing.packet_time(num_bytes, self.baudrate) if self.wire_time else 0.0
+
+    def _deliver(self, now):
+        while self._pending and self._pending[0][0] <= now:
+            self._rx += self._pending.pop(0)[1]
+
+    def _listening(self):
+        for servo in list(self.servos.values()):
+            if abs(servo.baudrate - self.baudrate) <= registers.BAUD_TOLERANCE * self.baudrate:
+                yield servo
+
+    def _reply(self, servo, reply_id, error, params, tx_end):
+        packet = packets.get_packet([reply_id, len(params) + 2, (error | servo.alarm) & 0xFF] + list(params))
+        ready = tx_end
+        if self.wire_time:
+            ready = max(tx_end, self._bus_free_at) + servo.return_delay
+            self._bus_free_at = ready + self._wire(len(packet))
+            ready = self._bus_free_at
+        self._pending.append((ready + self.latency, packet))
+        self._pending.sort(key=lambda item: item[0])
+
+    def _execute(self, frame, tx_end):
+        target, instruction, params = frame.servo_id, frame.error, frame.data
+        listening = [servo for servo in self._listening() if target in (servo.servo_id, registers.BROADCAST_ID)]
+
+        if instruction == registers.INSTRUCTION.SYNC_WRITE and target == registers.BROADCAST_ID and frame.checksum_match:
+            if len(params) >= 2 and params[1]:
+                addr, length = params[0], params[1]
+                for offset in range(2, len(params) - length, length + 1):
+                    servo_id = params[offset]
+                    data = bytes(params[offset + 1:offset + 1 + length])
+                    for servo in listening:
+                        if servo.servo_id == servo_id:
+                            servo.write(addr, data)
+            return
+
+        for servo in listening:
+            # Replies to an ID change or RESET still go out under the addressed ID.
+            reply_id = servo.servo_id
+            if not frame.checksum_match:
+                error, data = registers.ERROR_BIT_MASKS.SEND_CHECKSUM, b""
+            else:
+                error, data = self._dispatch(servo, instruction, params)
+            if servo.servo_id != reply_id and self.servos.get(reply_id) is servo:
+                del self.servos[reply_id]
+                self.servos[servo.servo_id] = servo
+            # Broadcast instructions never return a status packet.
+            if target != registers.BROADCAST_ID and servo.replies_to(instruction):
+                self._reply(servo, reply_id, error, data, tx_end)
+
+    def _dispatch(self, servo, instruction, params):
+        if instruction == registers.INSTRUCTION.PING:
+            return 0, b""
+        if instruction == registers.INSTRUCTION.READ_DATA:
+            if len(params) != 2:
+                return registers.ERROR_BIT_MASKS.INSTRUCTION, b""
+            return servo.read(params[0], params[1])
+        if instruction == registers.INSTRUCTION.WRITE_DATA:
+            if len(params) < 2:
+                return registers.ERROR_BIT_MASKS.INSTRUCTION, b""
+            return servo.write(params[0], bytes(params[1:])), b""
+        if instruction == registers.INSTRUCTION.REG_WRITE:
+            if len(params) < 2:
+                return registers.ERROR_BIT_MASKS.INSTRUCTION, b""
+            return servo.reg_write(params[0], bytes(params[1:])), b""
+        if instruction == registers.INSTRUCTION.ACTION:
+            return servo.action(), b""
+        if instruction == registers.INSTRUCTION.RESET:
+            servo.reset()
+            return 0, b""
+        return registers.ERROR_BIT_MASKS.INSTRUCTION, b""
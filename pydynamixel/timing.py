@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Wire-time and motion-time estimates for Protocol 1.0 exchanges."""
+
+from . import registers
+
+# 8N1 framing: start bit, 8 data bits, stop bit.
+BITS_PER_BYTE = 10
+# Host-side slack for OS scheduling and USB adapter latency.
+DEFAULT_MARGIN = 0.003
+# Header, ID, length, instruction/error and checksum bytes of every packet.
+PACKET_OVERHEAD = 6
+# Size of a ping request, a READ_DATA request and an empty status packet.
+PING_PACKET_SIZE = PACKET_OVERHEAD
+READ_PACKET_SIZE = PACKET_OVERHEAD + 2
+STATUS_PACKET_SIZE = PACKET_OVERHEAD
+
+
+def byte_time(baudrate):
+    """Return the time one byte occupies the wire, in seconds."""
+    return BITS_PER_BYTE / baudrate
+
+
+def packet_time(num_bytes, baudrate):
+    """Return the time `num_bytes` occupy the wire, in seconds."""
+    return num_bytes * BITS_PER_BYTE / baudrate
+
+
+def return_delay_time(return_delay):
+    """Convert a RETURN_DELAY register value to seconds."""
+    return return_delay * registers.RETURN_DELAY_UNIT
+
+
+def response_timeout(
+    baudrate,
+    request_size=PING_PACKET_SIZE,
+    response_size=STATUS_PACKET_SIZE,
+    return_delay=registers.DEFAULT_VALUES[registers.RETURN_DELAY],
+    margin=DEFAULT_MARGIN,
+):
+    """Return how long to wait for a status packet after writing a request."""
+    return packet_time(request_size + response_size, baudrate) + return_delay_time(return_delay) + margin
+
+
+def drain_window(baudrate):
+    """Return the wire time of the largest status packet, in seconds.
+
+    After a failed exchange the port is drained for this long, which catches
+    a reply already on the wire without waiting a whole timeout again.
+    """
+    return packet_time(STATUS_PACKET_SIZE + registers.CONTROL_TABLE_SIZE, baudrate)
+
+
+def move_time(distance, speed):
+    """Return how long a servo needs to cover `distance` ticks at MOVING_SPEED `speed`, in seconds.
+
+    A speed of 0 means "maximum" on AX-12 servos.
+    """
+    speed &= registers.SPEED_MAX
+    return abs(distance) / ((speed or registers.SPEED_MAX) * registers.TICKS_PER_SPEED_UNIT)
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Time-parameterized joint trajectories streamed at a fixed control rate.
+
+Requires NumPy (`pip install pydynamixel[numpy]`); it is imported lazily so the
+rest of the package works without it.
+"""
+
+import time
+from typing import Callable, Optional, Sequence
+
+from . import registers
+from .arbiter import PRIORITY
+from .data import TrajectoryReport
+
+PROFILES = ("linear", "cubic", "trapezoid")
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError as exc:
+        raise ImportError("Trajectories require NumPy; install it with `pip install pydynamixel[numpy]`.") from exc
+    return numpy
+
+
+class Trajectory:
+    """Joint-space waypoints with times, interpolated for all joints at once.
+
+    Profiles:
+        linear: constant velocity between waypoints.
+        cubic: C1 cubic Hermite spline; waypoint velocities are the mean of
+            the adjacent segment slopes, zero at both ends.
+        trapezoid: each segment accelerates, cruises and decelerates to rest
+            at the next waypoint; `accel_fraction` of the segment time is
+            spent on each ramp.
+    """
+
+    def __init__(
+        self,
+        joints: Sequence[int],
+        times: Sequence[float],
+        positions,
+        profile: str = "linear",
+        accel_fraction: float = 0.25,
+        finish_speed: Optional[int] = None,
+    ):
+        """Initialize a trajectory.
+
+        Args:
+            joints: Servo IDs, one per column of `positions`.
+            times: Waypoint times in seconds, strictly increasing.
+            positions: Goal positions in ticks, shape `(len(times), len(joints))`.
+            profile: One of `PROFILES`.
+            accel_fraction: Ramp fraction of each segment for `trapezoid`, in (0, 0.5].
+            finish_speed: MOVING_SPEED sent with the final goal, which a joint
+                still behind the path moves at until it arrives; defaults to
+                each joint's peak speed along the trajectory.
+        """
+        np = _numpy()
+        self.joints = tuple(joints)
+        self.times = np.asarray(times, dtype=float)
+        self.positions = np.asarray(positions, dtype=float)
+        self.profile = profile
+        self.accel_fraction = accel_fraction
+        self.finish_speed = finish_speed
+
+        if profile not in PROFILES:
+            raise ValueError(f"profile must be one of {PROFILES}, got {profile!r}.")
+        if not 0.0 < accel_fraction <= 0.5:
+            raise ValueError(f"accel_fraction must be in range (0, 0.5], got {accel_fraction}.")
+        if self.times.ndim != 1 or len(self.times) < 2:
+            raise ValueError("At least two waypoint times are required.")
+        if np.any(np.diff(self.times) <= 0):
+            raise ValueError("Waypoint times must be strictly increasing.")
+        if self.positions.shape != (len(self.times), len(self.joints)):
+            raise ValueError(
+                f"positions must have shape {(len(self.times), len(self.joints))}, got {self.positions.shape}."
+            )
+        if finish_speed is not None and not 1 <= finish_speed <= registers.SPEED_MAX:
+            raise ValueError(f"finish_speed must be in range [1, {registers.SPEED_MAX}], got {finish_speed}.")
+        if not np.all(np.isfinite(self.times)) or not np.all(np.isfinite(self.positions)):
+            raise ValueError("Waypoint times and positions must be finite.")
+        if np.any(self.positions < registers.POSITION_MIN) or np.any(self.positions > registers.POSITION_MAX):
+            raise ValueError(f"positions must be in range [{registers.POSITION_MIN}, {registers.POSITION_MAX}].")
+
+        slopes = np.diff(self.positions, axis=0) / np.diff(self.times)[:, None]
+        self._tangents = np.zeros_like(self.positions)
+        self._tangents[1:-1] = (slopes[:-1] + slopes[1:]) / 2.0
+
+    @property
+    def duration(self) -> float:
+        """Time from the first to the last waypoint, in seconds."""
+        return float(self.times[-1] - self.times[0])
+
+    def sample(self, t):
+        """Return `(positions, velocities)` at times `t` (seconds, clamped to the waypoints).
+
+        Both arrays have shape `(len(t), len(joints))`; velocities are in ticks per second.
+        """
+        np = _numpy()
+        times = self.times
+        t = np.clip(np.atleast_1d(np.asarray(t, dtype=float)), times[0], times[-1])
+        segment = np.clip(np.searchsorted(times, t, side="right") - 1, 0, len(times) - 2)
+        dt = times[segment + 1] - times[segment]
+        u = (t - times[segment]) / dt
+        p0 = self.positions[segment]
+        p1 = self.positions[segment + 1]
+
+        if self.profile == "cubic":
+            m0 = self._tangents[segment]
+            m1 = self._tangents[segment + 1]
+            u2 = u * u
+            u3 = u2 * u
+            h00 = (2 * u3 - 3 * u2 + 1)[:, None]
+            h10 = ((u3 - 2 * u2 + u) * dt)[:, None]
+            h01 = (-2 * u3 + 3 * u2)[:, None]
+            h11 = ((u3 - u2) * dt)[:, None]
+            positions = h00 * p0 + h10 * m0 + h01 * p1 + h11 * m1
+            d00 = ((6 * u2 - 6 * u) / dt)[:, None]
+            d10 = (3 * u2 - 4 * u + 1)[:, None]
+            d11 = (3 * u2 - 2 * u)[:, None]
+            velocities = d00 * (p0 - p1) + d10 * m0 + d11 * m1
+            return np.clip(positions, registers.POSITION_MIN, registers.POSITION_MAX), velocities
+
+        if self.profile == "trapezoid":
+            a = self.accel_fraction
+            peak = 1.0 / (1.0 - a)
+            s = np.where(
+                u < a,
+                peak * u * u / (2 * a),
+                np.where(u > 1 - a, 1 - peak * (1 - u) ** 2 / (2 * a), peak * (u - a / 2)),
+            )
+            ds = np.where(u < a, peak * u / a, np.where(u > 1 - a, peak * (1 - u) / a, peak))
+        else:
+            s = u
+            ds = np.ones_like(u)
+
+        delta = p1 - p0
+        return p0 + delta * s[:, None], delta * (ds / dt)[:, None]
+
+    def ticks(self, hz: float):
+        """Return `(times, goals, speeds)` for streaming at `hz`.
+
+        Each tick commands the position due one period later and the
+        MOVING_SPEED that covers the distance in one period, so the servo
+        arrives on schedule instead of rushing at full speed. Goals and speeds
+        are integer arrays of shape `(ticks, len(joints))`, clipped to the
+        register ranges (speed 0 means "maximum" on AX-12, so speeds are at least 1).
+        Ticks at or past the last waypoint hold the final goal with
+        `finish_speed`, since a zero distance would command speed 1.
+        """
+        np = _numpy()
+        if hz <= 0:
+            raise ValueError(f"hz must be positive, got {hz}.")
+        period = 1.0 / hz
+        count = int(np.ceil(self.duration * hz)) + 1
+        times = self.times[0] + np.arange(count) * period
+        current, _ = self.sample(times)
+        target, _ = self.sample(times + period)
+        goals = np.rint(target).astype(np.int64)
+        speeds = np.ceil(np.abs(target - current) / (period * registers.TICKS_PER_SPEED_UNIT)).astype(np.int64)
+        np.clip(speeds, max(registers.SPEED_MIN, 1), registers.SPEED_MAX, out=speeds)
+        hold = times >= self.times[-1]
+        if self.finish_speed is not None:
+            speeds[hold] = self.finish_speed
+        else:
+            speeds[hold] = speeds.max(axis=0)
+        return times - self.times[0], goals, speeds
+
+    def play(
+        self,
+        bus,
+        hz: float = 50.0,
+        priority: int = PRIORITY.CONTROL,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> TrajectoryReport:
+        """Stream the trajectory to `bus` as one SYNC_WRITE per tick.
+
+        Ticks follow a fixed grid from the start time. When a tick is more
+        than one period late, the stale ticks in between are skipped (counted
+        in `TrajectoryReport.missed`) and the one due now is sent; the final
+        tick is always sent.
+
+        Args:
+            bus: `DynamixelBus` (or anything with `sync_move` and `priority`).
+            hz: Control rate in ticks per second.
+            priority: Bus priority of the goal writes.
+            clock: Monotonic time source.
+            sleep: Sleep function used between ticks.
+        """
+        offsets, goals, speeds = self.ticks(hz)
+        offsets = offsets.tolist()
+        vectors = [list(zip(self.joints, goal_row, speed_row)) for goal_row, speed_row in zip(goals.tolist(), speeds.tolist())]
+        period = 1.0 / hz
+        last = len(vectors) - 1
+        report = TrajectoryReport()
+
+        start = clock()
+        tick = 0
+        with bus.priority(priority):
+            while tick <= last:
+                now = clock()
+                deadline = start + offsets[tick]
+                if now < deadline:
+                    sleep(deadline - now)
+                elif now - deadline >= period:
+                    due = min(last, int((now - start) / period))
+                    report.missed += due - tick
+                    tick = due
+                    deadline = start + offsets[tick]
+                report.max_lateness = max(report.max_lateness, clock() - deadline)
+                bus.sync_move(vectors[tick])
+                report.ticks += 1
+                tick += 1
+        report.elapsed = clock() - start
+        return report
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Shared fixtures: a simulated bus driven by a manual clock."""
+
+import pytest
+
+from pydynamixel import BusSimulator
+
+
+class FakeClock:
+    """Monotonic clock that only advances when something sleeps."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += max(0.0, seconds)
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def make_sim(clock):
+    """Return a factory for `BusSimulator`s that share the test's fake clock."""
+
+    def make(ids=(1,), **kwargs):
+        return BusSimulator(ids=ids, clock=clock, sleep=clock.sleep, **kwargs)
+
+    return make
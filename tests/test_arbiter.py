@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Bus arbiter ordering, reentrancy and interrupted waiters."""
+
+import threading
+import time
+
+import pytest
+
+from pydynamixel.arbiter import PRIORITY, BusArbiter
+
+
+def wait_for_waiters(arbiter, count):
+    deadline = time.monotonic() + 2.0
+    while len(arbiter._waiting) < count:
+        assert time.monotonic() < deadline, "waiters did not queue"
+        time.sleep(0.001)
+
+
+def test_reentrant_hold():
+    arbiter = BusArbiter()
+    with arbiter.hold():
+        with arbiter.hold():
+            pass
+    with pytest.raises(RuntimeError):
+        arbiter.release()
+
+
+def test_higher_priority_served_first():
+    arbiter = BusArbiter()
+    order = []
+
+    def worker(name, priority):
+        with arbiter.hold(priority):
+            order.append(name)
+
+    arbiter.acquire()
+    threads = []
+    for name, priority in (("telemetry", PRIORITY.TELEMETRY), ("normal", PRIORITY.NORMAL), ("control", PRIORITY.CONTROL)):
+        thread = threading.Thread(target=worker, args=(name, priority))
+        thread.start()
+        threads.append(thread)
+        wait_for_waiters(arbiter, len(threads))
+    arbiter.release()
+    for thread in threads:
+        thread.join(2.0)
+
+    assert order == ["control", "normal", "telemetry"]
+    assert set(arbiter.stats()) == {PRIORITY.CONTROL, PRIORITY.NORMAL, PRIORITY.TELEMETRY}
+
+
+def test_interrupted_waiter_does_not_block_others(monkeypatch):
+    arbiter = BusArbiter()
+    arbiter.acquire()
+    wait = arbiter._condition.wait
+
+    def interrupted_wait(*args):
+        if threading.current_thread().name == "interrupted":
+            raise KeyboardInterrupt
+        return wait(*args)
+
+    monkeypatch.setattr(arbiter._condition, "wait", interrupted_wait)
+
+    def interrupted():
+        with pytest.raises(KeyboardInterrupt):
+            arbiter.acquire(PRIORITY.CONTROL)
+
+    thread = threading.Thread(target=interrupted, name="interrupted")
+    thread.start()
+    thread.join(2.0)
+    assert arbiter._waiting == []
+
+    served = threading.Event()
+    waiter = threading.Thread(target=lambda: (arbiter.acquire(PRIORITY.NORMAL), served.set(), arbiter.release()))
+    waiter.start()
+    wait_for_waiters(arbiter, 1)
+    arbiter.release()
+    waiter.join(2.0)
+    assert served.is_set()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Retries, backoff, stale-frame rejection and post-failure drains."""
+
+import time
+
+import pytest
+
+from pydynamixel import BusMetrics, CircuitBreaker, DynamixelBus, RetryPolicy, dynamixel, packets, registers, timing
+from pydynamixel.exceptions import ServoUnavailableError
+
+TIMEOUT = 0.01
+
+
+def set_position(sim, servo_id, value):
+    table = sim.servos[servo_id].table
+    table[registers.PRESENT_POSITION] = value & 0xFF
+    table[registers.PRESENT_POSITION + 1] = value >> 8
+
+
+def test_absent_servo_costs_one_timeout_per_attempt(make_sim, clock):
+    sim = make_sim(wire_time=True, timeout=TIMEOUT)
+    bus = DynamixelBus(sim, verbose=False, attempts=5)
+
+    start = clock()
+    assert not bus.ping(7)
+    assert sim.packets_received == 5
+    # Retries are not drained, so each attempt waits exactly one timeout.
+    assert clock() - start == pytest.approx(5 * TIMEOUT, abs=1e-3)
+
+
+def test_exchange_after_failure_is_not_delayed(make_sim, clock):
+    sim = make_sim(wire_time=True, timeout=TIMEOUT)
+    bus = DynamixelBus(sim, verbose=False, attempts=2)
+    assert not bus.ping(7)
+
+    wall = time.perf_counter()
+    start = clock()
+    assert bus.read_word(1, registers.PRESENT_POSITION) == 512
+    assert clock() - start < TIMEOUT / 2
+    # Bounded by the drain window, not by a port timeout.
+    assert time.perf_counter() - wall < 0.05 + timing.drain_window(sim.baudrate)
+
+
+def test_retry_accepts_late_reply_to_the_same_request(make_sim):
+    sim = make_sim(wire_time=True, timeout=TIMEOUT, latency=1.5 * TIMEOUT)
+    set_position(sim, 1, 111)
+    metrics = BusMetrics()
+    bus = DynamixelBus(sim, verbose=False, attempts=3, observer=metrics)
+
+    assert bus.read_word(1, registers.PRESENT_POSITION) == 111
+    assert sim.packets_received == 2
+    assert metrics.timeouts == 1
+
+
+def test_late_reply_from_other_servo_is_skipped(make_sim):
+    sim = make_sim((1, 2), wire_time=True, timeout=TIMEOUT, latency=1.5 * TIMEOUT)
+    set_position(sim, 1, 111)
+    set_position(sim, 2, 222)
+    metrics = BusMetrics()
+    bus = DynamixelBus(sim, verbose=False, attempts=1, observer=metrics)
+
+    with pytest.raises(Exception):
+        bus.read_word(1, registers.PRESENT_POSITION)
+    # The late reply to servo 1 arrives first and must not be taken for servo 2's.
+    sim.timeout = 4 * TIMEOUT
+    assert bus.read_word(2, registers.PRESENT_POSITION) == 222
+    assert metrics.stale_frames == 1
+
+
+def test_drain_discards_pending_input(make_sim):
+    sim = make_sim()
+    sim.write(packets.get_ping_packet(1))
+    assert sim.in_waiting > 0
+
+    dynamixel.drain_serial(sim)
+    assert sim.in_waiting == 0
+
+
+def test_retry_policy_backs_off_between_attempts(make_sim, clock):
+    sim = make_sim(timeout=0)
+    policy = RetryPolicy(attempts=4, backoff=0.01, backoff_factor=2.0, max_backoff=0.025, clock=clock, sleep=clock.sleep)
+
+    start = clock()
+    with pytest.raises(Exception):
+        dynamixel.write_and_get_response_multiple(sim, packets.get_ping_packet(7), 7, False, policy)
+    assert clock() - start == pytest.approx(0.01 + 0.02 + 0.025)
+    assert sim.packets_received == 4
+
+
+def test_retry_budget_limits_retries(make_sim, clock):
+    sim = make_sim(timeout=0)
+    policy = RetryPolicy(attempts=3, budget=2, window=1.0, clock=clock, sleep=clock.sleep)
+
+    for _ in range(2):
+        with pytest.raises(Exception):
+            dynamixel.write_and_get_response_multiple(sim, packets.get_ping_packet(7), 7, False, policy)
+    # Two retries in the first exchange spend the budget; the second is not retried.
+    assert sim.packets_received == 3 + 1
+
+
+def test_circuit_breaker_fails_fast_and_half_opens(make_sim, clock):
+    sim = make_sim(timeout=0)
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.5, clock=clock)
+    policy = RetryPolicy(attempts=1, breaker=breaker, clock=clock, sleep=clock.sleep)
+    ping = packets.get_ping_packet(7)
+
+    for _ in range(2):
+        with pytest.raises(Exception):
+            dynamixel.write_and_get_response_multiple(sim, ping, 7, False, policy)
+    assert breaker.is_open(7)
+    sent = sim.packets_received
+    with pytest.raises(ServoUnavailableError):
+        dynamixel.write_and_get_response_multiple(sim, ping, 7, False, policy)
+    assert sim.packets_received == sent
+
+    sim.add_servo(7)
+    clock.sleep(0.5)
+    dynamixel.write_and_get_response_multiple(sim, ping, 7, False, policy)
+    assert not breaker.is_open(7)
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Packet builders and the in-place template encoders agree byte for byte."""
+
+import pytest
+
+from pydynamixel import packets, registers
+
+IDS = (1, 4, 7)
+VECTOR = [(1, 0, 1023), (4, 512, 100), (7, 1023, 0)]
+
+
+def test_checksum():
+    # Ping servo 1: FF FF 01 02 01 FB.
+    assert packets.get_ping_packet(1) == bytes([0xFF, 0xFF, 0x01, 0x02, 0x01, 0xFB])
+
+
+@pytest.mark.parametrize("value", [0, 1, 0xFF])
+def test_write_template_byte(value):
+    template = packets.get_write_template(3, registers.INSTRUCTION.WRITE_DATA, registers.LED, 1)
+    expected = packets.instruction_packet(3, registers.INSTRUCTION.WRITE_DATA, [registers.LED, value])
+    assert bytes(template.encode(value)) == expected
+
+
+@pytest.mark.parametrize("value", [0, 0x1FF, 0xFFFF])
+def test_write_template_word(value):
+    template = packets.get_write_template(3, registers.INSTRUCTION.REG_WRITE, registers.GOAL_POSITION, 2)
+    params = [registers.GOAL_POSITION, value & 0xFF, value >> 8]
+    assert bytes(template.encode(value)) == packets.instruction_packet(3, registers.INSTRUCTION.REG_WRITE, params)
+
+
+def test_sync_template_encoders_match_packet_builder():
+    expected = packets.get_sync_move_packet(VECTOR)
+    template = packets.get_sync_write_template(registers.GOAL_POSITION, 4, IDS)
+
+    assert bytes(template.encode_words([row[1:] for row in VECTOR])) == expected
+    data = [[p & 0xFF, p >> 8, s & 0xFF, s >> 8] for _, p, s in VECTOR]
+    assert bytes(template.encode(data)) == expected
+    assert bytes(template.encode_rows(bytes(b for row in data for b in row))) == expected
+
+
+def test_sync_template_is_reused_and_repatched():
+    template = packets.get_sync_write_template(registers.GOAL_POSITION, 4, IDS)
+    assert packets.get_sync_write_template(registers.GOAL_POSITION, 4, list(IDS)) is template
+
+    template.encode_words([(5, 5)] * len(IDS))
+    moved = [(servo_id, 600, 50) for servo_id in IDS]
+    assert bytes(template.encode_words([row[1:] for row in moved])) == packets.get_sync_move_packet(moved)
+
+
+@pytest.mark.parametrize(
+    "call",
+    [
+        lambda t: t.encode([[0, 0, 0, 0]] * 2),
+        lambda t: t.encode([[0, 0, 0]] * 3),
+        lambda t: t.encode_words([(0, 0)] * 2),
+        lambda t: t.encode_words([(0,), (0, 0), (0, 0)]),
+        lambda t: t.encode_words([(0, 0, 0), (0, 0), (0, 0)]),
+        lambda t: t.encode_rows(bytes(11)),
+    ],
+)
+def test_sync_template_rejects_wrong_shapes(call):
+    template = packets.get_sync_write_template(registers.GOAL_POSITION, 4, IDS)
+    with pytest.raises(ValueError):
+        call(template)
+
+
+def test_sync_template_cache_is_bounded():
+    first = packets.get_sync_write_template(registers.GOAL_POSITION, 4, IDS)
+    for servo_id in range(2 * packets.SYNC_TEMPLATE_CACHE_SIZE):
+        packets.get_sync_write_template(registers.GOAL_POSITION, 4, (servo_id,))
+        # Keep one key hot; it must survive the churn.
+        assert packets.get_sync_write_template(registers.GOAL_POSITION, 4, IDS) is first
+    assert len(packets._templates.sync) == packets.SYNC_TEMPLATE_CACHE_SIZE
+
+
+def test_array_encoder_matches_packet_builder():
+    np = pytest.importorskip("numpy")
+    from pydynamixel import arrays
+
+    template = packets.get_sync_write_template(registers.GOAL_POSITION, 4, IDS)
+    positions = np.array([row[1] for row in VECTOR], dtype=float)
+    speeds = np.array([row[2] for row in VECTOR])
+    assert bytes(arrays.encode_sync_move(template, positions, speeds)) == packets.get_sync_move_packet(VECTOR)
+
+    with pytest.raises(ValueError):
+        arrays.encode_sync_move(template, positions + [0, 0, 1], speeds)
+    with pytest.raises(ValueError):
+        arrays.encode_sync_move(template, np.array([0.0, np.nan, 0.0]), speeds)
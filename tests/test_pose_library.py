@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Pose library files: round trip, validation and playback."""
+
+import struct
+
+import pytest
+
+from pydynamixel import DynamixelBus, PoseLibrary, ServoChain, registers
+from pydynamixel.pose_library import HEADER
+
+POSES = {"stand": [(1, 512, 100), (2, 512, 100)], "crouch": [(1, 300, 200), (2, 700, 50)]}
+
+
+def test_round_trip(tmp_path):
+    with PoseLibrary.create(tmp_path / "poses.bin", [1, 2], POSES) as library:
+        assert library.names == ["stand", "crouch"]
+        assert library.joints == (1, 2)
+        assert list(library["crouch"]) == POSES["crouch"]
+        assert library[-1].name == "crouch"
+        assert "stand" in library and "sit" not in library
+
+
+def test_create_rejects_bad_poses(tmp_path):
+    with pytest.raises(ValueError):
+        PoseLibrary.create(tmp_path / "a.bin", [1, 2], {"x": [(1, 512, 100)]})
+    with pytest.raises(ValueError):
+        PoseLibrary.create(tmp_path / "b.bin", [1, 2], {"x": [(1, 2000, 100), (2, 512, 100)]})
+    with pytest.raises(ValueError):
+        PoseLibrary.create(tmp_path / "c.bin", [1, 2], [("x", POSES["stand"]), ("x", POSES["stand"])])
+
+
+def test_invalid_file_is_unmapped(tmp_path, monkeypatch):
+    path = tmp_path / "poses.bin"
+    PoseLibrary.create(path, [1, 2], POSES).close()
+    data = bytearray(path.read_bytes())
+    struct.pack_into("<H", data, len(data) - 4, registers.POSITION_MAX + 1)
+    path.write_bytes(bytes(data))
+
+    opened = []
+    init = PoseLibrary.__init__
+
+    def spy(self, *args, **kwargs):
+        opened.append(self)
+        init(self, *args, **kwargs)
+
+    monkeypatch.setattr(PoseLibrary, "__init__", spy)
+    with pytest.raises(ValueError):
+        PoseLibrary(path)
+    assert opened[0]._map is None
+
+
+def test_truncated_file_is_rejected(tmp_path):
+    path = tmp_path / "poses.bin"
+    PoseLibrary.create(path, [1, 2], POSES).close()
+    path.write_bytes(path.read_bytes()[:HEADER.size + 4])
+    with pytest.raises(ValueError):
+        PoseLibrary(path)
+
+
+def test_pose_playback_moves_joints(tmp_path, make_sim):
+    sim = make_sim((1, 2))
+    chain = ServoChain(DynamixelBus(sim, verbose=False))
+    with PoseLibrary.create(tmp_path / "poses.bin", [1, 2], POSES) as library:
+        chain.move_to_vector(library["crouch"])
+    for servo_id, position, speed in POSES["crouch"]:
+        assert sim.servos[servo_id].get(registers.GOAL_POSITION) == position
+        assert sim.servos[servo_id].get(registers.MOVING_SPEED) == speed
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Trajectory sampling, tick generation and playback against the simulator."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from pydynamixel import DynamixelBus, Trajectory, registers  # noqa: E402
+
+JOINTS = [1, 2]
+TIMES = [0.0, 0.5, 1.0]
+POSITIONS = [[512, 512], [700, 300], [800, 200]]
+
+
+@pytest.mark.parametrize("profile", ["linear", "cubic", "trapezoid"])
+def test_sample_hits_waypoints(profile):
+    trajectory = Trajectory(JOINTS, TIMES, POSITIONS, profile=profile)
+    positions, _ = trajectory.sample(TIMES)
+    np.testing.assert_allclose(positions, POSITIONS)
+
+
+@pytest.mark.parametrize("profile", ["linear", "cubic", "trapezoid"])
+def test_final_tick_keeps_a_usable_speed(profile):
+    trajectory = Trajectory(JOINTS, TIMES, POSITIONS, profile=profile)
+    _, goals, speeds = trajectory.ticks(50)
+    assert goals[-1].tolist() == POSITIONS[-1]
+    assert speeds[-1].tolist() == speeds.max(axis=0).tolist()
+    assert speeds[-1].min() > 1
+
+
+def test_finish_speed_overrides_final_tick():
+    trajectory = Trajectory(JOINTS, TIMES, POSITIONS, finish_speed=300)
+    _, _, speeds = trajectory.ticks(50)
+    assert speeds[-1].tolist() == [300, 300]
+    assert speeds[0].tolist() != [300, 300]
+
+
+@pytest.mark.parametrize("bad", [float("nan"), float("inf"), -float("inf")])
+def test_rejects_non_finite_waypoints(bad):
+    with pytest.raises(ValueError):
+        Trajectory(JOINTS, TIMES, [[512, 512], [bad, 300], [800, 200]])
+    with pytest.raises(ValueError):
+        Trajectory(JOINTS, [0.0, bad, 1.0], POSITIONS)
+
+
+@pytest.mark.parametrize("profile", ["linear", "cubic", "trapezoid"])
+def test_play_reaches_final_goal(make_sim, clock, profile):
+    sim = make_sim(())
+    # Start away from the first waypoint so the joints trail the path.
+    sim.add_servo(1, position=100)
+    sim.add_servo(2, position=1000)
+    bus = DynamixelBus(sim, verbose=False)
+    trajectory = Trajectory(JOINTS, TIMES, POSITIONS, profile=profile)
+
+    report = trajectory.play(bus, hz=50, clock=clock, sleep=clock.sleep)
+    clock.sleep(3.0)
+
+    assert report.missed == 0
+    assert [bus.get_position(joint) for joint in JOINTS] == POSITIONS[-1]
+    assert all(bus.read_word(joint, registers.MOVING_SPEED) > 1 for joint in JOINTS)